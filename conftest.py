@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import mood_index
+import mood_mmap
+import mood_storage
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+# Folder kerja kosong dan state proses yang bersih (cache, index, pembaca
+# mmap, koneksi SQLite) untuk setiap test. storage(mode) memilih mode
+# penyimpanan; file data berada di tmp_path karena path-nya relatif.
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(mood_storage, 'SHARD_ROOT', 'data')
+    monkeypatch.setattr(mood_storage, 'SHARD_USER', 'default')
+
+    def use(mode):
+        monkeypatch.setattr(mood_storage, 'STORAGE_MODE', mode)
+        return mode
+
+    _reset()
+    use('journal')
+    yield use
+    _reset()
+
+def _reset():
+    for path in list(mood_storage._sqlite_conns):
+        mood_storage.close_sqlite(path)
+    for reader in mood_mmap._readers.values():
+        reader.close()
+    mood_mmap._readers.clear()
+    mood_index._indexes.clear()
+    mood_storage.clear_cache()
+
+
+# Menjalankan `code` di proses Python lain (folder kerja dan mode sama),
+# seperti GUI kedua atau mood_api.py yang menulis ke data yang sama
+@pytest.fixture
+def other_process(tmp_path):
+    def run(code):
+        env = dict(os.environ, MOODTRACKER_STORAGE=mood_storage.STORAGE_MODE,
+                   MOODTRACKER_DATA_DIR='data', MOODTRACKER_USER='default',
+                   PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get('PYTHONPATH')])))
+        subprocess.run([sys.executable, '-c', 'import mood_storage\n' + code],
+                       cwd=tmp_path, env=env, check=True)
+    return run
@@ -0,0 +1,117 @@
+import numpy as np  # Perlu instalasi: pip install numpy
+
+from mood_compact import MOOD_TABLE, MoodColumns
+from mood_storage import date_key, load_history, to_date_str
+
+
+# Riwayat dalam bentuk array NumPy: ordinal tanggal (urut naik) dan kode mood.
+# Kode mood merujuk ke MOOD_TABLE dari mood_compact.
+class MoodArrays:
+    def __init__(self, ordinals, codes):
+        self.ordinals = np.asarray(ordinals, dtype=np.int64)
+        self.codes = np.asarray(codes, dtype=np.intp)
+
+    @classmethod
+    def from_columns(cls, columns):
+        return cls(np.frombuffer(columns.ordinals, dtype=np.dtype(columns.ordinals.typecode)),
+                   np.frombuffer(columns.moods, dtype=np.uint8))
+
+    # Membaca seluruh riwayat dari penyimpanan
+    @classmethod
+    def load(cls):
+        return cls.from_columns(MoodColumns.from_entries(load_history()))
+
+    @property
+    def n_moods(self):
+        return len(MOOD_TABLE)
+
+    def __len__(self):
+        return len(self.ordinals)
+
+
+# Mengubah date / 'YYYY-MM-DD' / ordinal menjadi ordinal (None tetap None)
+def _ordinal(value):
+    if value is None or isinstance(value, (int, np.integer)):
+        return value
+    return date_key(to_date_str(value))
+
+
+# Jumlah per kode mood untuk start <= tanggal <= end (satu bincount)
+def counts(arrays, start=None, end=None):
+    lo = 0 if start is None else np.searchsorted(arrays.ordinals, _ordinal(start), 'left')
+    hi = len(arrays) if end is None else np.searchsorted(arrays.ordinals, _ordinal(end), 'right')
+    return np.bincount(arrays.codes[lo:hi], minlength=arrays.n_moods)
+
+# Persentase dari vektor (atau matriks per baris) jumlah mood; 0 jika kosong
+def percentages(count_array):
+    count_array = np.asarray(count_array, dtype=np.float64)
+    totals = count_array.sum(axis=-1, keepdims=True)
+    return np.divide(count_array * 100, totals, out=np.zeros_like(count_array), where=totals > 0)
+
+# Mood terbanyak dari vektor jumlah ("" jika tidak ada data)
+def most_common(count_array):
+    if count_array.sum() == 0:
+        return ""
+    return MOOD_TABLE[int(np.argmax(count_array))]
+
+# Ringkasan untuk rentang tanggal, format sama dengan mood_index.mood_summary
+def summary(arrays, mood_options, start=None, end=None):
+    tally = counts(arrays, start, end)
+    mood_count = {m: int(tally[MOOD_TABLE.index(m)]) if m in MOOD_TABLE else 0 for m in mood_options}
+    total = sum(mood_count.values())
+    sorted_mood = sorted(mood_count.items(), key=lambda x: x[1], reverse=True)
+    return {
+        "counts": mood_count,
+        "total": total,
+        "sorted": sorted_mood,
+        "percent": {m: (c / total * 100) if total > 0 else 0 for m, c in mood_count.items()},
+        "most_common": sorted_mood[0][0] if sorted_mood else "",
+    }
+
+
+# Matriks jumlah harian: baris = hari kalender dari first..last, kolom = kode mood
+def daily_counts(arrays, first=None, last=None):
+    if len(arrays) == 0:
+        return 0, np.zeros((0, arrays.n_moods), dtype=np.int64)
+    first = int(arrays.ordinals[0]) if first is None else _ordinal(first)
+    last = int(arrays.ordinals[-1]) if last is None else _ordinal(last)
+    n_days = last - first + 1
+    lo = np.searchsorted(arrays.ordinals, first, 'left')
+    hi = np.searchsorted(arrays.ordinals, last, 'right')
+    day_idx = arrays.ordinals[lo:hi] - first
+    flat = np.bincount(day_idx * arrays.n_moods + arrays.codes[lo:hi],
+                       minlength=n_days * arrays.n_moods)
+    return first, flat.reshape(n_days, arrays.n_moods)
+
+# Jumlah mood bergulir `window` hari untuk setiap hari (jendela berakhir di
+# hari itu), dihitung dari selisih jumlah kumulatif.
+def rolling_counts(daily, window):
+    cumulative = np.cumsum(daily, axis=0)
+    rolled = cumulative.copy()
+    rolled[window:] -= cumulative[:-window]
+    return rolled
+
+# Laporan tren multi-tahun dalam satu kali jalan: untuk setiap hari, jumlah
+# dan persentase mood dalam jendela 7 dan 30 hari serta mood dominannya.
+def trend_report(arrays, windows=(7, 30), first=None, last=None):
+    first, daily = daily_counts(arrays, first, last)
+    report = {
+        "first_ordinal": first,
+        "moods": list(MOOD_TABLE),
+        "daily": daily,
+        "windows": {},
+    }
+    for window in windows:
+        rolled = rolling_counts(daily, window)
+        if rolled.size:
+            dominant = np.where(rolled.sum(axis=1) > 0, rolled.argmax(axis=1), -1)
+        else:
+            # Riwayat kosong (tanpa hari atau tanpa mood): argmax tidak bisa
+            # dipakai, laporannya berisi array kosong
+            dominant = np.full(len(rolled), -1, dtype=np.intp)
+        report["windows"][window] = {
+            "counts": rolled,
+            "percent": percentages(rolled),
+            "dominant": dominant,
+        }
+    return report
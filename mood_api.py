@@ -0,0 +1,246 @@
+import argparse
+import asyncio
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from urllib.parse import parse_qs, urlsplit
+
+from mood_import import KNOWN_MOODS, validate_entry
+from mood_index import EntryRange, mood_counts, search_stories, search_words, window_start
+from mood_metrics import observe
+from mood_storage import append_entry
+
+# Layanan HTTP/JSON lokal supaya alat lain di mesin yang sama bisa menambah
+# entri dan membaca statistik tanpa GUI Tk. Memakai fungsi penyimpanan yang
+# sama dengan front-end (append_entry, EntryRange, mood_counts, search_stories).
+#   python mood_api.py --port 8765
+#   curl -X POST localhost:8765/entries -d '{"story": "Lancar", "mood": "😄"}'
+#   curl 'localhost:8765/entries?days=7'
+#   curl 'localhost:8765/stats?from=2025-06-01&to=2025-06-30'
+#   curl 'localhost:8765/search?q=kerja'
+#   curl 'localhost:8765/search?q=kerj+kera&words=1'
+
+HOST = '127.0.0.1'        # hanya loopback: layanan lokal, tanpa autentikasi
+PORT = 8765
+KEEPALIVE_TIMEOUT = 15    # detik koneksi idle dibiarkan terbuka
+MAX_BODY = 1024 * 1024    # ukuran body POST maksimum
+PAGE_LIMIT = 1000         # entri maksimum per respons /entries dan /search
+
+REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+# Kesalahan yang dikirim ke klien sebagai {"error": message} dengan status HTTP
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# Nilai query ?name=... (yang terakhir jika diulang) atau default
+def _param(query, name, default=None):
+    values = query.get(name)
+    return values[-1] if values else default
+
+def _int_param(query, name, default, minimum=0, maximum=None):
+    try:
+        value = int(_param(query, name, default))
+    except ValueError:
+        raise HttpError(400, f"'{name}' harus berupa angka")
+    if value < minimum:
+        raise HttpError(400, f"'{name}' minimal {minimum}")
+    return min(value, maximum) if maximum is not None else value
+
+# Rentang tanggal dari ?from=&to= atau ?days= (seperti moodtracker.py)
+def _date_range(query):
+    try:
+        if _param(query, 'days') is not None:
+            start = window_start(_int_param(query, 'days', 0))
+        else:
+            start = _param(query, 'from')
+            start = date.fromisoformat(start) if start else None
+        end = _param(query, 'to')
+        return start, date.fromisoformat(end) if end else None
+    except ValueError:
+        raise HttpError(400, "tanggal harus berformat YYYY-MM-DD")
+
+
+# ---------- Endpoint (dijalankan di thread pool, boleh memblokir) ----------
+
+# POST /entries  body: {"date": "YYYY-MM-DD" (opsional), "story": ..., "mood": ...}
+def add_entry(query, body, allowed_moods):
+    try:
+        data = json.loads(body or b'{}')
+    except ValueError:
+        raise HttpError(400, "body harus berupa JSON")
+    if not isinstance(data, dict):
+        raise HttpError(400, "body harus berupa objek JSON")
+    entry = {"date": data.get('date') or date.today().isoformat(),
+             "story": data.get('story'), "mood": data.get('mood')}
+    error = validate_entry(entry, allowed_moods)
+    if error:
+        raise HttpError(400, error)
+    return 201, {"entry": append_entry(entry['date'], entry['story'], entry['mood'])}
+
+# GET /entries?from=&to=&days=&offset=&limit=  entri urut tanggal, per halaman
+def list_entries(query, body, allowed_moods):
+    entries = EntryRange(*_date_range(query))
+    offset = _int_param(query, 'offset', 0)
+    limit = _int_param(query, 'limit', 100, maximum=PAGE_LIMIT)
+    return 200, {"total": len(entries), "offset": offset, "entries": entries.rows(offset, offset + limit)}
+
+# GET /stats?from=&to=&days=  jumlah per mood (dari rekap, tanpa membaca entri)
+def stats(query, body, allowed_moods):
+    start, end = _date_range(query)
+    counts = mood_counts(start, end)
+    sorted_mood = sorted(counts.items(), key=lambda x: x[1], reverse=True)
+    return 200, {
+        "from": start.isoformat() if start else None,
+        "to": end.isoformat() if end else None,
+        "total": sum(counts.values()),
+        "counts": dict(sorted_mood),
+        "most_common": sorted_mood[0][0] if sorted_mood else "",
+    }
+
+# GET /search?q=&limit=&words=  cerita yang mengandung q (tidak peka huruf
+# besar/kecil); words=1: per kata lewat index kata (semua kata, boleh awalan)
+def search(query, body, allowed_moods):
+    keyword = _param(query, 'q', '')
+    if not keyword:
+        raise HttpError(400, "parameter 'q' wajib diisi")
+    result = search_words(keyword) if _param(query, 'words', '0') == '1' else search_stories(keyword)
+    limit = _int_param(query, 'limit', 100, maximum=PAGE_LIMIT)
+    return 200, {"total": len(result), "entries": result[:limit]}
+
+ROUTES = {
+    '/entries': {'GET': list_entries, 'POST': add_entry},
+    '/stats': {'GET': stats},
+    '/search': {'GET': search},
+}
+
+
+# ---------- HTTP/1.1 ----------
+
+# Membaca satu request; None jika klien menutup koneksi
+async def read_request(reader):
+    line = await reader.readline()
+    if not line.strip():
+        return None
+    try:
+        method, target, version = line.decode('latin-1').split()
+    except ValueError:
+        raise HttpError(400, "request line tidak valid")
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get('content-length', 0))
+    except ValueError:
+        raise HttpError(400, "Content-Length tidak valid")
+    if length < 0:
+        raise HttpError(400, "Content-Length tidak valid")
+    if length > MAX_BODY:
+        raise HttpError(413, "body terlalu besar")
+    body = await reader.readexactly(length) if length else b''
+    return method, target, version, headers, body
+
+def encode_response(status, payload, keep_alive):
+    body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    head = [
+        f"HTTP/1.1 {status} {REASONS.get(status, '')}",
+        "Content-Type: application/json; charset=utf-8",
+        f"Content-Length: {len(body)}",
+    ]
+    if keep_alive:
+        head += ["Connection: keep-alive", f"Keep-Alive: timeout={KEEPALIVE_TIMEOUT}"]
+    else:
+        head.append("Connection: close")
+    return ("\r\n".join(head) + "\r\n\r\n").encode('latin-1') + body
+
+
+class MoodApi:
+    def __init__(self, workers=4, allowed_moods=KNOWN_MOODS):
+        # Fungsi penyimpanan memblokir (disk/SQLite), jadi dijalankan di
+        # thread pool; mood_storage.lock menjaga cache dan index bersama
+        self.executor = ThreadPoolExecutor(workers, thread_name_prefix='mood-api')
+        self.allowed_moods = allowed_moods
+
+    # Mencari fungsi endpoint untuk request; hasilnya (fungsi, query)
+    def route(self, method, target):
+        url = urlsplit(target)
+        methods = ROUTES.get(url.path.rstrip('/') or '/')
+        if methods is None:
+            raise HttpError(404, f"endpoint {url.path} tidak ada")
+        func = methods.get(method)
+        if func is None:
+            raise HttpError(405, f"gunakan {', '.join(methods)} untuk {url.path}")
+        return func, parse_qs(url.query)
+
+    # Satu koneksi: request dilayani berurutan selama keep-alive; koneksi lain
+    # berjalan bersamaan di event loop yang sama
+    async def handle(self, reader, writer):
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(read_request(reader), KEEPALIVE_TIMEOUT)
+                except HttpError as e:
+                    writer.write(encode_response(e.status, {"error": str(e)}, False))
+                    break
+                if request is None:
+                    break
+                method, target, version, headers, body = request
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection != 'close' and (version == 'HTTP/1.1' or connection == 'keep-alive')
+                start = time.perf_counter()
+                try:
+                    func, query = self.route(method, target)
+                    status, payload = await loop.run_in_executor(
+                        self.executor, func, query, body, self.allowed_moods)
+                    observe(f"api_{func.__name__}", time.perf_counter() - start)
+                except HttpError as e:
+                    status, payload = e.status, {"error": str(e)}
+                except Exception as e:
+                    print(f"Kesalahan {method} {target}: {e!r}", file=sys.stderr)
+                    status, payload = 500, {"error": "kesalahan internal"}
+                writer.write(encode_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host=HOST, port=PORT, ready=None):
+        server = await asyncio.start_server(self.handle, host, port)
+        host, port = server.sockets[0].getsockname()[:2]
+        print(f"Mood API di http://{host}:{port}", flush=True)
+        if ready is not None:
+            ready(host, port)
+        async with server:
+            await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API HTTP/JSON lokal Mood Tracker")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT, help="0 = pilih port bebas")
+    parser.add_argument("--workers", type=int, default=4, help="thread untuk fungsi penyimpanan")
+    parser.add_argument("--any-mood", action="store_true", help="terima mood di luar daftar emoji")
+    args = parser.parse_args()
+    api = MoodApi(args.workers, None if args.any_mood else KNOWN_MOODS)
+    try:
+        asyncio.run(api.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
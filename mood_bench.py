@@ -0,0 +1,280 @@
+import argparse
+import json
+import os
+import random
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+
+import mood_index
+import mood_mmap
+import mood_storage
+from mood_compact import MoodColumns, MoodEntry
+from mood_linkedlist import MoodLinkedList
+
+MOODS = ["😄", "😩", "😐", "😢", "😡"]
+
+
+# Membuat riwayat acak dengan tanggal teracak (seed tetap supaya bisa diulang)
+def make_history(n, seed=0):
+    rng = random.Random(seed)
+    start = date(2000, 1, 1)
+    return [
+        {
+            "date": (start + timedelta(days=rng.randrange(20000))).strftime("%Y-%m-%d"),
+            "story": f"cerita {i}",
+            "mood": rng.choice(MOODS),
+        }
+        for i in range(n)
+    ]
+
+
+# Bubble sort lama (sebelum diganti) untuk pembanding
+def bubble_sort_by_date(data_list):
+    n = len(data_list)
+    for i in range(n):
+        for j in range(0, n-i-1):
+            d1 = datetime.strptime(data_list[j]['date'], "%Y-%m-%d")
+            d2 = datetime.strptime(data_list[j+1]['date'], "%Y-%m-%d")
+            if d1 > d2:
+                data_list[j], data_list[j+1] = data_list[j+1], data_list[j]
+    return data_list
+
+
+# Mengukur waktu eksekusi satu fungsi (detik)
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+# Benchmark sort_by_date: versi baru vs bubble sort lama.
+# Bubble sort hanya dijalankan sampai bubble_limit entri; di atas itu
+# waktunya diestimasi secara kuadratik dari ukuran terbesar yang diukur.
+def bench_sort(sizes, bubble_limit):
+    print(f"{'entri':>8} {'sort baru':>12} {'bubble sort':>16}")
+    base_n = base_t = None
+    for n in sizes:
+        data = make_history(n)
+        # Parse tanggal terjadi saat node dibuat, jadi ikut diukur
+        new_t = timed(lambda: MoodLinkedList.from_iterable(data).sort_by_date())
+        if n <= bubble_limit:
+            old_t = timed(bubble_sort_by_date, list(data))
+            base_n, base_t = n, old_t
+            old_txt = f"{old_t:10.3f} s"
+        elif base_n:
+            old_txt = f"~{base_t * (n / base_n) ** 2:9.0f} s (estimasi)"
+        else:
+            old_txt = "-"
+        print(f"{n:>8} {new_t:10.3f} s {old_txt:>16}")
+
+
+# Node lama (dengan __dict__) untuk pembanding memori
+class LegacyNode:
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+
+
+def _legacy_list(entries):
+    head = tail = None
+    for entry in entries:
+        node = LegacyNode(entry)
+        if head is None:
+            head = node
+        else:
+            tail.next = node
+        tail = node
+    return head
+
+
+# Memori (byte per entri, termasuk teks cerita) untuk tiap representasi.
+# Data dibuat lewat json.loads supaya string tanggal/mood tidak berbagi objek,
+# sama seperti saat membaca journal.
+def bench_memory(n):
+    raw = json.dumps(make_history(n))
+    builders = [
+        ("dict + Node lama", lambda: _legacy_list(json.loads(raw))),
+        ("dict + Node __slots__", lambda: MoodLinkedList.from_iterable(json.loads(raw))),
+        ("MoodEntry + Node __slots__", lambda: MoodLinkedList.from_iterable(
+            [MoodEntry.from_dict(e) for e in json.loads(raw)])),
+        ("MoodColumns", lambda: MoodColumns.from_entries(json.loads(raw))),
+    ]
+    print(f"{'representasi':<28} {'byte/entri':>12}")
+    for name, build in builders:
+        tracemalloc.start()
+        result = build()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del result
+        print(f"{name:<28} {current / n:12.1f}")
+
+
+# Mengukur satu operasi: waktu (detik) dan puncak memori (byte). Diukur di
+# dua jalan terpisah supaya overhead tracemalloc tidak ikut ke waktu.
+# setup() (jika ada) dipanggil sebelum tiap jalan dan tidak ikut diukur.
+def measure(func, setup=None):
+    if setup:
+        setup()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    if setup:
+        setup()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+# Tanggal entri sebagai date (untuk menghitung rentang periode)
+def entry_day(entry):
+    return date.fromordinal(mood_storage.date_key(entry['date']))
+
+# Daftar kasus (operasi, varian, setup, func) untuk riwayat berisi `data`
+# yang sudah disimpan di penyimpanan aktif
+def suite_cases(data):
+    import mood_tracker
+    import moodtracker1
+
+    history = mood_storage.load_history()
+    keyword = "cerita 12"
+    end = max(entry_day(e) for e in data)
+    start = end - timedelta(days=30)
+    state = {}
+
+    def unsorted_list():
+        state['list'] = MoodLinkedList.from_iterable(data)
+
+    def sorted_list():
+        state['list'] = moodtracker1.load_data()
+
+    def legacy_stats():
+        # Blok statistik lama: filter periode lalu hitung per mood
+        mood_count = {m: 0 for m in MOODS}
+        for entry in mood_storage.scan_between(start, end):
+            if entry['mood'] in mood_count:
+                mood_count[entry['mood']] += 1
+        return sorted(mood_count.items(), key=lambda x: x[1], reverse=True)
+
+    return [
+        ("load_data", "mood_tracker (list, dingin)", mood_storage.clear_cache, mood_tracker.load_data),
+        ("load_data", "moodtracker1 (linked list, dingin)", mood_storage.clear_cache, moodtracker1.load_data),
+        ("load_data", "moodtracker1 (cache hangat)", None, moodtracker1.load_data),
+        ("sort_by_date", "MoodLinkedList (acak)", unsorted_list, lambda: state['list'].sort_by_date()),
+        ("sort_by_date", "MoodLinkedList (sudah urut)", sorted_list, lambda: state['list'].sort_by_date()),
+        ("sort_by_date", "mood_tracker (sorted)", None, lambda: mood_tracker.sort_by_date(data)),
+        ("search_by_keyword", "MoodLinkedList (pindai)", sorted_list,
+         lambda: state['list'].search_by_keyword(keyword)),
+        ("search_by_keyword", "mood_tracker (pindai)", None,
+         lambda: mood_tracker.search_by_keyword(history, keyword)),
+        ("search_by_keyword", "search_stories (bangun index)", mood_index._on_rewrite,
+         lambda: mood_index.search_stories(keyword)),
+        ("search_by_keyword", "search_stories (index hangat)", lambda: mood_index.search_stories(keyword),
+         lambda: mood_index.search_stories(keyword)),
+        ("filter periode", "scan_between (pindai)", None, lambda: mood_storage.scan_between(start, end)),
+        ("filter periode", "entries_between (index)", lambda: mood_index.entries_between(start, end),
+         lambda: mood_index.entries_between(start, end)),
+        ("filter periode", "EntryRange (id saja)", lambda: mood_index.EntryRange(start, end),
+         lambda: mood_index.EntryRange(start, end)),
+        ("statistik", "pindai + hitung (lama)", None, legacy_stats),
+        ("statistik", "mood_summary (rekap)", lambda: mood_index.mood_summary(MOODS, start, end),
+         lambda: mood_index.mood_summary(MOODS, start, end)),
+    ]
+
+# Benchmark jalur utama (baca data, sort, cari, filter periode, statistik)
+# untuk tiap ukuran riwayat, di folder sementara dengan mode penyimpanan
+# aktif (MOODTRACKER_STORAGE). Hasil bisa disimpan sebagai JSON untuk
+# dibandingkan antar versi.
+def bench_suite(sizes, json_path=None):
+    results = []
+    workdir = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            print(f"mode penyimpanan: {mood_storage.STORAGE_MODE}")
+            print(f"{'entri':>8} {'operasi':<18} {'varian':<36} {'waktu':>10} {'puncak':>11}")
+            for n in sizes:
+                data = make_history(n)
+                mood_storage.save_entries(data)
+                for operation, variant, setup, func in suite_cases(data):
+                    elapsed, peak = measure(func, setup)
+                    results.append({"n": n, "operation": operation, "variant": variant,
+                                    "seconds": elapsed, "peak_bytes": peak})
+                    print(f"{n:>8} {operation:<18} {variant:<36} {elapsed * 1000:8.1f} ms "
+                          f"{peak / 2**20:7.1f} MiB")
+        finally:
+            # Semua state proses menunjuk ke file di folder sementara (path
+            # relatif): dibuang sebelum kembali ke folder asal, supaya
+            # save_readers/save_word_index saat keluar tidak menulis
+            # data.jsonl.off atau data.idx.json ke folder pemanggil
+            mood_index._on_rewrite()
+            for reader in mood_mmap._readers.values():
+                reader.close()
+            mood_mmap._readers.clear()
+            for path in list(mood_storage._sqlite_conns):
+                mood_storage.close_sqlite(path)
+            mood_storage.clear_cache()
+            os.chdir(workdir)
+    if json_path:
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    return results
+
+
+# Cold start front-end GUI: tiap script dijalankan `repeat` kali sebagai
+# proses baru dengan MOODTRACKER_STARTUP_TIMING=exit (lihat mood_startup).
+# "jendela" = waktu sampai jendela pertama tampil menurut aplikasi,
+# "proses" = total waktu proses termasuk start interpreter. Butuh display.
+def bench_startup(scripts, repeat):
+    env = dict(os.environ, MOODTRACKER_STARTUP_TIMING="exit")
+    print(f"{'script':<18} {'jendela (median)':>18} {'proses (median)':>18}")
+    for script in scripts:
+        window_ms, wall_ms = [], []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            proc = subprocess.run([sys.executable, script], env=env, capture_output=True,
+                                  text=True, timeout=60)
+            wall_ms.append((time.perf_counter() - start) * 1000)
+            match = re.search(r"first window ([\d.]+) ms", proc.stderr)
+            if not match:
+                error = proc.stderr.strip().splitlines()
+                print(f"{script:<18} gagal: {error[-1] if error else proc.returncode}")
+                break
+            window_ms.append(float(match.group(1)))
+        else:
+            print(f"{script:<18} {statistics.median(window_ms):15.1f} ms "
+                  f"{statistics.median(wall_ms):15.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark Mood Tracker")
+    parser.add_argument("--sizes",
+                        help="jumlah entri, dipisah koma (default 1000,10000,100000; "
+                             "--suite: sampai 1000000)")
+    parser.add_argument("--bubble-limit", type=int, default=2000,
+                        help="ukuran maksimum yang benar-benar dijalankan dengan bubble sort")
+    parser.add_argument("--memory", type=int, metavar="N",
+                        help="ukur memori per entri untuk N entri (tanpa benchmark sort)")
+    parser.add_argument("--startup", action="store_true",
+                        help="ukur cold start moodtracker1/2/3 (butuh display)")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="jumlah pengulangan untuk --startup")
+    parser.add_argument("--suite", action="store_true",
+                        help="benchmark load/sort/cari/filter/statistik untuk tiap ukuran --sizes")
+    parser.add_argument("--json", metavar="PATH", help="simpan hasil --suite sebagai JSON")
+    args = parser.parse_args()
+    if args.suite:
+        bench_suite([int(n) for n in (args.sizes or "1000,10000,100000,1000000").split(",")], args.json)
+    elif args.startup:
+        bench_startup(["moodtracker1.py", "moodtracker2.py", "moodtracker3.py"], args.repeat)
+    elif args.memory:
+        bench_memory(args.memory)
+    else:
+        bench_sort([int(n) for n in (args.sizes or "1000,10000,100000").split(",")], args.bubble_limit)
@@ -0,0 +1,125 @@
+import bisect
+from array import array
+from datetime import date
+
+from mood_storage import date_key
+
+
+# Tabel mood bersama: setiap emoji disimpan sekali dan diberi kode kecil
+_mood_codes = {}
+MOOD_TABLE = []
+
+# Kode (0..255) untuk sebuah mood; mood baru otomatis didaftarkan
+def mood_code(mood):
+    code = _mood_codes.get(mood)
+    if code is None:
+        code = len(MOOD_TABLE)
+        if code > 255:
+            raise ValueError("Terlalu banyak jenis mood (maksimal 256)")
+        _mood_codes[mood] = code
+        MOOD_TABLE.append(mood)
+    return code
+
+
+# Entri ringkas: tanggal sebagai ordinal, mood sebagai string bersama dari
+# MOOD_TABLE, tanpa __dict__. Tetap bisa dibaca seperti dict lama
+# (entry['date'], entry['story'], entry['mood']) sehingga bisa langsung
+# dimasukkan ke MoodLinkedList atau kode statistik yang sudah ada.
+class MoodEntry:
+    __slots__ = ('ordinal', 'story', 'mood')
+
+    def __init__(self, ordinal, story, mood):
+        self.ordinal = ordinal
+        self.story = story
+        self.mood = MOOD_TABLE[mood_code(mood)]
+
+    @classmethod
+    def from_dict(cls, entry):
+        return cls(date_key(entry['date']), entry['story'], entry['mood'])
+
+    @property
+    def date(self):
+        return date.fromordinal(self.ordinal).isoformat()
+
+    def __getitem__(self, key):
+        if key == 'date':
+            return self.date
+        if key == 'story':
+            return self.story
+        if key == 'mood':
+            return self.mood
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self):
+        return {"date": self.date, "story": self.story, "mood": self.mood}
+
+    def __eq__(self, other):
+        if isinstance(other, MoodEntry):
+            return (self.ordinal, self.story, self.mood) == (other.ordinal, other.story, other.mood)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"MoodEntry({self.date!r}, {self.story!r}, {self.mood!r})"
+
+
+# Penyimpanan kolom untuk riwayat yang urut tanggal:
+# ordinal tanggal (array 'l'), kode mood (array 'B'), dan list cerita.
+# Sekitar 9 byte per entri di luar teks cerita itu sendiri.
+class MoodColumns:
+    def __init__(self):
+        self.ordinals = array('l')
+        self.moods = array('B')
+        self.stories = []
+
+    # Membuat kolom dari entri (dict atau MoodEntry) yang sudah urut tanggal
+    @classmethod
+    def from_entries(cls, entries):
+        columns = cls()
+        for entry in entries:
+            columns.append(entry)
+        return columns
+
+    # Menambahkan entri; entri mundur disisipkan supaya kolom tetap urut tanggal
+    def append(self, entry):
+        key = entry.ordinal if isinstance(entry, MoodEntry) else date_key(entry['date'])
+        code = mood_code(entry['mood'])
+        if not self.ordinals or self.ordinals[-1] <= key:
+            self.ordinals.append(key)
+            self.moods.append(code)
+            self.stories.append(entry['story'])
+        else:
+            i = bisect.bisect_right(self.ordinals, key)
+            self.ordinals.insert(i, key)
+            self.moods.insert(i, code)
+            self.stories.insert(i, entry['story'])
+
+    def __len__(self):
+        return len(self.ordinals)
+
+    # Entri ke-i sebagai MoodEntry
+    def __getitem__(self, i):
+        return MoodEntry(self.ordinals[i], self.stories[i], MOOD_TABLE[self.moods[i]])
+
+    def __iter__(self):
+        for i in range(len(self.ordinals)):
+            yield self[i]
+
+    # Posisi [lo, hi) untuk start <= tanggal <= end (ordinal; None = tanpa batas)
+    def range_indices(self, start=None, end=None):
+        lo = 0 if start is None else bisect.bisect_left(self.ordinals, start)
+        hi = len(self.ordinals) if end is None else bisect.bisect_right(self.ordinals, end)
+        return lo, hi
+
+    # Jumlah per mood di rentang tanggal (format sama dengan MoodRollup)
+    def counts_between(self, start=None, end=None):
+        lo, hi = self.range_indices(start, end)
+        tally = [0] * len(MOOD_TABLE)
+        for code in self.moods[lo:hi]:
+            tally[code] += 1
+        return {MOOD_TABLE[code]: n for code, n in enumerate(tally) if n}
@@ -0,0 +1,34 @@
+import csv
+from itertools import islice
+
+from mood_index import EntryRange
+
+CSV_HEADER = ["Tanggal", "Mood", "Cerita"]
+CHUNK_SIZE = 1000
+
+
+# Mengalirkan entri start <= tanggal <= end (None = tanpa batas) urut tanggal,
+# dalam potongan berisi `chunk_size` baris CSV. Hanya satu potongan yang ada
+# di memori pada satu waktu.
+def iter_csv_chunks(start=None, end=None, chunk_size=CHUNK_SIZE):
+    entries = iter(EntryRange(start, end))
+    while True:
+        chunk = [(e['date'], e['mood'], e['story']) for e in islice(entries, chunk_size)]
+        if not chunk:
+            return
+        yield chunk
+
+# Menulis entri ke file CSV (path atau file object yang sudah dibuka dengan
+# newline=''). csv.writer menangani koma, tanda kutip, dan baris baru di
+# dalam cerita. Mengembalikan jumlah entri yang ditulis.
+def export_csv(target, start=None, end=None, chunk_size=CHUNK_SIZE):
+    if isinstance(target, str):
+        with open(target, 'w', newline='', encoding='utf-8') as f:
+            return export_csv(f, start, end, chunk_size)
+    writer = csv.writer(target)
+    writer.writerow(CSV_HEADER)
+    count = 0
+    for chunk in iter_csv_chunks(start, end, chunk_size):
+        writer.writerows(chunk)
+        count += len(chunk)
+    return count
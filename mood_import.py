@@ -0,0 +1,112 @@
+import argparse
+import csv
+import json
+import re
+from datetime import date
+
+from mood_export import CSV_HEADER
+from mood_storage import append_entries
+
+# Mood yang dikenal oleh semua front-end (dua set emoji)
+KNOWN_MOODS = {"😄", "😩", "😐", "😢", "😡", "😌", "🙂", "😍", "😞"}
+
+DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+# Membaca CSV dengan format yang sama seperti hasil ekspor (Tanggal,Mood,Cerita).
+# Menghasilkan (nomor baris, dict entri).
+def read_csv_rows(path):
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header != CSV_HEADER:
+            raise ValueError(f"Header CSV harus {','.join(CSV_HEADER)}, bukan {header}")
+        for row in reader:
+            if not row:
+                continue
+            if len(row) != 3:
+                yield reader.line_num, row
+                continue
+            yield reader.line_num, {"date": row[0], "mood": row[1], "story": row[2]}
+
+# Membaca array JSON berisi objek {"date", "story", "mood"}.
+# Menghasilkan (nomor urut mulai 1, entri).
+def read_json_rows(path):
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if not isinstance(data, list):
+        raise ValueError("File JSON harus berisi array entri")
+    for n, item in enumerate(data, 1):
+        yield n, item
+
+# Memeriksa satu entri; mengembalikan pesan kesalahan atau None jika valid.
+# allowed_moods=None berarti semua mood diterima.
+def validate_entry(entry, allowed_moods=KNOWN_MOODS):
+    if not isinstance(entry, dict):
+        return "format entri tidak dikenal"
+    for key in ("date", "story", "mood"):
+        if not isinstance(entry.get(key), str) or not entry[key].strip():
+            return f"kolom '{key}' kosong atau bukan teks"
+    try:
+        if not DATE_RE.fullmatch(entry['date']):
+            raise ValueError
+        date.fromisoformat(entry['date'])
+    except ValueError:
+        return f"tanggal '{entry['date']}' bukan format YYYY-MM-DD"
+    if allowed_moods is not None and entry['mood'] not in allowed_moods:
+        return f"mood '{entry['mood']}' tidak dikenal"
+    return None
+
+# Membaca dan memeriksa seluruh file tanpa menulis apa pun.
+# Mengembalikan (daftar entri valid, daftar pesan kesalahan).
+def load_import_file(path, fmt=None, allowed_moods=KNOWN_MOODS):
+    fmt = fmt or ('json' if path.lower().endswith('.json') else 'csv')
+    rows = read_json_rows(path) if fmt == 'json' else read_csv_rows(path)
+    entries, errors = [], []
+    for n, entry in rows:
+        error = validate_entry(entry, allowed_moods)
+        if error:
+            errors.append(f"{'baris' if fmt == 'csv' else 'entri'} {n}: {error}")
+        else:
+            entries.append({"date": entry['date'], "story": entry['story'], "mood": entry['mood']})
+    return entries, errors
+
+# Impor massal: semua entri diperiksa dulu, lalu ditulis dalam satu kali
+# append_entries (satu tulis ke penyimpanan, satu pembaruan index/rekap).
+# Jika ada yang tidak valid, tidak ada yang ditulis kecuali skip_invalid=True.
+# Mengembalikan (jumlah entri yang diimpor, daftar pesan kesalahan).
+def import_entries(path, fmt=None, allowed_moods=KNOWN_MOODS, skip_invalid=False):
+    entries, errors = load_import_file(path, fmt, allowed_moods)
+    if errors and not skip_invalid:
+        raise ValueError(f"{len(errors)} entri tidak valid, tidak ada yang diimpor:\n" + "\n".join(errors[:20]))
+    append_entries(entries)
+    return len(entries), errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Impor entri mood dari CSV atau JSON")
+    parser.add_argument("path", help="file CSV (Tanggal,Mood,Cerita) atau array JSON")
+    parser.add_argument("--format", choices=["csv", "json"], help="default: dari ekstensi file")
+    parser.add_argument("--skip-invalid", action="store_true", help="lewati entri tidak valid")
+    parser.add_argument("--any-mood", action="store_true", help="terima mood di luar daftar emoji")
+    parser.add_argument("--dry-run", action="store_true", help="hanya periksa, tidak menulis")
+    args = parser.parse_args()
+
+    allowed = None if args.any_mood else KNOWN_MOODS
+    try:
+        if args.dry_run:
+            entries, errors = load_import_file(args.path, args.format, allowed)
+        else:
+            count, errors = import_entries(args.path, args.format, allowed, args.skip_invalid)
+    except (OSError, ValueError) as e:
+        parser.exit(1, f"Gagal mengimpor: {e}\n")
+    for error in errors:
+        print(f"Dilewati: {error}" if args.skip_invalid else error)
+    if args.dry_run:
+        print(f"{len(entries)} entri valid, {len(errors)} tidak valid")
+    else:
+        print(f"{count} entri diimpor")
+
+
+if __name__ == "__main__":
+    main()
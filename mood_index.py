@@ -0,0 +1,597 @@
+import atexit
+import bisect
+from array import array
+from datetime import date, timedelta
+import json
+import os
+import re
+
+import mood_storage
+from mood_metrics import timed
+from mood_mmap import get_reader
+
+INDEX_FILE = 'data.idx.json'   # Snapshot index kata untuk journal (dibuat otomatis)
+
+TOKEN_RE = re.compile(r"\w+")
+
+
+# Memecah teks menjadi kumpulan kata huruf kecil
+def tokenize(text):
+    return set(TOKEN_RE.findall(text.lower()))
+
+
+# Dasar index atas entri penyimpanan (id = urutan entri di penyimpanan).
+# Di mode journal, posisi byte tiap entri juga disimpan supaya hasil
+# pencarian bisa dibaca langsung tanpa membaca ulang seluruh journal.
+class EntryIndex:
+    def __init__(self, mode):
+        self.mode = mode
+        self.offsets = []      # id -> posisi byte di journal (mode journal saja)
+        self.count = 0         # jumlah entri yang sudah di-index
+        self.end_offset = 0    # posisi byte setelah entri terakhir yang di-index
+        self.checked = (0, 0)  # (posisi, journal_check) terakhir yang dicek (mode journal)
+        self.seen = None       # (ukuran, mtime) journal saat catch_up terakhir (mode journal)
+        self.version = None    # versi urutan cache storage (mode lain)
+        self.dirty = False     # ada entri baru sejak snapshot disimpan/dimuat
+
+    # Diisi subclass: memasukkan isi entri ke struktur index
+    def index_entry(self, entry_id, entry):
+        raise NotImplementedError
+
+    # Menambahkan satu entri ke index
+    def add(self, entry, start=None, end=None):
+        self.index_entry(self.count, entry)
+        if start is not None:
+            self.offsets.append(start)
+            self.end_offset = end
+        self.count += 1
+        self.dirty = True
+
+    # Memasukkan banyak entri (id berurutan mulai first_id); subclass boleh
+    # menggantinya dengan versi yang lebih cepat
+    def index_many(self, first_id, entries):
+        for n, entry in enumerate(entries):
+            self.index_entry(first_id + n, entry)
+
+    # Menambahkan banyak entri sekaligus (spans = posisi byte per entri)
+    def add_many(self, entries, spans):
+        if not entries:
+            return
+        self.index_many(self.count, entries)
+        for start, end in spans:
+            if start is not None:
+                self.offsets.append(start)
+                self.end_offset = end
+        self.count += len(entries)
+        self.dirty = True
+
+    # Membaca entri yang belum ter-index dari penyimpanan. False jika data
+    # sudah ditulis ulang atau urutannya berubah (misalnya oleh proses lain),
+    # sehingga id di index tidak berlaku lagi dan index harus dibangun ulang.
+    # Journal yang berubah tanpa bertambah panjang dianggap ditulis ulang
+    # (seperti JournalReader.refresh); jika bertambah, awal dan ekor bagian
+    # yang sudah di-index dicek dengan journal_check.
+    def catch_up(self):
+        if self.mode == 'journal':
+            _, size, mtime = mood_storage._stat_key(mood_storage.JOURNAL_FILE)
+            if self.seen is not None and mtime != self.seen[1] and size <= self.seen[0]:
+                return False
+            end, check = self.checked
+            if mood_storage.journal_check(end) != check:
+                return False
+            for entry, start, end in mood_storage.read_journal_offsets(offset=self.end_offset):
+                self.add(entry, start, end)
+            if self.end_offset != self.checked[0]:
+                self.checked = (self.end_offset, mood_storage.journal_check(self.end_offset))
+            self.seen = (size, mtime)
+            return True
+        version, entries = mood_storage.entries_since(self.count)
+        if self.version is not None and version != self.version:
+            return False
+        self.version = version
+        for entry in entries:
+            self.add(entry)
+        return True
+
+    # Mengambil entri dari daftar id
+    def fetch(self, ids):
+        if self.mode == 'journal':
+            return mood_storage.read_journal_many([self.offsets[i] for i in ids])
+        return mood_storage.entries_at(ids)
+
+
+# Inverted index: kata -> daftar id entri
+class WordIndex(EntryIndex):
+    def __init__(self, mode):
+        super().__init__(mode)
+        self.postings = {}     # kata -> list id (urut naik)
+        self._vocab = None     # daftar kata terurut untuk pencarian awalan
+
+    def index_entry(self, entry_id, entry):
+        for token in tokenize(entry['story']):
+            ids = self.postings.get(token)
+            if ids is None:
+                self.postings[token] = [entry_id]
+                self._vocab = None
+            else:
+                ids.append(entry_id)
+
+    # Id entri yang mengandung kata berawalan `prefix`
+    def _ids_for_prefix(self, prefix):
+        if self._vocab is None:
+            self._vocab = sorted(self.postings)
+        vocab = self._vocab
+        i = bisect.bisect_left(vocab, prefix)
+        ids = set()
+        while i < len(vocab) and vocab[i].startswith(prefix):
+            ids.update(self.postings[vocab[i]])
+            i += 1
+        return ids
+
+    # Id entri yang memuat SEMUA kata di query (tiap kata boleh berupa awalan)
+    def lookup(self, query):
+        tokens = sorted(tokenize(query), key=len, reverse=True)
+        if not tokens:
+            return []
+        result = None
+        for token in tokens:
+            ids = self._ids_for_prefix(token)
+            result = ids if result is None else result & ids
+            if not result:
+                return []
+        return sorted(result)
+
+    def to_dict(self):
+        return {
+            "inode": mood_storage._stat_key(mood_storage.JOURNAL_FILE)[0],
+            "count": self.count,
+            "end_offset": self.end_offset,
+            "checked": self.checked,
+            "seen": self.seen,
+            "offsets": self.offsets,
+            "postings": self.postings,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        index = cls('journal')
+        index.count = data["count"]
+        index.end_offset = data["end_offset"]
+        index.checked = tuple(data["checked"])
+        index.seen = tuple(data["seen"]) if data["seen"] else None
+        index.offsets = data["offsets"]
+        index.postings = data["postings"]
+        return index
+
+
+# Trigram dari teks (teks sudah dinormalisasi huruf kecil)
+def trigrams(text):
+    return {text[i:i+3] for i in range(len(text) - 2)}
+
+
+# Trigram index: potongan 3 huruf -> daftar id entri.
+# Dipakai untuk menyaring kandidat pencarian substring; hasil akhirnya
+# tetap dicek dengan `keyword.lower() in story.lower()` seperti sebelumnya.
+# Index ini hanya ada di memori dan dibangun sekali per proses.
+class TrigramIndex(EntryIndex):
+    def __init__(self, mode):
+        super().__init__(mode)
+        self.postings = {}     # trigram -> list id (urut naik)
+
+    def index_entry(self, entry_id, entry):
+        for gram in trigrams(entry['story'].lower()):
+            ids = self.postings.get(gram)
+            if ids is None:
+                self.postings[gram] = [entry_id]
+            else:
+                ids.append(entry_id)
+
+    # Id kandidat yang memuat semua trigram dari keyword
+    def candidates(self, keyword):
+        grams = trigrams(keyword.lower())
+        if not grams:
+            return list(range(self.count))   # keyword < 3 huruf: semua kandidat
+        lists = []
+        for gram in grams:
+            ids = self.postings.get(gram)
+            if not ids:
+                return []
+            lists.append(ids)
+        lists.sort(key=len)
+        result = set(lists[0])
+        for ids in lists[1:]:
+            result.intersection_update(ids)
+            if not result:
+                return []
+        return sorted(result)
+
+
+# Index tanggal: ordinal tanggal terurut + id entri pada posisi yang sama.
+# Rentang tanggal apa pun dicari dengan bisect: O(log n + k).
+class DateIndex(EntryIndex):
+    SORT_TAIL = 64   # ekor tak urut sampai sepanjang ini cukup disisipkan satu per satu
+
+    def __init__(self, mode):
+        super().__init__(mode)
+        self.keys = array('l')   # ordinal tanggal, urut naik
+        self.ids = array('l')    # id entri, sejajar dengan keys
+        self._sorted_len = 0     # panjang awalan keys/ids yang sudah urut
+
+    # Entri selalu ditambahkan di akhir. Entri mundur membuat ekornya tidak
+    # urut; pengurutan ditunda sampai index dipakai (_ensure_sorted), jadi
+    # membangun index dari riwayat acak tidak menyisipkan array per entri.
+    def index_entry(self, entry_id, entry):
+        key = mood_storage.date_key(entry['date'])
+        if self._sorted_len == len(self.keys) and (not self.keys or self.keys[-1] <= key):
+            self._sorted_len += 1
+        self.keys.append(key)
+        self.ids.append(entry_id)
+
+    # Mengurutkan ekor yang belum urut: ekor pendek disisipkan dengan bisect
+    # (setelah entri bertanggal sama supaya urutan input tetap terjaga),
+    # ekor panjang diurutkan sekaligus dengan sort stabil
+    def _ensure_sorted(self):
+        n = len(self.keys)
+        if self._sorted_len == n:
+            return
+        if n - self._sorted_len <= self.SORT_TAIL:
+            tail = list(zip(self.keys[self._sorted_len:], self.ids[self._sorted_len:]))
+            del self.keys[self._sorted_len:]
+            del self.ids[self._sorted_len:]
+            for key, entry_id in tail:
+                i = bisect.bisect_right(self.keys, key)
+                self.keys.insert(i, key)
+                self.ids.insert(i, entry_id)
+        else:
+            keys, ids = self.keys, self.ids
+            order = sorted(range(n), key=keys.__getitem__)
+            self.keys = array('l', (keys[i] for i in order))
+            self.ids = array('l', (ids[i] for i in order))
+        self._sorted_len = n
+
+    # Id entri dengan start <= tanggal <= end (ordinal; None = tanpa batas)
+    def ids_between(self, start=None, end=None):
+        self._ensure_sorted()
+        lo = 0 if start is None else bisect.bisect_left(self.keys, start)
+        hi = len(self.keys) if end is None else bisect.bisect_right(self.keys, end)
+        return self.ids[lo:hi].tolist()
+
+
+# Rekap mood yang diperbarui setiap ada entri baru: jumlah per mood per hari,
+# per minggu (kunci = ordinal hari Senin) dan per bulan (kunci = 'YYYY-MM').
+class MoodRollup(EntryIndex):
+    def __init__(self, mode):
+        super().__init__(mode)
+        self.days = {}           # ordinal hari -> {mood: jumlah}
+        self.day_keys = array('l')   # ordinal hari yang punya entri, urut naik
+        self.weeks = {}
+        self.months = {}
+        self.totals = {}
+
+    def index_entry(self, entry_id, entry):
+        key = mood_storage.date_key(entry['date'])
+        mood = entry['mood']
+        counts = self.days.get(key)
+        if counts is None:
+            counts = self.days[key] = {}
+            if not self.day_keys or self.day_keys[-1] < key:
+                self.day_keys.append(key)
+            else:
+                self.day_keys.insert(bisect.bisect_left(self.day_keys, key), key)
+        day = date.fromordinal(key)
+        week = key - day.weekday()
+        month = day.strftime("%Y-%m")
+        for table, k in ((self.weeks, week), (self.months, month)):
+            table.setdefault(k, {})
+        for bucket in (counts, self.weeks[week], self.months[month], self.totals):
+            bucket[mood] = bucket.get(mood, 0) + 1
+
+    # Jumlah per mood untuk start <= tanggal <= end (ordinal; None = tanpa batas).
+    # Biayanya sebanding dengan jumlah hari di rentang, bukan jumlah entri.
+    def counts_between(self, start=None, end=None):
+        if start is None and end is None:
+            return dict(self.totals)
+        lo = 0 if start is None else bisect.bisect_left(self.day_keys, start)
+        hi = len(self.day_keys) if end is None else bisect.bisect_right(self.day_keys, end)
+        result = {}
+        for key in self.day_keys[lo:hi]:
+            for mood, n in self.days[key].items():
+                result[mood] = result.get(mood, 0) + n
+        return result
+
+    # Jumlah per mood pada minggu (Senin-Minggu) yang memuat tanggal `day`
+    def week_counts(self, day):
+        key = day.toordinal() - day.weekday()
+        return dict(self.weeks.get(key, {}))
+
+    # Jumlah per mood pada bulan tertentu
+    def month_counts(self, year, month):
+        return dict(self.months.get(f"{year:04d}-{month:02d}", {}))
+
+
+# Index yang sudah dimuat di proses ini: nama -> index
+_indexes = {}
+
+
+# Mengambil index `name` untuk proses ini; dibuat dengan factory(mode) saat
+# pertama dipakai, lalu selalu disusulkan dengan entri baru di penyimpanan.
+# Jika penyimpanan ditulis ulang atau diurutkan ulang, index dibuat lagi.
+@timed("load_index")
+@mood_storage.locked
+def _get_index(name, factory):
+    mode = mood_storage.STORAGE_MODE
+    index = _indexes.get(name)
+    if index is not None and index.mode == mode and index.catch_up():
+        return index
+    if mode == 'journal':
+        mood_storage.migrate_json_to_journal()
+    index = factory(mode)
+    _indexes[name] = index
+    index.catch_up()
+    return index
+
+# Index kata. Di mode journal dimuat dari snapshot INDEX_FILE jika masih
+# milik journal yang sama (inode sama, dan catch_up lolos cek journal_check
+# serta ukuran/mtime), lalu disusulkan dengan entri baru; snapshot yang basi
+# dibuang. Mode lain: dibangun di memori saat pertama dipakai.
+def _load_word_index(mode):
+    if mode != 'journal':
+        return WordIndex(mode)
+    try:
+        with open(INDEX_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data["inode"] != mood_storage._stat_key(mood_storage.JOURNAL_FILE)[0]:
+            return WordIndex(mode)
+        index = WordIndex.from_dict(data)
+    except (OSError, ValueError, KeyError, TypeError):
+        return WordIndex(mode)
+    return index if index.catch_up() else WordIndex(mode)
+
+def get_word_index():
+    return _get_index('word', _load_word_index)
+
+# Menyimpan snapshot index kata (mode journal, hanya jika ada perubahan)
+@mood_storage.locked
+def save_word_index():
+    index = _indexes.get('word')
+    if index is None or index.mode != 'journal' or not index.dirty:
+        return
+    tmp_path = INDEX_FILE + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index.to_dict(), f)
+    os.replace(tmp_path, INDEX_FILE)
+    index.dirty = False
+
+def get_trigram_index():
+    return _get_index('trigram', TrigramIndex)
+
+def get_date_index():
+    return _get_index('date', DateIndex)
+
+def get_rollup():
+    return _get_index('rollup', MoodRollup)
+
+
+# Dipanggil storage setiap append_entry: index yang sudah dimuat ikut diperbarui
+def _on_append(entry, start, end):
+    for index in _indexes.values():
+        if index.mode == 'journal' and start != index.end_offset:
+            continue   # ada penulisan lain di antaranya; catch_up yang menangani
+        if index.mode == mood_storage.STORAGE_MODE:
+            index.add(entry, start, end)
+
+# Dipanggil storage sekali untuk setiap append_entries (impor massal)
+def _on_append_many(entries, spans):
+    for index in _indexes.values():
+        if index.mode == 'journal' and spans[0][0] != index.end_offset:
+            continue
+        if index.mode == mood_storage.STORAGE_MODE:
+            index.add_many(entries, spans)
+
+# Dipanggil storage jika seluruh data ditulis ulang: index harus dibangun ulang
+def _on_rewrite():
+    _indexes.clear()
+    try:
+        os.remove(INDEX_FILE)
+    except OSError:
+        pass
+
+mood_storage.add_append_listener(_on_append)
+mood_storage.add_rewrite_listener(_on_rewrite)
+mood_storage.add_batch_listener(_on_append_many)
+atexit.register(save_word_index)
+
+
+# Cari cerita yang memuat semua kata di query (kata boleh berupa awalan,
+# misalnya "kerj kera" menemukan "kerja keras"). Hasil urut tanggal.
+@mood_storage.locked
+def search_words(query):
+    index = get_word_index()
+    result = index.fetch(index.lookup(query))
+    result.sort(key=lambda e: mood_storage.date_key(e['date']))
+    return result
+
+# Cari cerita yang mengandung keyword sebagai substring (tidak peka huruf
+# besar/kecil), sama persis dengan pencarian lama. Trigram index menyaring
+# kandidat, lalu tiap kandidat dicek ulang. Hasil urut tanggal.
+@timed("search_stories")
+@mood_storage.locked
+def search_stories(keyword):
+    if mood_storage.STORAGE_MODE == 'sqlite':
+        return mood_storage.sqlite_search(mood_storage.connect_sqlite(), keyword)
+    needle = keyword.lower()
+    index = get_trigram_index()
+    result = [e for e in index.fetch(index.candidates(needle)) if needle in e['story'].lower()]
+    result.sort(key=lambda e: mood_storage.date_key(e['date']))
+    return result
+
+# Ambil entri dengan start <= tanggal <= end, urut tanggal. start/end boleh
+# berupa date atau string 'YYYY-MM-DD'; None berarti tanpa batas.
+@timed("period_filter")
+@mood_storage.locked
+def entries_between(start=None, end=None):
+    if mood_storage.STORAGE_MODE == 'sqlite':
+        return mood_storage.sqlite_between(mood_storage.connect_sqlite(), start, end)
+    if mood_storage.STORAGE_MODE == 'sharded':
+        return mood_storage.shards_between(start, end)
+    if start is not None:
+        start = mood_storage.date_key(mood_storage.to_date_str(start))
+    if end is not None:
+        end = mood_storage.date_key(mood_storage.to_date_str(end))
+    # Journal: index tanggal yang sama dengan EntryRange/latest_entry (mmap)
+    index = get_reader() if mood_storage.STORAGE_MODE == 'journal' else get_date_index()
+    return index.fetch(index.ids_between(start, end))
+
+# Data di balik EntryRange sudah ditulis ulang sejak rentang dibuat: id dan
+# posisi yang disimpan tidak berlaku lagi. Buat rentang baru (reopen()).
+class StaleRangeError(LookupError):
+    pass
+
+# Awal jendela `days` hari terakhir (jendela = awal ini sampai seterusnya).
+# Jendela yang lebih panjang dari kalender dimulai di date.min (semua
+# entri), bukan OverflowError.
+def window_start(days, today=None):
+    today = today or date.today()
+    if days >= today.toordinal():
+        return date.min
+    return today - timedelta(days=days)
+
+# Rentang tanggal yang dibaca per potong: hanya id (atau jumlah baris di
+# mode sqlite) yang disiapkan di awal, isi entri diambil saat dibutuhkan.
+# Dipakai tabel riwayat yang hanya menampilkan baris yang terlihat.
+class EntryRange:
+    @timed("period_filter")
+    @mood_storage.locked
+    def __init__(self, start=None, end=None):
+        if start is not None:
+            start = mood_storage.date_key(mood_storage.to_date_str(start))
+        if end is not None:
+            end = mood_storage.date_key(mood_storage.to_date_str(end))
+        self.start, self.end = start, end
+        self._shards = None
+        if mood_storage.STORAGE_MODE == 'sqlite':
+            self._ids = None
+            self._count = mood_storage.sqlite_count(mood_storage.connect_sqlite(), *self._date_strs())
+        elif mood_storage.STORAGE_MODE == 'sharded':
+            # Hanya jumlah entri per shard yang disimpan; isi shard dibaca
+            # satu per satu saat halamannya diminta (hanya satu shard di memori)
+            self._ids = None
+            self._shards = mood_storage.shard_range_counts(*self._date_strs())
+            self._starts = [0]   # posisi entri pertama tiap shard di rentang
+            for _, count in self._shards:
+                self._starts.append(self._starts[-1] + count)
+            self._count = self._starts[-1]
+            self._loaded = (None, [])   # (bulan, entri) shard terakhir yang dibaca
+        else:
+            # Journal dibaca lewat mmap: hanya entri di halaman yang diminta
+            # yang di-decode
+            self._index = get_reader() if mood_storage.STORAGE_MODE == 'journal' else get_date_index()
+            self._generation = getattr(self._index, 'generation', None)
+            self._ids = self._index.ids_between(start, end)
+            self._count = len(self._ids)
+
+    def _date_strs(self):
+        return tuple(None if k is None else date.fromordinal(k) for k in (self.start, self.end))
+
+    def __len__(self):
+        return self._count
+
+    # Rentang yang sama dibaca ulang dari data sekarang
+    def reopen(self):
+        return EntryRange(*self._date_strs())
+
+    # Id yang disimpan milik index yang sudah diganti atau dibangun ulang
+    def _index_changed(self):
+        if mood_storage.STORAGE_MODE == 'journal':
+            reader = get_reader()
+            return reader is not self._index or reader.generation != self._generation
+        return get_date_index() is not self._index
+
+    # Entri ke-lo sampai sebelum ke-hi (urut tanggal). StaleRangeError jika
+    # data sudah ditulis ulang sejak rentang dibuat (id tidak berlaku, atau
+    # jumlah entri di rentang tidak lagi sama).
+    @mood_storage.locked
+    def rows(self, lo, hi):
+        lo, hi = max(lo, 0), min(hi, self._count)
+        if lo >= hi:
+            return []
+        if self._shards is not None:
+            result = self._shard_rows(lo, hi)
+        elif self._ids is None:
+            result = mood_storage.sqlite_between(mood_storage.connect_sqlite(), *self._date_strs(),
+                                                 limit=hi - lo, offset=lo)
+        elif self._index_changed():
+            raise StaleRangeError("data sudah ditulis ulang")
+        else:
+            result = self._index.fetch(self._ids[lo:hi])
+        if len(result) != hi - lo:
+            raise StaleRangeError("data sudah ditulis ulang")
+        return result
+
+    def _shard_rows(self, lo, hi):
+        result = []
+        i = bisect.bisect_right(self._starts, lo) - 1
+        while lo < hi:
+            month = self._shards[i][0]
+            if self._loaded[0] != month:
+                self._loaded = (month, mood_storage.shard_rows(month, *self._date_strs()))
+            first = self._starts[i]
+            result.extend(self._loaded[1][lo - first:hi - first])
+            lo = self._starts[i + 1]
+            i += 1
+        return result
+
+    def __iter__(self):
+        step = 1000
+        for lo in range(0, self._count, step):
+            yield from self.rows(lo, lo + step)
+
+# Ambil entri dalam `days` hari terakhir
+def entries_last_days(days, today=None):
+    return entries_between(window_start(days, today))
+
+# Entri terakhir (tanggal terbaru) di rentang tanggal, atau None
+@mood_storage.locked
+def latest_entry(start=None, end=None):
+    if mood_storage.STORAGE_MODE == 'sqlite':
+        return mood_storage.sqlite_latest(mood_storage.connect_sqlite(), start, end)
+    if mood_storage.STORAGE_MODE == 'sharded':
+        return mood_storage.shard_latest(start, end)
+    if start is not None:
+        start = mood_storage.date_key(mood_storage.to_date_str(start))
+    if end is not None:
+        end = mood_storage.date_key(mood_storage.to_date_str(end))
+    index = get_reader() if mood_storage.STORAGE_MODE == 'journal' else get_date_index()
+    ids = index.ids_between(start, end)
+    return index.fetch(ids[-1:])[0] if ids else None
+
+# Jumlah per mood di rentang tanggal, dari rekap (tanpa membaca entri)
+@mood_storage.locked
+def mood_counts(start=None, end=None):
+    if mood_storage.STORAGE_MODE == 'sqlite':
+        return mood_storage.sqlite_mood_counts(mood_storage.connect_sqlite(), start, end)
+    if mood_storage.STORAGE_MODE == 'sharded':
+        return mood_storage.shard_mood_counts(start, end)
+    if start is not None:
+        start = mood_storage.date_key(mood_storage.to_date_str(start))
+    if end is not None:
+        end = mood_storage.date_key(mood_storage.to_date_str(end))
+    return get_rollup().counts_between(start, end)
+
+# Statistik untuk blok "Statistik Mood": jumlah per pilihan mood (termasuk 0),
+# total, urutan terbanyak, persentase, dan mood yang paling sering.
+# Mood di luar mood_options (misalnya dari set emoji front-end lain) diabaikan.
+@timed("stats")
+def mood_summary(mood_options, start=None, end=None):
+    counts = mood_counts(start, end)
+    mood_count = {m: counts.get(m, 0) for m in mood_options}
+    total = sum(mood_count.values())
+    sorted_mood = sorted(mood_count.items(), key=lambda x: x[1], reverse=True)
+    percent = {m: (c / total * 100) if total > 0 else 0 for m, c in mood_count.items()}
+    return {
+        "counts": mood_count,
+        "total": total,
+        "sorted": sorted_mood,
+        "percent": percent,
+        "most_common": sorted_mood[0][0] if sorted_mood else "",
+    }
@@ -0,0 +1,152 @@
+from mood_metrics import timed
+from mood_storage import date_key
+
+
+# Ordinal tanggal sebuah entri (dict lama atau MoodEntry dari mood_compact)
+def entry_key(data):
+    ordinal = getattr(data, 'ordinal', None)
+    return ordinal if ordinal is not None else date_key(data['date'])
+
+
+# Node untuk LinkedList; key = ordinal tanggal, dihitung sekali saat masuk list.
+# __slots__ menghilangkan __dict__ per node (lihat mood_bench.py --memory).
+class Node:
+    __slots__ = ('data', 'key', 'next')
+
+    def __init__(self, data, key=None):
+        self.data = data
+        self.key = key
+        self.next = None
+
+# Struktur data dinamis: LinkedList (dipakai bersama oleh semua front-end).
+# is_sorted mencatat apakah list masih urut tanggal, sehingga sort_by_date
+# tidak perlu bekerja lagi untuk list yang dibangun dari load_history().
+class MoodLinkedList:
+    def __init__(self):
+        self.head = None
+        self.tail = None   # pointer ke node terakhir supaya append O(1)
+        self.size = 0
+        self.is_sorted = True
+
+    # Membuat linked list langsung dari iterable (list, generator journal, dll)
+    @classmethod
+    def from_iterable(cls, items):
+        mood_list = cls()
+        mood_list.extend(items)
+        return mood_list
+
+    # Menambahkan node baru ke akhir list
+    def append(self, data):
+        new_node = Node(data, entry_key(data))
+        if not self.head:
+            self.head = new_node
+        else:
+            if new_node.key < self.tail.key:
+                self.is_sorted = False
+            self.tail.next = new_node
+        self.tail = new_node
+        self.size += 1
+
+    # Menambahkan banyak data sekaligus ke akhir list dalam satu kali jalan
+    def extend(self, items):
+        tail = self.tail
+        is_sorted = self.is_sorted
+        count = 0
+        for item in items:
+            new_node = Node(item, entry_key(item))
+            if tail is None:
+                self.head = new_node
+            else:
+                if new_node.key < tail.key:
+                    is_sorted = False
+                tail.next = new_node
+            tail = new_node
+            count += 1
+        self.tail = tail
+        self.size += count
+        self.is_sorted = is_sorted
+
+    # Menyisipkan data sesuai urutan tanggal (list harus sudah urut).
+    # Entri hari ini langsung ke ekor; entri mundur dicari posisinya dari depan.
+    def insert_sorted(self, data):
+        if not self.is_sorted:
+            self.sort_by_date()
+        key = entry_key(data)
+        if self.tail is None or self.tail.key <= key:
+            self.append(data)
+            return
+        new_node = Node(data, key)
+        if key < self.head.key:
+            new_node.next = self.head
+            self.head = new_node
+        else:
+            curr = self.head
+            while curr.next and curr.next.key <= key:
+                curr = curr.next
+            new_node.next = curr.next
+            curr.next = new_node
+        self.size += 1
+
+    # Mengosongkan list
+    def clear(self):
+        self.head = None
+        self.tail = None
+        self.size = 0
+        self.is_sorted = True
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        curr = self.head
+        while curr:
+            yield curr.data
+            curr = curr.next
+
+    # Mengubah linked list ke list biasa (satu kali jalan)
+    def to_list(self):
+        result = [None] * self.size
+        curr = self.head
+        i = 0
+        while curr:
+            result[i] = curr.data
+            curr = curr.next
+            i += 1
+        return result
+
+    # Sort berdasarkan tanggal: kunci tanggal sudah di-parse sekali di node,
+    # lalu timsort (stabil, O(n log n)) atas node-node tersebut.
+    # Node disambung ulang di tempat, tanpa membuat node baru.
+    # Jika list sudah urut (is_sorted), fungsi ini langsung selesai.
+    @timed("sort_by_date")
+    def sort_by_date(self):
+        if self.is_sorted:
+            return
+        nodes = []
+        curr = self.head
+        while curr:
+            nodes.append(curr)
+            curr = curr.next
+        nodes.sort(key=lambda node: node.key)
+        prev = None
+        for node in nodes:
+            if prev is None:
+                self.head = node
+            else:
+                prev.next = node
+            prev = node
+        prev.next = None
+        self.tail = prev
+        self.is_sorted = True
+
+    # Linear search berdasarkan keyword di cerita
+    @timed("search_by_keyword")
+    def search_by_keyword(self, keyword):
+        results = MoodLinkedList()
+        needle = keyword.lower()
+        curr = self.head
+        while curr:
+            if needle in curr.data['story'].lower():
+                results.append(curr.data)
+            curr = curr.next
+        return results
@@ -0,0 +1,176 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+import mood_workload
+
+# Uji beban mood_api.py: N koneksi keep-alive paralel mengirim campuran
+# request add/range/stats/search, lalu mencetak throughput dan latensi per
+# endpoint. Dengan --spawn, server dijalankan sendiri di loopback pada port
+# bebas dengan data sintetis di folder sementara.
+#   python mood_loadtest.py --spawn --days 3650 --connections 50 --requests 20000
+#   python mood_loadtest.py --port 8765 --duration 30
+
+DEFAULT_MIX = "range=50,stats=25,search=15,add=10"
+WORDS = ("kerja", "kuliah", "teman", "hujan", "lelah", "senang", "rapat", "kopi")
+
+
+# Request acak untuk satu jenis endpoint: (method, path, body)
+def make_request(kind, rng, today):
+    if kind == "add":
+        body = {"date": today.isoformat(), "story": f"uji beban {rng.choice(WORDS)}",
+                "mood": rng.choice(mood_workload.EMOJI_SETS["moodtracker"])}
+        return "POST", "/entries", json.dumps(body).encode("utf-8")
+    if kind == "stats":
+        return "GET", f"/stats?days={rng.choice((7, 30, 365))}", b""
+    if kind == "search":
+        return "GET", f"/search?q={rng.choice(WORDS)}&limit=20", b""
+    start = today - timedelta(days=rng.randrange(365 * 3))
+    end = start + timedelta(days=rng.choice((6, 30)))
+    return "GET", f"/entries?from={start}&to={end}&limit=100", b""
+
+# Satu request/respons di koneksi keep-alive; mengembalikan status HTTP
+async def roundtrip(reader, writer, host, method, path, body):
+    head = (f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n")
+    writer.write(head.encode("latin-1") + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+# Satu klien: membuka satu koneksi lalu mengirim request berurutan sampai
+# kuota habis atau waktu habis
+async def client(host, port, kinds, weights, budget, deadline, results, seed):
+    rng = random.Random(seed)
+    today = date.today()
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while budget[0] > 0 and time.perf_counter() < deadline:
+            budget[0] -= 1
+            kind = rng.choices(kinds, weights)[0]
+            method, path, body = make_request(kind, rng, today)
+            start = time.perf_counter()
+            try:
+                status = await roundtrip(reader, writer, host, method, path, body)
+            except (ConnectionError, asyncio.IncompleteReadError, ValueError, IndexError):
+                results.append((kind, time.perf_counter() - start, 0))
+                writer.close()
+                reader, writer = await asyncio.open_connection(host, port)
+                continue
+            results.append((kind, time.perf_counter() - start, status))
+    finally:
+        writer.close()
+
+async def run_load(host, port, connections, requests, duration, mix, seed=0):
+    kinds, weights = list(mix), list(mix.values())
+    budget = [requests]
+    deadline = time.perf_counter() + duration if duration else float("inf")
+    results = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, kinds, weights, budget, deadline, results, f"{seed}:{n}")
+                           for n in range(connections)))
+    return results, time.perf_counter() - start
+
+
+def percentile(sorted_values, p):
+    return sorted_values[min(len(sorted_values) - 1, int(p / 100 * len(sorted_values)))]
+
+def report(results, elapsed, connections):
+    print(f"{len(results)} request, {connections} koneksi, {elapsed:.2f} s, "
+          f"{len(results) / elapsed:.0f} request/s")
+    print(f"{'endpoint':8s} {'jumlah':>7s} {'gagal':>6s} {'p50 ms':>8s} {'p90 ms':>8s} {'p99 ms':>8s} {'max ms':>8s}")
+    groups = {}
+    for kind, seconds, status in results:
+        groups.setdefault(kind, []).append((seconds, status))
+    for kind in sorted(groups) + ["semua"]:
+        rows = groups.get(kind) or [(s, st) for k, s, st in results]
+        times = sorted(s * 1000 for s, _ in rows)
+        failed = sum(1 for _, st in rows if not 200 <= st < 300)
+        print(f"{kind:8s} {len(rows):7d} {failed:6d} {percentile(times, 50):8.2f} "
+              f"{percentile(times, 90):8.2f} {percentile(times, 99):8.2f} {times[-1]:8.2f}")
+
+
+# Menjalankan mood_api.py di folder `directory` pada port bebas di loopback;
+# mengembalikan (proses, port) setelah server siap
+def spawn_server(directory, storage, workers):
+    env = dict(os.environ, MOODTRACKER_STORAGE=storage,
+               MOODTRACKER_DATA_DIR=os.path.dirname(directory), MOODTRACKER_USER=os.path.basename(directory),
+               PYTHONPATH=os.pathsep.join(filter(None, [os.path.dirname(os.path.abspath(__file__)),
+                                                        os.environ.get("PYTHONPATH")])))
+    proc = subprocess.Popen(
+        [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "mood_api.py"),
+         "--port", "0", "--workers", str(workers)],
+        cwd=directory, env=env, stdout=subprocess.PIPE, text=True, encoding="utf-8",
+    )
+    line = proc.stdout.readline()
+    if not line:
+        proc.wait()
+        sys.exit("Server gagal dijalankan")
+    return proc, int(line.rsplit(":", 1)[1].strip("/ \n"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Uji beban API Mood Tracker")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--spawn", action="store_true",
+                        help="jalankan server sendiri di loopback dengan data sintetis")
+    parser.add_argument("--storage", default="journal", choices=["journal", "json", "sqlite", "sharded"],
+                        help="mode penyimpanan server --spawn")
+    parser.add_argument("--days", type=int, default=3650, help="riwayat sintetis untuk --spawn")
+    parser.add_argument("--per-day", type=int, default=1, help="entri maksimum per hari untuk --spawn")
+    parser.add_argument("--workers", type=int, default=4, help="thread penyimpanan server --spawn")
+    parser.add_argument("--connections", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--duration", type=float, help="batas waktu (detik)")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"bobot endpoint (default: {DEFAULT_MIX})")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    mix = {}
+    for item in args.mix.split(","):
+        kind, _, weight = item.partition("=")
+        if kind.strip() not in ("range", "stats", "search", "add"):
+            parser.error(f"endpoint tidak dikenal: {kind}")
+        mix[kind.strip()] = float(weight)
+
+    proc = tmp = None
+    host, port = args.host, args.port
+    if args.spawn:
+        tmp = tempfile.TemporaryDirectory(prefix="moodload-")
+        # Data berakhir hari ini karena request memakai jendela dari hari ini (?days=)
+        user_dir = mood_workload.generate_workload(
+            tmp.name, 1, args.days, [args.storage], args.seed, emoji_set="moodtracker",
+            end=date.today(), per_day=args.per_day)[0][0]
+        proc, port = spawn_server(os.path.dirname(user_dir), args.storage, args.workers)
+        host = "127.0.0.1"
+    try:
+        results, elapsed = asyncio.run(run_load(host, port, args.connections, args.requests,
+                                                args.duration, mix, args.seed))
+        report(results, elapsed, args.connections)
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+        if tmp is not None:
+            tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
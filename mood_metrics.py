@@ -0,0 +1,143 @@
+import atexit
+import bisect
+import contextlib
+import functools
+import json
+import os
+import signal
+import threading
+import time
+
+# Batas atas bucket histogram (detik), seperti bucket bawaan Prometheus
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Jika diisi, metrik ditulis ke file ini saat program selesai dan saat
+# menerima SIGUSR1. Ekstensi .prom = format teks Prometheus, selain itu JSON.
+METRICS_FILE = os.environ.get('MOODTRACKER_METRICS', '')
+
+
+# Histogram waktu satu operasi: jumlah per bucket, total, min dan max
+class Histogram:
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKETS) + 1)   # bucket terakhir = +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, seconds):
+        self.buckets[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.sum / self.count if self.count else None,
+            "buckets": {str(le): n for le, n in zip(BUCKETS + ("+Inf",), self.buckets)},
+        }
+
+
+_histograms = {}
+_lock = threading.Lock()
+
+# Mencatat satu durasi (detik) untuk operasi `name`
+def observe(name, seconds):
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = Histogram()
+        histogram.observe(seconds)
+
+# Context manager: with timer("populate_history"): ...
+@contextlib.contextmanager
+def timer(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - start)
+
+# Dekorator: catat waktu setiap pemanggilan fungsi sebagai operasi `name`
+def timed(name):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                observe(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+# Salinan histogram saat ini dalam bentuk dict {operasi: {...}}
+def snapshot():
+    with _lock:
+        return {name: h.to_dict() for name, h in sorted(_histograms.items())}
+
+def to_json():
+    return json.dumps(snapshot(), indent=2)
+
+# Format teks Prometheus: satu histogram dengan label operation
+def to_prometheus():
+    lines = [
+        "# HELP moodtracker_operation_seconds Durasi operasi Mood Tracker.",
+        "# TYPE moodtracker_operation_seconds histogram",
+    ]
+    for name, h in snapshot().items():
+        cumulative = 0
+        for le, n in h["buckets"].items():
+            cumulative += n
+            lines.append(f'moodtracker_operation_seconds_bucket{{operation="{name}",le="{le}"}} {cumulative}')
+        lines.append(f'moodtracker_operation_seconds_sum{{operation="{name}"}} {h["sum"]}')
+        lines.append(f'moodtracker_operation_seconds_count{{operation="{name}"}} {h["count"]}')
+    return "\n".join(lines) + "\n"
+
+# Menulis metrik ke file (format dari ekstensi jika fmt tidak diberikan).
+# Ditulis ke file sementara lalu os.replace supaya pembaca tidak melihat
+# file setengah jadi.
+def dump(path=None, fmt=None):
+    path = path or METRICS_FILE
+    fmt = fmt or ('prometheus' if path.endswith('.prom') else 'json')
+    text = to_prometheus() if fmt == 'prometheus' else to_json()
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+    return path
+
+# Mengosongkan semua histogram
+def reset():
+    with _lock:
+        _histograms.clear()
+
+
+_dump_requested = threading.Event()
+
+# Thread yang menulis dump atas permintaan SIGUSR1. Handler sinyal hanya
+# menyalakan event: handler berjalan di thread utama di tengah kode apa pun,
+# termasuk di dalam observe() yang sedang memegang _lock, sehingga memanggil
+# dump() langsung dari handler bisa deadlock.
+def _dump_worker():
+    while True:
+        _dump_requested.wait()
+        _dump_requested.clear()
+        try:
+            dump()
+        except OSError:
+            pass
+
+
+if METRICS_FILE:
+    atexit.register(dump)
+    if hasattr(signal, 'SIGUSR1') and threading.current_thread() is threading.main_thread():
+        # Dump sesuai permintaan dari luar: kill -USR1 <pid>
+        threading.Thread(target=_dump_worker, name='metrics-dump', daemon=True).start()
+        signal.signal(signal.SIGUSR1, lambda signum, frame: _dump_requested.set())
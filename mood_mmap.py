@@ -0,0 +1,225 @@
+import atexit
+import bisect
+import json
+import mmap
+import os
+import re
+import struct
+from array import array
+
+import mood_storage
+from mood_metrics import timed
+
+OFFSET_INDEX_FILE = 'data.jsonl.off'   # index samping journal (dibuat otomatis)
+
+# magic, inode journal, posisi akhir, jumlah entri, mtime journal (ns) dan
+# mood_storage.journal_check(posisi akhir)
+_HEADER = struct.Struct('<8sQQQqQ')
+_MAGIC = b'MTOFF002'
+_DATE_RE = re.compile(rb'"date":\s*"([^"\\]*)"')
+
+
+# Pembaca journal lewat mmap. Index samping berisi posisi byte awal tiap
+# entri (int64), ordinal tanggalnya (int32) dan urutan id menurut tanggal
+# (int32), sekitar 16 byte per entri, dan disimpan ke OFFSET_INDEX_FILE. Membangun index hanya mencari baris
+# baru dan mengambil tanggal dengan regex, tanpa json.loads; isi entri baru
+# di-decode saat halaman/rentang yang memuatnya benar-benar diminta.
+class JournalReader:
+    SORT_TAIL = 64
+
+    def __init__(self, path=mood_storage.JOURNAL_FILE, index_path=OFFSET_INDEX_FILE):
+        self.path = path
+        self.index_path = index_path
+        self._file = None
+        self._map = None
+        self.generation = 0         # naik setiap index dibangun ulang (id lama tidak berlaku)
+        self._reset(None)
+        self._load_index()
+
+    def _reset(self, inode):
+        self.generation += 1
+        self.inode = inode
+        self.end_offset = 0
+        self.mtime_ns = None        # mtime journal saat terakhir dicek
+        self.check = 0              # journal_check(end_offset)
+        self.offsets = array('q')   # id -> posisi byte awal baris
+        self.dates = array('i')     # id -> ordinal tanggal
+        self.keys = array('i')      # ordinal tanggal, urut naik
+        self.ids = array('i')       # id entri, sejajar dengan keys
+        self._sorted_len = 0
+        self.dirty = True
+
+    # Membaca index samping dari disk (jika masih cocok dengan journal)
+    def _load_index(self):
+        try:
+            with open(self.index_path, 'rb') as f:
+                magic, inode, end_offset, count, mtime_ns, check = _HEADER.unpack(f.read(_HEADER.size))
+                offsets, dates, ids = array('q'), array('i'), array('i')
+                offsets.fromfile(f, count)
+                dates.fromfile(f, count)
+                ids.fromfile(f, count)
+        except (OSError, EOFError, struct.error):
+            return
+        if magic != _MAGIC:
+            return
+        self.inode, self.end_offset = inode, end_offset
+        self.mtime_ns, self.check = mtime_ns, check
+        self.offsets, self.dates, self.ids = offsets, dates, ids
+        self.keys = array('i', map(dates.__getitem__, ids))
+        self._sorted_len = count
+        self.dirty = False
+
+    # Menyimpan index samping (hanya jika berubah)
+    def save(self):
+        if not self.dirty or self.inode is None:
+            return
+        self._ensure_sorted()
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, self.inode, self.end_offset, len(self.offsets),
+                                 self.mtime_ns or 0, self.check))
+            self.offsets.tofile(f)
+            self.dates.tofile(f)
+            self.ids.tofile(f)
+        os.replace(tmp_path, self.index_path)
+        self.dirty = False
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+        self._map = self._file = None
+
+    # Menyesuaikan dengan journal di disk: jika file diganti (inode beda,
+    # lebih pendek, berubah tanpa bertambah panjang, atau isinya sampai
+    # end_offset tidak lagi cocok dengan check, misalnya inode dipakai lagi
+    # oleh file hasil os.replace) index dibangun ulang; jika hanya bertambah
+    # cukup ekornya. Sama seperti _refresh_cache di mood_storage.
+    @timed("load_reader")
+    def refresh(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            self.close()
+            self._reset(None)
+            return self
+        if (st.st_ino != self.inode or st.st_size < self.end_offset
+                or (st.st_mtime_ns != self.mtime_ns
+                    and (st.st_size <= self.end_offset
+                         or mood_storage.journal_check(self.end_offset, self.path) != self.check))):
+            self.close()
+            self._reset(st.st_ino)
+        if self._map is None or len(self._map) != st.st_size:
+            self.close()
+            if st.st_size:
+                self._file = open(self.path, 'rb')
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map is not None and st.st_size > self.end_offset:
+            self._scan(self.end_offset)
+            self.check = mood_storage.journal_check(self.end_offset, self.path)
+        if st.st_mtime_ns != self.mtime_ns:
+            self.mtime_ns = st.st_mtime_ns
+            self.dirty = True
+        return self
+
+    # Mencari baris lengkap mulai `pos` dan mencatat posisi + tanggalnya.
+    # Baris terakhir tanpa newline (sedang ditulis) dilewati dulu.
+    def _scan(self, pos):
+        mm = self._map
+        find, size = mm.find, len(mm)
+        while pos < size:
+            end = find(b'\n', pos)
+            if end < 0:
+                break
+            line = mm[pos:end].strip()
+            if line.startswith(b'{') and line.endswith(b'}'):
+                key = self._date_of(line)
+                if key is not None:
+                    entry_id = len(self.offsets)
+                    self.offsets.append(pos)
+                    self.dates.append(key)
+                    self._add_key(entry_id, key)
+            pos = end + 1
+        self.end_offset = pos
+        self.dirty = True
+
+    @staticmethod
+    def _date_of(line):
+        match = _DATE_RE.search(line)
+        try:
+            if match:
+                return mood_storage.date_key(match.group(1).decode('ascii'))
+            return mood_storage.date_key(json.loads(line)['date'])
+        except (ValueError, KeyError, TypeError, UnicodeDecodeError):
+            return None
+
+    # Seperti DateIndex: tambah di akhir, urutkan saat dibutuhkan
+    def _add_key(self, entry_id, key):
+        if self._sorted_len == len(self.keys) and (not self.keys or self.keys[-1] <= key):
+            self._sorted_len += 1
+        self.keys.append(key)
+        self.ids.append(entry_id)
+
+    def _ensure_sorted(self):
+        n = len(self.keys)
+        if self._sorted_len == n:
+            return
+        if n - self._sorted_len <= self.SORT_TAIL:
+            tail = list(zip(self.keys[self._sorted_len:], self.ids[self._sorted_len:]))
+            del self.keys[self._sorted_len:]
+            del self.ids[self._sorted_len:]
+            for key, entry_id in tail:
+                i = bisect.bisect_right(self.keys, key)
+                self.keys.insert(i, key)
+                self.ids.insert(i, entry_id)
+        else:
+            # Urut (tanggal, id) dengan satu kunci int gabungan, lebih cepat
+            # daripada sort dengan key=
+            order = sorted([(key << 32) | entry_id for key, entry_id in zip(self.keys, self.ids)])
+            self.keys = array('i', [k >> 32 for k in order])
+            self.ids = array('i', [k & 0xFFFFFFFF for k in order])
+        self._sorted_len = n
+
+    def __len__(self):
+        return len(self.offsets)
+
+    # Decode satu entri dari mmap
+    def entry(self, entry_id):
+        start = self.offsets[entry_id]
+        return json.loads(self._map[start:self._map.find(b'\n', start)])
+
+    def fetch(self, ids):
+        return [self.entry(i) for i in ids]
+
+    # Halaman ke-n (mulai 0) dalam urutan journal
+    def page(self, n, page_size=100):
+        lo = n * page_size
+        return self.fetch(range(lo, min(lo + page_size, len(self.offsets))))
+
+    # Id entri dengan start <= tanggal <= end (ordinal; None = tanpa batas),
+    # urut tanggal, sebagai array ringkas
+    def ids_between(self, start=None, end=None):
+        self._ensure_sorted()
+        lo = 0 if start is None else bisect.bisect_left(self.keys, start)
+        hi = len(self.keys) if end is None else bisect.bisect_right(self.keys, end)
+        return self.ids[lo:hi]
+
+
+_readers = {}
+
+# Pembaca journal untuk proses ini (satu per path), sudah disegarkan
+@mood_storage.locked
+def get_reader(path=mood_storage.JOURNAL_FILE):
+    reader = _readers.get(path)
+    if reader is None:
+        if path == mood_storage.JOURNAL_FILE:
+            mood_storage.migrate_json_to_journal()
+        reader = _readers[path] = JournalReader(path)
+    return reader.refresh()
+
+@mood_storage.locked
+def save_readers():
+    for reader in _readers.values():
+        reader.save()
+
+atexit.register(save_readers)
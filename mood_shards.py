@@ -0,0 +1,88 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import mood_storage
+
+# Alat untuk penyimpanan sharded (MOODTRACKER_STORAGE=sharded):
+#   data/<pengguna>/YYYY-MM.jsonl   satu journal per pengguna per bulan
+#   data/<pengguna>/manifest.json   ringkasan tiap shard (jumlah, tanggal, mood)
+# Contoh:
+#   python mood_shards.py migrate --user alice --source data.jsonl
+#   python mood_shards.py rebuild --workers 4
+#   python mood_shards.py list --user alice
+
+
+# Daftar pengguna yang punya folder shard
+def list_users(root=None):
+    root = root or mood_storage.SHARD_ROOT
+    try:
+        names = sorted(os.listdir(root))
+    except OSError:
+        return []
+    return [name for name in names if os.path.isdir(os.path.join(root, name))]
+
+# Memindahkan data satu file (journal atau data.json) ke shard pengguna
+def migrate(source, user=None, root=None):
+    directory = mood_storage.shard_dir(user, root)
+    if source.endswith('.json'):
+        entries = mood_storage.load_json(source)
+    else:
+        entries = list(mood_storage.read_journal(source))
+    mood_storage.write_shards(entries, directory)
+    return len(entries)
+
+# Membuat ulang manifest semua shard pengguna. Tiap shard diringkas terpisah,
+# jadi bisa dikerjakan paralel di beberapa proses (workers > 1).
+def rebuild_manifest(user=None, root=None, workers=1):
+    directory = mood_storage.shard_dir(user, root)
+    months = mood_storage.list_shards(directory)
+    paths = [mood_storage.shard_path(month, directory) for month in months]
+    if workers > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(workers) as pool:
+            summaries = list(pool.map(mood_storage.shard_summary, paths))
+    else:
+        summaries = [mood_storage.shard_summary(path) for path in paths]
+    shards = dict(zip(months, summaries))
+    if shards:
+        mood_storage._write_manifest(directory, shards)
+    return shards
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Alat penyimpanan sharded Mood Tracker")
+    parser.add_argument("--root", default=mood_storage.SHARD_ROOT, help="folder data (default: data)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("migrate", help="pindahkan data.jsonl/data.json ke shard pengguna")
+    p.add_argument("--user", default=mood_storage.SHARD_USER)
+    p.add_argument("--source", default=mood_storage.JOURNAL_FILE)
+
+    p = sub.add_parser("rebuild", help="buat ulang manifest (semua pengguna jika --user kosong)")
+    p.add_argument("--user")
+    p.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+
+    p = sub.add_parser("list", help="tampilkan isi manifest")
+    p.add_argument("--user")
+    args = parser.parse_args()
+
+    if args.command == "migrate":
+        if not os.path.exists(args.source):
+            parser.error(f"file tidak ditemukan: {args.source}")
+        count = migrate(args.source, args.user, args.root)
+        print(f"{count} entri dipindahkan ke {mood_storage.shard_dir(args.user, args.root)}")
+        return
+
+    users = [args.user] if args.user else list_users(args.root)
+    for user in users:
+        if args.command == "rebuild":
+            shards = rebuild_manifest(user, args.root, args.workers)
+            print(f"{user}: {len(shards)} shard, {sum(s['count'] for s in shards.values())} entri")
+        else:
+            shards = mood_storage.shard_manifest(mood_storage.shard_dir(user, args.root))
+            for month, s in shards.items():
+                print(f"{user}  {month}  {s['count']:6d} entri  {s['first']} .. {s['last']}")
+
+
+if __name__ == "__main__":
+    main()
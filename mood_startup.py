@@ -0,0 +1,152 @@
+import os
+import sys
+import time
+import tkinter as tk
+from datetime import date
+
+# Waktu modul ini diimpor. Front-end mengimpornya paling awal, jadi ini
+# dipakai sebagai titik nol pengukuran cold start.
+STARTED = time.perf_counter()
+
+LOGO_PATH = 'logo_unesa.png'  # Simpan logo di satu folder dengan file ini
+DEFER_MS = 10   # jeda setelah jendela tampil sebelum memuat modul berat
+
+
+# Menjalankan func() sekali, DEFER_MS setelah jendela (toplevel) milik
+# `widget` pertama kali tampil (event <Map>, seperti track_startup), jadi
+# impor tkcalendar/PIL tidak pernah mendahului jendela pertama
+def after_first_map(widget, func):
+    top = widget.winfo_toplevel()
+    if top.winfo_ismapped():
+        top.after(DEFER_MS, func)
+        return
+    done = []
+
+    def mapped(event):
+        if event.widget is not top or done:
+            return
+        done.append(True)
+        top.after(DEFER_MS, func)
+
+    top.bind('<Map>', mapped, add='+')
+
+
+# Input tanggal yang memakai DateEntry (tkcalendar) tanpa memperlambat
+# start-up: awalnya berupa Entry biasa berisi tanggal hari ini, lalu diganti
+# DateEntry setelah jendela tampil. Jika tkcalendar tidak terpasang, Entry
+# biasa tetap dipakai. Cukup panggil .pack() dan .get() seperti DateEntry.
+class LazyDateEntry:
+    def __init__(self, master, **options):
+        self.master = master
+        self.options = options
+        self.widget = tk.Entry(master, width=options.get('width', 12))
+        self.widget.insert(0, date.today().isoformat())
+        self._pack = {}
+
+    def pack(self, **pack_options):
+        self._pack = pack_options
+        self.widget.pack(**pack_options)
+        after_first_map(self.master, self._load)
+
+    def _load(self):
+        if not self.widget.winfo_exists():
+            return
+        try:
+            from tkcalendar import DateEntry  # Perlu instalasi: pip install tkcalendar
+        except ImportError:
+            return
+        value = self.widget.get()
+        entry = DateEntry(self.master, **self.options)
+        try:
+            entry.set_date(date.fromisoformat(value))
+        except ValueError:
+            pass
+        entry.pack(before=self.widget, **self._pack)
+        self.widget.destroy()
+        self.widget = entry
+
+    def get(self):
+        return self.widget.get()
+
+
+# Folder untuk thumbnail logo yang sudah diperkecil (opsional). Jika diisi,
+# thumbnail dibaca langsung oleh Tk tanpa PIL dan tanpa resize.
+LOGO_CACHE_DIR = os.environ.get('MOODTRACKER_LOGO_CACHE', '')
+
+_logo_source = {}   # path -> gambar PIL yang sudah didecode (sekali per proses)
+_logo_images = {}   # (path, size) -> PhotoImage (atau None jika gagal)
+
+# Nama file thumbnail; ikut mtime/ukuran sumber supaya logo baru tidak
+# tertukar dengan thumbnail lama
+def _thumbnail_path(path, size):
+    st = os.stat(path)
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(LOGO_CACHE_DIR, f"{name}-{size}-{st.st_size}-{st.st_mtime_ns}.png")
+
+# Membuat PhotoImage logo size x size: dari thumbnail jika ada, jika tidak
+# dari PNG sumber yang didecode sekali lalu diperkecil (dan disimpan sebagai
+# thumbnail bila LOGO_CACHE_DIR diisi). PIL baru diimpor di sini.
+def _render_logo(size, path):
+    thumb = _thumbnail_path(path, size) if LOGO_CACHE_DIR else None
+    if thumb and os.path.exists(thumb):
+        return tk.PhotoImage(file=thumb)
+    from PIL import Image, ImageTk  # Perlu instalasi: pip install pillow
+    source = _logo_source.get(path)
+    if source is None:
+        source = Image.open(path)
+        source.load()
+        _logo_source[path] = source
+    scaled = source.resize((size, size))
+    if thumb:
+        try:
+            os.makedirs(LOGO_CACHE_DIR, exist_ok=True)
+            scaled.save(thumb)
+        except OSError:
+            pass
+    return ImageTk.PhotoImage(scaled)
+
+# PhotoImage logo size x size, dibuat sekali per ukuran lalu dipakai ulang
+# oleh semua jendela. None jika PIL atau file logo tidak ada.
+def load_logo(size, path=LOGO_PATH):
+    key = (path, size)
+    if key not in _logo_images:
+        try:
+            _logo_images[key] = _render_logo(size, path)
+        except Exception:
+            _logo_images[key] = None
+    return _logo_images[key]
+
+# Menampilkan logo di `parent` (dengan .place(**place)) setelah jendela tampil
+def place_logo_later(parent, size, bg, **place):
+    def show():
+        if not parent.winfo_exists():
+            return
+        image = load_logo(size)
+        if image is not None:
+            label = tk.Label(parent, image=image, bg=bg)
+            label.image = image   # simpan referensi supaya gambar tidak hilang
+            label.place(**place)
+    after_first_map(parent, show)
+
+
+# Mengukur time-to-first-window: waktu dari STARTED sampai jendela utama
+# pertama kali tampil. Aktif jika MOODTRACKER_STARTUP_TIMING diset; hasilnya
+# dicetak ke stderr. Dengan nilai "exit" aplikasi langsung ditutup setelah
+# diukur (dipakai mood_bench.py --startup).
+def track_startup(root, name):
+    mode = os.environ.get('MOODTRACKER_STARTUP_TIMING')
+    if not mode:
+        return
+    done = []
+
+    def mapped(event):
+        if event.widget is not root or done:
+            return
+        done.append(True)
+        root.update_idletasks()
+        elapsed = (time.perf_counter() - STARTED) * 1000
+        print(f"startup {name}: first window {elapsed:.1f} ms", file=sys.stderr, flush=True)
+        if mode == 'exit':
+            root.after(0, root.destroy)
+
+    root.bind('<Map>', mapped, add='+')
@@ -0,0 +1,924 @@
+import bisect
+import functools
+import json
+import os
+import re
+import sqlite3
+import threading
+import zlib
+from datetime import date as date_cls, datetime
+
+from mood_metrics import timed
+
+DATA_FILE = 'data.json'        # Format lama: satu array JSON
+JOURNAL_FILE = 'data.jsonl'    # Format journal: satu entri per baris
+SQLITE_FILE = 'data.db'        # Format SQLite: tabel entries dengan index
+SQLITE_VERSION = 2             # PRAGMA user_version setelah database disiapkan
+
+# Mode penyimpanan: 'journal' (default), 'json' (format lama), 'sqlite'
+# atau 'sharded' (satu journal per pengguna per bulan)
+STORAGE_MODE = os.environ.get('MOODTRACKER_STORAGE', 'journal')
+
+# Mode sharded: data/<pengguna>/YYYY-MM.jsonl + data/<pengguna>/manifest.json
+SHARD_ROOT = os.environ.get('MOODTRACKER_DATA_DIR', 'data')
+SHARD_USER = os.environ.get('MOODTRACKER_USER', 'default')
+MANIFEST_FILE = 'manifest.json'
+
+
+# Kunci untuk cache, index dan koneksi SQLite; diperlukan karena data bisa
+# dibaca dari thread worker (mood_worker) dan dari thread Tk sekaligus
+lock = threading.RLock()
+
+# Dekorator: jalankan fungsi sambil memegang `lock`
+def locked(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with lock:
+            return func(*args, **kwargs)
+    return wrapper
+
+
+# Membuat dict entri dengan urutan kunci yang sama seperti data.json
+def make_entry(date, story, mood):
+    return {"date": date, "story": story, "mood": mood}
+
+# Kunci urutan tanggal (ordinal hari) untuk string 'YYYY-MM-DD'.
+# fromisoformat jauh lebih cepat; strptime untuk tanggal tanpa nol di depan.
+def date_key(date_str):
+    try:
+        return date_cls.fromisoformat(date_str).toordinal()
+    except ValueError:
+        return datetime.strptime(date_str, "%Y-%m-%d").toordinal()
+
+# Menyisipkan entri ke list yang sudah urut tanggal tanpa merusak urutan.
+# Jalur cepat untuk entri terbaru (di akhir), binary search untuk entri mundur.
+# Entri dengan tanggal sama diletakkan setelah entri yang sudah ada (stabil).
+def insert_sorted(entries, entry):
+    key = date_key(entry['date'])
+    if not entries or date_key(entries[-1]['date']) <= key:
+        entries.append(entry)
+    else:
+        i = bisect.bisect_right(entries, key, key=lambda e: date_key(e['date']))
+        entries.insert(i, entry)
+    return entries
+
+# Mengubah tanggal (string 'YYYY-MM-DD' atau date) menjadi string ISO
+def to_date_str(value):
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, date_cls):
+        # isoformat, bukan strftime: tahun < 1000 (misalnya date.min dari
+        # window_start) tetap empat digit
+        return value.isoformat()
+    return _iso(value)
+
+
+# ---------- Format lama (data.json) ----------
+
+# Membaca seluruh array dari data.json
+def load_json(path=DATA_FILE):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+# Menulis ulang seluruh array ke data.json
+def save_json(entries, path=DATA_FILE):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(entries, f, indent=2)
+
+
+# ---------- Format journal (data.jsonl) ----------
+
+# Membaca journal baris per baris (generator)
+def read_journal(path=JOURNAL_FILE):
+    try:
+        f = open(path, 'r', encoding='utf-8')
+    except OSError:
+        return
+    with f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                # Baris terakhir bisa terpotong jika program mati saat menulis
+                continue
+
+# Membaca journal mulai dari posisi byte tertentu.
+# Menghasilkan (entri, posisi awal baris, posisi akhir baris) untuk index.
+# Baris terakhir tanpa newline (sedang ditulis proses lain) dilewati dulu.
+def read_journal_offsets(path=JOURNAL_FILE, offset=0):
+    try:
+        f = open(path, 'rb')
+    except OSError:
+        return
+    with f:
+        f.seek(offset)
+        pos = offset
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            start = pos
+            pos += len(line)
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line), start, pos
+            except ValueError:
+                continue
+
+# Membaca entri journal dari posisi `offset` sampai baris lengkap terakhir.
+# Mengembalikan (entri, posisi setelah baris lengkap terakhir); baris yang
+# belum selesai ditulis dibaca lagi dari posisi itu lain kali.
+def read_journal_from(offset=0, path=JOURNAL_FILE):
+    entries = []
+    try:
+        f = open(path, 'rb')
+    except OSError:
+        return entries, offset
+    with f:
+        f.seek(offset)
+        pos = offset
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            pos += len(line)
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue
+    return entries, pos
+
+# Kode pemeriksa isi journal sampai posisi `end`: crc32 dari awal file dan
+# dari byte terakhir sebelum `end`. Menambah baris tidak mengubahnya, sedangkan
+# journal yang ditulis ulang (walau inode-nya dipakai lagi) hampir pasti beda.
+CHECK_BYTES = 256
+
+def journal_check(end, path=JOURNAL_FILE):
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(min(end, CHECK_BYTES))
+            f.seek(max(0, end - CHECK_BYTES))
+            tail = f.read(min(end, CHECK_BYTES))
+    except OSError:
+        return None
+    return zlib.crc32(head) << 32 | zlib.crc32(tail)
+
+# Membaca satu entri journal langsung dari posisi bytenya
+def read_journal_at(offset, path=JOURNAL_FILE):
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        return json.loads(f.readline())
+
+# Membaca banyak entri journal dari daftar posisi byte (file dibuka sekali)
+def read_journal_many(offsets, path=JOURNAL_FILE):
+    result = []
+    with open(path, 'rb') as f:
+        for offset in offsets:
+            f.seek(offset)
+            result.append(json.loads(f.readline()))
+    return result
+
+# Menulis baris-baris di akhir journal dalam satu kali tulis. Jika file tidak
+# diakhiri newline (baris terpotong karena program mati saat menulis), newline
+# ditambahkan dulu supaya baris baru tidak tersambung ke baris rusak itu.
+# Mengembalikan posisi byte awal baris pertama.
+def _append_lines(lines, path):
+    with open(path, 'a+b') as f:
+        pos = f.seek(0, os.SEEK_END)
+        prefix = b''
+        if pos:
+            f.seek(pos - 1)
+            if f.read(1) != b'\n':
+                prefix = b'\n'
+        f.write(prefix + b''.join(lines))
+    return pos + len(prefix)
+
+# Menambahkan satu entri sebagai satu baris di akhir journal.
+# Mengembalikan posisi byte awal dan akhir baris tersebut.
+def append_journal(entry, path=JOURNAL_FILE):
+    line = (json.dumps(entry) + '\n').encode('utf-8')
+    start = _append_lines([line], path)
+    return start, start + len(line)
+
+# Menambahkan banyak entri ke akhir journal dalam satu kali tulis.
+# Mengembalikan daftar (posisi awal, posisi akhir) tiap baris.
+def append_journal_many(entries, path=JOURNAL_FILE):
+    lines = [(json.dumps(entry) + '\n').encode('utf-8') for entry in entries]
+    pos = _append_lines(lines, path)
+    spans = []
+    for line in lines:
+        spans.append((pos, pos + len(line)))
+        pos += len(line)
+    return spans
+
+# Menulis ulang seluruh journal (dipakai save_entries dan migrasi)
+def write_journal(entries, path=JOURNAL_FILE):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + '\n')
+    os.replace(tmp_path, path)
+    # Index samping mood_mmap (path + '.off') tidak berlaku lagi
+    try:
+        os.remove(path + '.off')
+    except OSError:
+        pass
+
+# Migrasi satu kali dari data.json ke journal.
+# Tidak melakukan apa-apa jika journal sudah ada; data.json dibiarkan utuh.
+def migrate_json_to_journal(json_path=DATA_FILE, journal_path=JOURNAL_FILE):
+    if os.path.exists(journal_path) or not os.path.exists(json_path):
+        return False
+    write_journal(load_json(json_path), journal_path)
+    return True
+
+
+# ---------- Format sharded (data/<pengguna>/YYYY-MM.jsonl) ----------
+
+SHARD_RE = re.compile(r"^(\d{4}-\d{2})\.jsonl$")
+
+# Folder shard milik satu pengguna
+def shard_dir(user=None, root=None):
+    return os.path.join(root or SHARD_ROOT, user or SHARD_USER)
+
+# Tanggal dalam bentuk ISO 'YYYY-MM-DD' (juga untuk tanggal tanpa nol di depan)
+def _iso(date_str):
+    return date_cls.fromordinal(date_key(date_str)).isoformat()
+
+# Nama shard (bulan 'YYYY-MM') untuk sebuah tanggal
+def shard_month(date_str):
+    return _iso(date_str)[:7]
+
+def shard_path(month, directory=None):
+    return os.path.join(directory or shard_dir(), month + '.jsonl')
+
+# Ringkasan satu shard untuk manifest: jumlah entri, ukuran file, tanggal
+# pertama/terakhir dan jumlah per mood (untuk statistik tanpa membuka shard)
+def _add_to_summary(summary, entries):
+    moods = summary["moods"]
+    for entry in entries:
+        day = _iso(entry['date'])
+        summary["count"] += 1
+        if summary["first"] is None or day < summary["first"]:
+            summary["first"] = day
+        if summary["last"] is None or day > summary["last"]:
+            summary["last"] = day
+        moods[entry['mood']] = moods.get(entry['mood'], 0) + 1
+    return summary
+
+def shard_summary(path):
+    summary = {"count": 0, "size": 0, "first": None, "last": None, "moods": {}}
+    _add_to_summary(summary, read_journal(path))
+    try:
+        summary["size"] = os.path.getsize(path)
+    except OSError:
+        pass
+    return summary
+
+# (inode, ukuran, mtime) sebuah file; (None, 0, 0) jika tidak ada
+def _stat_key(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return (None, 0, 0)
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+# Menulis manifest; mengembalikan _stat_key manifest yang ditulis (diambil
+# sebelum os.replace, yang mempertahankan inode dan mtime)
+def _write_manifest(directory, shards):
+    tmp_path = os.path.join(directory, MANIFEST_FILE + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({"version": 1, "shards": dict(sorted(shards.items()))}, f, indent=1)
+    written = _stat_key(tmp_path)
+    os.replace(tmp_path, os.path.join(directory, MANIFEST_FILE))
+    return written
+
+# Daftar file shard (bulan) yang ada di folder
+def list_shards(directory=None):
+    try:
+        names = os.listdir(directory or shard_dir())
+    except OSError:
+        return []
+    return sorted(m.group(1) for m in map(SHARD_RE.match, names) if m)
+
+# Manifest shard {bulan: ringkasan}, urut bulan. Shard yang ukurannya tidak
+# cocok dengan manifest (misalnya disalin manual) diringkas ulang, begitu
+# juga manifest yang hilang atau rusak. Pengguna aktif yang belum punya
+# shard mendapat data lama (data.jsonl/data.json) lewat migrate_to_shards.
+def shard_manifest(directory=None):
+    directory = directory or shard_dir()
+    if directory == shard_dir():
+        migrate_to_shards(directory)
+    try:
+        with open(os.path.join(directory, MANIFEST_FILE), 'r', encoding='utf-8') as f:
+            shards = json.load(f)["shards"]
+    except (OSError, ValueError, KeyError):
+        shards = None
+    months = list_shards(directory)
+    changed = shards is None
+    shards = shards or {}
+    for month in list(shards):
+        if month not in months:
+            del shards[month]
+            changed = True
+    for month in months:
+        path = shard_path(month, directory)
+        summary = shards.get(month)
+        if summary is None or summary.get("size") != os.path.getsize(path):
+            shards[month] = shard_summary(path)
+            changed = True
+    if changed and months:
+        _write_manifest(directory, shards)
+    return dict(sorted(shards.items()))
+
+# Menambahkan entri ke shard bulannya masing-masing (satu kali tulis per
+# shard) lalu memperbarui manifest. Mengembalikan _stat_key manifest sebelum
+# dibaca dan yang ditulis di sini (untuk tanda tangan cache).
+def append_shards(entries, directory=None):
+    directory = directory or shard_dir()
+    os.makedirs(directory, exist_ok=True)
+    before = _stat_key(os.path.join(directory, MANIFEST_FILE))
+    shards = shard_manifest(directory)
+    groups = {}
+    for entry in entries:
+        groups.setdefault(shard_month(entry['date']), []).append(entry)
+    for month, group in groups.items():
+        spans = append_journal_many(group, shard_path(month, directory))
+        summary = shards.get(month) or {"count": 0, "size": 0, "first": None, "last": None, "moods": {}}
+        shards[month] = _add_to_summary(summary, group)
+        summary["size"] = spans[-1][1]
+    return before, _write_manifest(directory, shards)
+
+# Menulis ulang semua shard; shard bulan yang tidak lagi berisi entri dihapus
+def write_shards(entries, directory=None):
+    directory = directory or shard_dir()
+    os.makedirs(directory, exist_ok=True)
+    groups = {}
+    for entry in entries:
+        groups.setdefault(shard_month(entry['date']), []).append(entry)
+    for month in list_shards(directory):
+        if month not in groups:
+            os.remove(shard_path(month, directory))
+    shards = {}
+    for month, group in groups.items():
+        path = shard_path(month, directory)
+        write_journal(group, path)
+        shards[month] = _add_to_summary(
+            {"count": 0, "size": os.path.getsize(path), "first": None, "last": None, "moods": {}}, group)
+    _write_manifest(directory, shards)
+
+# Semua entri pengguna: shard urut bulan, isi shard sesuai urutan file
+def load_shards(directory=None):
+    directory = directory or shard_dir()
+    entries = []
+    for month in shard_manifest(directory):
+        entries.extend(read_journal(shard_path(month, directory)))
+    return entries
+
+# Bulan-bulan yang isinya bisa beririsan dengan rentang start..end
+# (string ISO atau None = tanpa batas), menurut tanggal di manifest
+def _months_between(shards, start, end):
+    return [month for month, s in shards.items() if s["count"]
+            and (start is None or s["last"] >= start) and (end is None or s["first"] <= end)]
+
+def _iso_or_none(value):
+    return None if value is None else _iso(to_date_str(value))
+
+# Entri di shard `months` dengan start <= tanggal <= end (ISO), urut tanggal
+def _read_between(months, start, end, directory):
+    result = []
+    for month in months:
+        for entry in read_journal(shard_path(month, directory)):
+            day = _iso(entry['date'])
+            if (start is None or day >= start) and (end is None or day <= end):
+                result.append(entry)
+    result.sort(key=lambda e: date_key(e['date']))
+    return result
+
+# Entri dengan start <= tanggal <= end, urut tanggal. Hanya shard yang
+# beririsan dengan rentang yang dibuka (minggu/bulan = satu atau dua shard).
+def shards_between(start=None, end=None, directory=None):
+    directory = directory or shard_dir()
+    start, end = _iso_or_none(start), _iso_or_none(end)
+    return _read_between(_months_between(shard_manifest(directory), start, end), start, end, directory)
+
+# Jumlah per mood di rentang tanggal: shard yang seluruhnya di dalam rentang
+# dihitung dari manifest, hanya shard di tepi rentang yang dibuka
+def shard_mood_counts(start=None, end=None, directory=None):
+    directory = directory or shard_dir()
+    start, end = _iso_or_none(start), _iso_or_none(end)
+    shards = shard_manifest(directory)
+    counts = {}
+    for month in _months_between(shards, start, end):
+        summary = shards[month]
+        if (start is None or summary["first"] >= start) and (end is None or summary["last"] <= end):
+            moods = summary["moods"].items()
+        else:
+            edge = {}
+            for entry in read_journal(shard_path(month, directory)):
+                day = _iso(entry['date'])
+                if (start is None or day >= start) and (end is None or day <= end):
+                    edge[entry['mood']] = edge.get(entry['mood'], 0) + 1
+            moods = edge.items()
+        for mood, count in moods:
+            counts[mood] = counts.get(mood, 0) + count
+    return counts
+
+# Jumlah entri per shard di rentang start..end: daftar (bulan, jumlah), urut
+# bulan, tanpa bulan kosong. Shard yang seluruhnya di dalam rentang dihitung
+# dari manifest, hanya shard di tepi rentang yang dibuka.
+def shard_range_counts(start=None, end=None, directory=None):
+    directory = directory or shard_dir()
+    start, end = _iso_or_none(start), _iso_or_none(end)
+    shards = shard_manifest(directory)
+    result = []
+    for month in _months_between(shards, start, end):
+        summary = shards[month]
+        if (start is None or summary["first"] >= start) and (end is None or summary["last"] <= end):
+            count = summary["count"]
+        else:
+            count = len(_read_between([month], start, end, directory))
+        if count:
+            result.append((month, count))
+    return result
+
+# Entri satu shard dengan start <= tanggal <= end, urut tanggal
+def shard_rows(month, start=None, end=None, directory=None):
+    directory = directory or shard_dir()
+    return _read_between([month], _iso_or_none(start), _iso_or_none(end), directory)
+
+# Entri terakhir (tanggal terbaru) di rentang tanggal: shard dibuka mundur
+# dari bulan terakhir sampai ada yang berisi entri di rentang
+def shard_latest(start=None, end=None, directory=None):
+    directory = directory or shard_dir()
+    start, end = _iso_or_none(start), _iso_or_none(end)
+    for month in reversed(_months_between(shard_manifest(directory), start, end)):
+        entries = _read_between([month], start, end, directory)
+        if entries:
+            return entries[-1]
+    return None
+
+# Migrasi satu kali dari data.jsonl/data.json ke shard pengguna aktif.
+# Tidak melakukan apa-apa jika pengguna sudah punya shard atau manifest
+# (juga jika semua entrinya sudah dihapus); file lama dibiarkan utuh.
+def migrate_to_shards(directory=None):
+    directory = directory or shard_dir()
+    if list_shards(directory) or os.path.exists(os.path.join(directory, MANIFEST_FILE)):
+        return False
+    if os.path.exists(JOURNAL_FILE):
+        entries = list(read_journal())
+    elif os.path.exists(DATA_FILE):
+        entries = load_json()
+    else:
+        return False
+    write_shards(entries, directory)
+    return True
+
+
+# ---------- Format SQLite (data.db) ----------
+
+_sqlite_conns = {}
+
+# Membuka (dan menyiapkan) database SQLite; koneksi disimpan per path
+@locked
+def connect_sqlite(path=SQLITE_FILE):
+    conn = _sqlite_conns.get(path)
+    if conn is not None:
+        return conn
+    conn = sqlite3.connect(path, check_same_thread=False)  # akses dijaga `lock`
+    conn.create_function('py_lower', 1, lambda s: s.lower() if s is not None else None)
+    conn.create_function('py_iso', 1, _iso)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS entries ("
+        " id INTEGER PRIMARY KEY,"
+        " date TEXT NOT NULL,"
+        " story TEXT NOT NULL,"
+        " mood TEXT NOT NULL)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_date ON entries(date, id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_mood ON entries(mood, date)")
+    try:
+        # Index trigram untuk pencarian substring (butuh SQLite >= 3.34 dengan FTS5)
+        conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5("
+            " story, content='entries', content_rowid='id', tokenize='trigram')"
+        )
+    except sqlite3.OperationalError:
+        pass
+    conn.commit()
+    _sqlite_conns[path] = conn
+    # user_version 0 = database baru. Migrasi dari data.jsonl/data.json di
+    # folder kerja hanya untuk data.db bawaan dan hanya sekali, supaya data
+    # lama tidak muncul lagi setelah semua entri dihapus.
+    # Versi < 2: tanggal tanpa nol di depan ('2025-6-5') diubah ke ISO, karena
+    # SQLite membandingkan tanggal sebagai teks.
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version < SQLITE_VERSION:
+        with conn:
+            if (version == 0 and path == SQLITE_FILE
+                    and conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0] == 0):
+                migrate_to_sqlite(conn)
+            conn.execute("UPDATE entries SET date = py_iso(date) WHERE length(date) != 10")
+            conn.execute(f"PRAGMA user_version = {SQLITE_VERSION}")
+    return conn
+
+# Menutup koneksi SQLite yang disimpan untuk `path`
+@locked
+def close_sqlite(path=SQLITE_FILE):
+    conn = _sqlite_conns.pop(path, None)
+    if conn is not None:
+        conn.close()
+
+# Cek apakah index trigram FTS5 tersedia di database ini
+def _has_fts(conn):
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='entries_fts'"
+    ).fetchone()
+    return row is not None
+
+# Menulis banyak entri (tanpa commit; dipanggil di dalam transaksi).
+# Tanggal disimpan dalam bentuk ISO supaya perbandingan teks di SQL benar.
+def _sqlite_insert_rows(conn, entries):
+    rows = [(_iso(e['date']), e['story'], e['mood']) for e in entries]
+    first_id = conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM entries").fetchone()[0]
+    conn.executemany("INSERT INTO entries(date, story, mood) VALUES (?, ?, ?)", rows)
+    if _has_fts(conn):
+        conn.execute(
+            "INSERT INTO entries_fts(rowid, story) SELECT id, story FROM entries WHERE id >= ?",
+            (first_id,),
+        )
+
+# Menulis banyak entri sekaligus dalam satu transaksi
+def _sqlite_insert_many(conn, entries):
+    with conn:
+        _sqlite_insert_rows(conn, entries)
+
+# Migrasi ke SQLite dari journal (atau data.json jika journal belum ada);
+# dipanggil connect_sqlite di dalam transaksinya
+def migrate_to_sqlite(conn):
+    if os.path.exists(JOURNAL_FILE):
+        entries = list(read_journal())
+    else:
+        entries = load_json()
+    if entries:
+        _sqlite_insert_rows(conn, entries)
+
+# Membaca semua entri dari SQLite sesuai urutan input
+def load_sqlite(conn):
+    rows = conn.execute("SELECT date, story, mood FROM entries ORDER BY id")
+    return [make_entry(*row) for row in rows]
+
+# Menulis ulang seluruh isi tabel entries
+def save_sqlite(conn, entries):
+    # Satu transaksi: jika salah satu INSERT gagal, data lama tetap utuh
+    with conn:
+        conn.execute("DELETE FROM entries")
+        if _has_fts(conn):
+            conn.execute("INSERT INTO entries_fts(entries_fts) VALUES ('delete-all')")
+        _sqlite_insert_rows(conn, entries)
+
+# Menyusun klausa WHERE untuk rentang tanggal
+def _sqlite_range(start, end):
+    where, params = [], []
+    if start is not None:
+        where.append("date >= ?")
+        params.append(to_date_str(start))
+    if end is not None:
+        where.append("date <= ?")
+        params.append(to_date_str(end))
+    return (" WHERE " + " AND ".join(where)) if where else "", params
+
+# Ambil entri dalam rentang tanggal memakai index idx_entries_date
+def sqlite_between(conn, start=None, end=None, limit=None, offset=0):
+    where, params = _sqlite_range(start, end)
+    sql = "SELECT date, story, mood FROM entries" + where + " ORDER BY date, id"
+    if limit is not None:
+        sql += " LIMIT ? OFFSET ?"
+        params += [limit, offset]
+    return [make_entry(*row) for row in conn.execute(sql, params)]
+
+# Jumlah entri di rentang tanggal
+def sqlite_count(conn, start=None, end=None):
+    where, params = _sqlite_range(start, end)
+    return conn.execute("SELECT COUNT(*) FROM entries" + where, params).fetchone()[0]
+
+# Entri terbaru di rentang tanggal (satu baris lewat index tanggal)
+def sqlite_latest(conn, start=None, end=None):
+    where, params = _sqlite_range(start, end)
+    row = conn.execute(
+        "SELECT date, story, mood FROM entries" + where + " ORDER BY date DESC, id DESC LIMIT 1",
+        params,
+    ).fetchone()
+    return make_entry(*row) if row else None
+
+# Jumlah entri per mood di rentang tanggal
+def sqlite_mood_counts(conn, start=None, end=None):
+    where, params = _sqlite_range(start, end)
+    rows = conn.execute("SELECT mood, COUNT(*) FROM entries" + where + " GROUP BY mood", params)
+    return dict(rows)
+
+# Cari cerita yang mengandung keyword; memakai index trigram jika bisa
+def sqlite_search(conn, keyword):
+    needle = keyword.lower()
+    if len(needle) >= 3 and _has_fts(conn):
+        phrase = '"' + needle.replace('"', '""') + '"'
+        rows = conn.execute(
+            "SELECT e.date, e.story, e.mood FROM entries_fts"
+            " JOIN entries e ON e.id = entries_fts.rowid"
+            " WHERE entries_fts MATCH ? ORDER BY e.date, e.id",
+            (phrase,),
+        )
+    else:
+        rows = conn.execute(
+            "SELECT date, story, mood FROM entries"
+            " WHERE instr(py_lower(story), ?) > 0 ORDER BY date, id",
+            (needle,),
+        )
+    # Cek ulang di Python supaya hasilnya sama persis dengan pencarian lama
+    return [make_entry(*row) for row in rows if needle in row[1].lower()]
+
+
+# ---------- API umum untuk semua front-end ----------
+
+# Pendengar perubahan data (dipakai index di mood_index supaya ikut ter-update)
+_append_listeners = []
+_rewrite_listeners = []
+_batch_listeners = []
+
+# Daftarkan fungsi(entry, start, end) yang dipanggil setiap append_entry.
+# start/end = posisi byte baris baru di journal (None untuk mode lain).
+def add_append_listener(func):
+    _append_listeners.append(func)
+
+# Daftarkan fungsi() yang dipanggil setiap kali seluruh data ditulis ulang
+def add_rewrite_listener(func):
+    _rewrite_listeners.append(func)
+
+# Daftarkan fungsi(entries, spans) yang dipanggil sekali untuk setiap
+# append_entries. spans = daftar (start, end) per entri (None untuk mode lain).
+def add_batch_listener(func):
+    _batch_listeners.append(func)
+
+# Membaca semua entri langsung dari penyimpanan (tanpa cache)
+def _read_entries():
+    if STORAGE_MODE == 'json':
+        return load_json()
+    if STORAGE_MODE == 'sqlite':
+        return load_sqlite(connect_sqlite())
+    if STORAGE_MODE == 'sharded':
+        return load_shards()
+    return list(read_journal())
+
+
+# Cache riwayat untuk seluruh proses. Cache dianggap masih berlaku selama
+# "tanda tangan" penyimpanan (inode/ukuran/mtime file, atau data_version
+# SQLite + counter tulis proses ini) tidak berubah. "end" = posisi byte
+# setelah baris journal lengkap terakhir yang sudah masuk cache, "check" =
+# journal_check(end) saat itu. "version" naik setiap kali urutan entri lama
+# di cache berubah (bukan sekadar bertambah di akhir), misalnya proses lain
+# menambah entri bertanggal mundur di mode sharded (shard dibaca urut bulan);
+# index yang memakai posisi entri sebagai id harus dibangun ulang.
+_cache = {"signature": None, "entries": [], "history": [], "end": 0, "check": 0, "version": 0}
+_generation = 0   # naik setiap kali proses ini menulis ke SQLite
+
+# Tanda tangan penyimpanan saat ini
+def _signature():
+    if STORAGE_MODE == 'sqlite':
+        conn = connect_sqlite()
+        version = conn.execute("PRAGMA data_version").fetchone()[0]
+        return ('sqlite', SQLITE_FILE, version, _generation)
+    if STORAGE_MODE == 'sharded':
+        # Manifest ditulis ulang setiap kali ada shard yang berubah
+        path = os.path.join(shard_dir(), MANIFEST_FILE)
+    else:
+        path = DATA_FILE if STORAGE_MODE == 'json' else JOURNAL_FILE
+    return (STORAGE_MODE, path) + _stat_key(path)
+
+# Tanda tangan penyimpanan setelah proses ini menambah entri, dibangun dari
+# posisi yang diketahui dicapai tulisan ini (bukan stat ulang), supaya
+# tulisan proses lain tepat sesudahnya tetap terlihat di refresh berikutnya.
+# None jika ada penulis lain sebelum tulisan ini (cache harus dibaca ulang).
+#   journal: `written` = (start, end) byte baris baru
+#   sharded: `written` = (stat manifest sebelum, stat manifest yang ditulis)
+#   sqlite:  data_version milik penulis lain tidak berubah oleh commit sendiri
+def _signature_after_write(cache, written=None):
+    cached = cache["signature"]
+    if STORAGE_MODE == 'journal':
+        start, end = written
+        if start != cache["end"]:
+            return None
+        signature = _signature()
+        if signature[3] != end:
+            signature = signature[:3] + (end, None)   # ekor sesudah `end` dibaca nanti
+        return signature
+    if STORAGE_MODE == 'sharded':
+        before, after = written
+        return cached[:2] + after if cached[2:] == before else None
+    if STORAGE_MODE == 'sqlite':
+        return cached[:3] + (_generation,)
+    return _signature()
+
+# Memastikan cache sesuai isi penyimpanan; hanya membaca disk jika berubah.
+# Journal yang hanya bertambah (inode sama, ukuran lebih besar) cukup dibaca
+# ekornya, mulai dari baris lengkap terakhir yang sudah dibaca, asalkan isi
+# sampai posisi itu masih sama (inode bisa dipakai lagi oleh file baru).
+@timed("load_storage")
+def _refresh_cache():
+    if STORAGE_MODE == 'journal':
+        migrate_json_to_journal()
+    elif STORAGE_MODE == 'sharded':
+        migrate_to_shards()
+    signature = _signature()
+    cached = _cache["signature"]
+    if signature == cached:
+        return _cache
+    if (STORAGE_MODE == 'journal' and cached is not None and cached[:3] == signature[:3]
+            and signature[3] > cached[3] and _cache["check"] == journal_check(_cache["end"])):
+        entries, history = _cache["entries"], _cache["history"]
+        tail, end = read_journal_from(_cache["end"])
+        for entry in tail:
+            entries.append(entry)
+            insert_sorted(history, entry)
+    else:
+        if STORAGE_MODE == 'journal':
+            entries, end = read_journal_from()
+        else:
+            entries, end = _read_entries(), 0
+        old = _cache["entries"]
+        if entries[:len(old)] != old:
+            _cache["version"] += 1
+        history = sorted(entries, key=lambda e: date_key(e['date']))
+    check = journal_check(end) if STORAGE_MODE == 'journal' else 0
+    _cache.update(signature=signature, entries=entries, history=history, end=end, check=check)
+    return _cache
+
+# Mengosongkan cache (berikutnya dibaca ulang dari disk)
+@locked
+def clear_cache():
+    _cache.update(signature=None, entries=[], history=[], end=0, check=0,
+                  version=_cache["version"] + 1)
+
+# Membaca semua entri sesuai mode penyimpanan (urutan sesuai file)
+@locked
+def load_entries():
+    return list(_refresh_cache()["entries"])
+
+# Membaca semua entri dalam urutan tanggal (stabil: urutan input untuk
+# tanggal yang sama). Cache menjaga urutan ini dengan insert_sorted.
+@locked
+def load_history():
+    return list(_refresh_cache()["history"])
+
+# Versi urutan cache dan entri mulai posisi `start` (urutan file), dari satu
+# kali refresh dan tanpa menyalin seluruh riwayat. Dipakai index untuk
+# menyusulkan entri baru; versi yang berubah berarti index harus diulang.
+@locked
+def entries_since(start):
+    cache = _refresh_cache()
+    return cache["version"], cache["entries"][start:]
+
+# Entri pada posisi `ids` dalam urutan file, langsung dari cache
+@locked
+def entries_at(ids):
+    entries = _refresh_cache()["entries"]
+    return [entries[i] for i in ids]
+
+# Menyimpan ulang semua entri sesuai mode penyimpanan
+@timed("save_entries")
+@locked
+def save_entries(entries):
+    global _generation
+    entries = list(entries)
+    if STORAGE_MODE == 'json':
+        save_json(entries)
+    elif STORAGE_MODE == 'sqlite':
+        save_sqlite(connect_sqlite(), entries)
+        _generation += 1
+    elif STORAGE_MODE == 'sharded':
+        write_shards(entries)
+    else:
+        write_journal(entries)
+    signature = _signature()
+    _cache.update(
+        signature=signature,
+        entries=entries,
+        history=sorted(entries, key=lambda e: date_key(e['date'])),
+        end=signature[3] if STORAGE_MODE == 'journal' else 0,
+        check=journal_check(signature[3]) if STORAGE_MODE == 'journal' else 0,
+        version=_cache["version"] + 1,
+    )
+    for func in _rewrite_listeners:
+        func()
+
+# Menambahkan satu entri; di mode journal cukup menulis satu baris
+@timed("append_entry")
+@locked
+def append_entry(date, story, mood):
+    global _generation
+    # ValueError untuk tanggal tidak valid, sebelum ada yang ditulis; tanggal
+    # tanpa nol di depan ('2025-6-5') disimpan sebagai ISO di semua mode
+    entry = make_entry(_iso(date), story, mood)
+    start = end = written = None
+    cache = _refresh_cache()
+    if STORAGE_MODE == 'json':
+        save_json(cache["entries"] + [entry])
+    elif STORAGE_MODE == 'sqlite':
+        _sqlite_insert_many(connect_sqlite(), [entry])
+        _generation += 1
+    elif STORAGE_MODE == 'sharded':
+        written = append_shards([entry])
+    else:
+        start, end = written = append_journal(entry)
+    # Perbarui cache di tempat jika tidak ada penulis lain di antaranya
+    signature = _signature_after_write(cache, written)
+    if signature is None:
+        clear_cache()
+    else:
+        cache["entries"].append(entry)
+        insert_sorted(cache["history"], entry)
+        cache["signature"] = signature
+        if end is not None:
+            cache["end"], cache["check"] = end, journal_check(end)
+    for func in _append_listeners:
+        func(entry, start, end)
+    return entry
+
+# Menambahkan banyak entri sekaligus (misalnya impor): satu kali tulis ke
+# penyimpanan dan satu kali pembaruan cache/index, bukan satu per entri
+@timed("append_entries")
+@locked
+def append_entries(entries):
+    global _generation
+    # Tanggal dinormalisasi ke ISO; tanggal tidak valid menolak seluruh batch
+    # sebelum ada yang ditulis
+    entries = [make_entry(_iso(e['date']), e['story'], e['mood']) for e in entries]
+    if not entries:
+        return entries
+    spans = [(None, None)] * len(entries)
+    written = None
+    cache = _refresh_cache()
+    if STORAGE_MODE == 'json':
+        save_json(cache["entries"] + entries)
+    elif STORAGE_MODE == 'sqlite':
+        _sqlite_insert_many(connect_sqlite(), entries)
+        _generation += 1
+    elif STORAGE_MODE == 'sharded':
+        written = append_shards(entries)
+    else:
+        spans = append_journal_many(entries)
+        written = (spans[0][0], spans[-1][1])
+    signature = _signature_after_write(cache, written)
+    if signature is None:
+        clear_cache()
+    else:
+        history = cache["history"]
+        keys = [date_key(e['date']) for e in entries]
+        in_order = (all(a <= b for a, b in zip(keys, keys[1:]))
+                    and (not history or date_key(history[-1]['date']) <= keys[0]))
+        cache["entries"].extend(entries)
+        history.extend(entries)
+        if not in_order:
+            # Sort stabil (timsort) cukup menggabungkan bagian-bagian yang sudah urut
+            history.sort(key=lambda e: date_key(e['date']))
+        cache["signature"] = signature
+        if STORAGE_MODE == 'journal':
+            cache["end"] = spans[-1][1]
+            cache["check"] = journal_check(cache["end"])
+    for func in _batch_listeners:
+        func(entries, spans)
+    return entries
+
+# Ambil entri dengan start <= tanggal <= end (None = tanpa batas), urut tanggal.
+# Versi tanpa index (memindai semua entri); lihat mood_index.entries_between.
+@locked
+def scan_between(start=None, end=None):
+    if STORAGE_MODE == 'sqlite':
+        return sqlite_between(connect_sqlite(), start, end)
+    if STORAGE_MODE == 'sharded':
+        return shards_between(start, end)
+    start = date_key(to_date_str(start)) if start is not None else None
+    end = date_key(to_date_str(end)) if end is not None else None
+    result = []
+    for entry in load_history():
+        day = date_key(entry['date'])
+        if (start is None or day >= start) and (end is None or day <= end):
+            result.append(entry)
+    return result
+
+# Cari cerita yang mengandung keyword (tidak peka huruf besar/kecil), urut tanggal.
+# Versi tanpa index; lihat mood_index.search_stories.
+@locked
+def scan_search(keyword):
+    if STORAGE_MODE == 'sqlite':
+        return sqlite_search(connect_sqlite(), keyword)
+    needle = keyword.lower()
+    return [e for e in load_history() if needle in e['story'].lower()]
@@ -0,0 +1,156 @@
+import tkinter as tk
+from tkinter import messagebox, ttk
+
+from mood_metrics import timed
+
+
+# Treeview virtual: hanya baris yang terlihat (ditambah sedikit cadangan)
+# yang benar-benar ada di widget. Saat digulir, isi baris yang sama diganti
+# dengan data dari posisi baru, dan data diambil dari `source` per halaman.
+#
+# `source` cukup punya __len__() dan rows(lo, hi) -> list entri,
+# misalnya mood_index.EntryRange. `row_values(entry)` mengubah entri
+# menjadi tuple nilai kolom.
+#
+# Jika `worker` (mood_worker.TkWorker) diberikan, halaman diambil di thread
+# worker: rows() memegang lock penyimpanan dan bisa menunggu pekerjaan lain,
+# jadi tidak dipanggil di thread Tk. Selama halaman belum datang barisnya
+# berisi LOADING_VALUES. Jika source punya reopen() dan rows() melempar
+# LookupError (data ditulis ulang, id lama tidak berlaku), source dibuka
+# ulang dan tabel dimulai lagi dengan jumlah entri yang baru.
+class VirtualTreeview:
+    PAGE_SIZE = 200      # jumlah entri per pengambilan data
+    MAX_PAGES = 20       # halaman yang disimpan di memori
+    BUFFER_ROWS = 5      # baris cadangan di bawah area yang terlihat
+    LOADING_VALUES = ('...',)
+
+    def __init__(self, master, source, columns, row_values, height=10, worker=None):
+        self.source = source
+        self.row_values = row_values
+        self.worker = worker
+        self.total = len(source)
+        self.offset = 0
+        self._pages = {}
+        self._requested = set()   # nomor halaman yang sedang diambil worker
+        self._iids = []
+
+        self.tree = ttk.Treeview(master, columns=columns, show='headings', height=height)
+        self.scrollbar = ttk.Scrollbar(master, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self._visible = height
+
+        self.tree.bind('<Configure>', self._on_resize)
+        self.tree.bind('<MouseWheel>', self._on_wheel)
+        self.tree.bind('<Button-4>', lambda e: self.scroll(-3))
+        self.tree.bind('<Button-5>', lambda e: self.scroll(3))
+        self.tree.bind('<Prior>', lambda e: self.scroll(-self._visible))
+        self.tree.bind('<Next>', lambda e: self.scroll(self._visible))
+        self.refresh()
+
+    # Halaman ke-page_no dari source; (source, entri). Dengan worker,
+    # dijalankan di thread worker.
+    def _load_page(self, source, page_no):
+        lo = page_no * self.PAGE_SIZE
+        try:
+            return source, source.rows(lo, lo + self.PAGE_SIZE)
+        except LookupError:
+            if not hasattr(source, 'reopen'):
+                raise
+            source = source.reopen()
+            return source, source.rows(lo, lo + self.PAGE_SIZE)
+
+    # Menyimpan halaman hasil _load_page. Jika source dibuka ulang, halaman
+    # lama dibuang dan posisi gulir disesuaikan dengan jumlah entri baru.
+    def _store_page(self, page_no, source, page):
+        if source is not self.source:
+            self.source = source
+            self.total = len(source)
+            self.offset = max(0, min(self.offset, self.total - self._visible))
+            self._pages.clear()
+        if len(self._pages) >= self.MAX_PAGES:
+            self._pages.pop(next(iter(self._pages)))
+        self._pages[page_no] = page
+
+    def _on_page(self, requested_source, page_no, result):
+        self._requested.discard(page_no)
+        if requested_source is not self.source:
+            return   # halaman dari source yang sudah diganti
+        self._store_page(page_no, *result)
+        self.refresh()
+
+    def _on_page_error(self, page_no, error):
+        self._requested.discard(page_no)
+        messagebox.showerror("Error", f"Gagal memuat data: {error}")
+
+    # Mengambil satu entri lewat cache halaman; None jika halamannya masih
+    # diambil worker
+    def _entry(self, i):
+        page_no = i // self.PAGE_SIZE
+        page = self._pages.get(page_no)
+        if page is None:
+            if self.worker is not None:
+                if page_no not in self._requested:
+                    self._requested.add(page_no)
+                    source = self.source
+                    self.worker.submit(self._load_page, source, page_no, owner=self.tree,
+                                       on_done=lambda result: self._on_page(source, page_no, result),
+                                       on_error=lambda error: self._on_page_error(page_no, error))
+                return None
+            self._store_page(page_no, *self._load_page(self.source, page_no))
+            if i >= self.total:
+                return None
+            page = self._pages[page_no]
+        return page[i - page_no * self.PAGE_SIZE]
+
+    # Mengisi ulang baris-baris widget sesuai posisi gulir sekarang
+    @timed("populate_table")
+    def refresh(self):
+        source = self.source
+        wanted = max(0, min(self._visible + self.BUFFER_ROWS, self.total - self.offset))
+        while len(self._iids) < wanted:
+            self._iids.append(self.tree.insert('', tk.END, values=()))
+        while len(self._iids) > wanted:
+            self.tree.delete(self._iids.pop())
+        for n, iid in enumerate(self._iids):
+            entry = self._entry(self.offset + n)
+            self.tree.item(iid, values=self.LOADING_VALUES if entry is None else self.row_values(entry))
+        if self.source is not source:
+            return self.refresh()   # dibuka ulang di tengah jalan (tanpa worker)
+        if self.total:
+            first = self.offset / self.total
+            last = min(self.offset + self._visible, self.total) / self.total
+            self.scrollbar.set(first, last)
+        else:
+            self.scrollbar.set(0, 1)
+
+    # Menggulir sejumlah baris (negatif = ke atas)
+    def scroll(self, rows):
+        self.scroll_to(self.offset + rows)
+        return 'break'
+
+    # Melompat ke baris tertentu
+    def scroll_to(self, offset):
+        offset = max(0, min(int(offset), self.total - self._visible))
+        if offset != self.offset:
+            self.offset = offset
+            self.refresh()
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == 'moveto':
+            self.scroll_to(float(amount) * self.total)
+        elif unit == 'pages':
+            self.scroll(int(amount) * self._visible)
+        else:
+            self.scroll(int(amount))
+
+    def _on_wheel(self, event):
+        return self.scroll(-3 if event.delta > 0 else 3) if event.delta else None
+
+    # Menyesuaikan jumlah baris dengan tinggi widget
+    def _on_resize(self, event):
+        style = ttk.Style(self.tree)
+        row_height = int(style.lookup('Treeview', 'rowheight') or 20)
+        visible = max(1, (event.height - row_height) // row_height)
+        if visible != self._visible:
+            self._visible = visible
+            self.scroll_to(self.offset)
+            self.refresh()
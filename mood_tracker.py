@@ -1,36 +1,27 @@
 import tkinter as tk
 from tkinter import messagebox, simpledialog
-import json
-from datetime import datetime
+from mood_index import search_stories, window_start, latest_entry, mood_summary
+from mood_storage import load_history, append_entry, date_key
+from mood_metrics import timed
+from mood_worker import TkWorker, loading_label
 
-DATA_FILE = 'data.json'
+# load_data, sort_by_date dan search_by_keyword tidak dipanggil GUI lagi;
+# hanya dipakai mood_bench sebagai pembanding versi lama.
 
-# Fungsi untuk membaca data dari file
+# Fungsi untuk membaca data dari penyimpanan (sudah urut tanggal)
 def load_data():
     try:
-        with open(DATA_FILE, 'r') as f:
-            return json.load(f)
+        return load_history()
     except:
         return []
 
-# Fungsi untuk menyimpan data ke file
-def save_data(data):
-    with open(DATA_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
-
-# Tambah entri baru
+# Tambah entri baru (cukup menambah satu baris di journal)
 def add_entry(date, story, mood):
-    data = load_data()
-    data.append({
-        "date": date,
-        "story": story,
-        "mood": mood
-    })
-    save_data(data)
-
-# Urutkan data berdasarkan tanggal
+    append_entry(date, story, mood)
+
+# Urutkan data berdasarkan tanggal (tiap tanggal di-parse sekali)
 def sort_by_date(data):
-    return sorted(data, key=lambda x: datetime.strptime(x['date'], "%Y-%m-%d"))
+    return sorted(data, key=lambda x: date_key(x['date']))
 
 # Cari cerita yang mengandung keyword
 def search_by_keyword(data, keyword):
@@ -41,6 +32,7 @@ class MoodTrackerApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Mood Tracker")
+        self.worker = TkWorker(root)
 
         self.frame = tk.Frame(root, bg="#fdf1d0", padx=30, pady=30)
         self.frame.pack()
@@ -99,15 +91,22 @@ class MoodTrackerApp:
             messagebox.showerror("Format salah", "Isi tanggal dengan benar (angka)")
             return
 
-        add_entry(date, story, mood)
-        messagebox.showinfo("Tersimpan", "Mood kamu sudah disimpan!")
+        def selesai(_):
+            messagebox.showinfo("Tersimpan", "Mood kamu sudah disimpan!")
+
+            # Kosongkan input
+            self.day_entry.delete(0, tk.END)
+            self.month_entry.delete(0, tk.END)
+            self.year_entry.delete(0, tk.END)
+            self.story_entry.delete(0, tk.END)
+            self.mood_var.set("")
+
+        # Simpan di thread worker supaya GUI tidak membeku
+        def gagal(error):
+            messagebox.showerror("Error", "Tanggal harus berformat YYYY-MM-DD."
+                                 if isinstance(error, ValueError) else f"Gagal menyimpan: {error}")
 
-        # Kosongkan input
-        self.day_entry.delete(0, tk.END)
-        self.month_entry.delete(0, tk.END)
-        self.year_entry.delete(0, tk.END)
-        self.story_entry.delete(0, tk.END)
-        self.mood_var.set("")
+        self.worker.submit(add_entry, date, story, mood, on_done=selesai, on_error=gagal)
 
     # Pilih tampilan riwayat: mingguan atau bulanan
     def show_history(self):
@@ -127,50 +126,53 @@ class MoodTrackerApp:
         top = tk.Toplevel(self.root)
         top.title("Riwayat")
 
+        loading = loading_label(top)
         text_area = tk.Text(top, wrap=tk.WORD, width=50, height=20)
         text_area.pack()
 
-        data = sort_by_date(load_data())
+        # Rekap 7 hari atau 30 hari terakhir (dari rekap mood, tanpa membaca
+        # entri), dihitung di thread worker supaya jendela tetap responsif
+        start = window_start(7 if mode == "week" else 30)
 
-        mood_count = {"😌":0, "🙂":0, "😍":0, "😞":0, "😡":0}
-        stories = []
+        def muat():
+            return mood_summary(["😌", "🙂", "😍", "😞", "😡"], start)["counts"], latest_entry(start)
 
-        # Ambil data terakhir 7 hari atau 30 hari
-        if mode == "week":
-            filtered = data[-7:]
-        else:
-            filtered = data[-30:]
+        @timed("populate_history")
+        def tampilkan(result):
+            loading.destroy()
+            mood_count, last = result
+            summary = "Ini adalah curhatan user.\n"
+            if last:
+                summary += f"Contoh cerita: {last['story']}\n"
+            summary += "\nRekapan mood:\n"
+            for mood, count in mood_count.items():
+                summary += f"{mood} : {count} kali\n"
 
-        for entry in filtered:
-            mood_count[entry['mood']] += 1
-            stories.append(entry['story'])
+            summary += "\nKata-kata hari ini :\n"
+            if last:
+                summary += f"{last['story']}\n"
+            else:
+                summary += "(Belum ada data)\n"
 
-        summary = "Ini adalah curhatan user.\n"
-        if filtered:
-            summary += f"Contoh cerita: {filtered[-1]['story']}\n"
-        summary += "\nRekapan mood:\n"
-        for mood, count in mood_count.items():
-            summary += f"{mood} : {count} kali\n"
+            text_area.insert(tk.END, summary)
 
-        summary += "\nKata-kata hari ini :\n"
-        if stories:
-            summary += f"{stories[-1]}\n"
-        else:
-            summary += "(Belum ada data)\n"
+        self.worker.submit(muat, on_done=tampilkan, owner=top)
 
-        text_area.insert(tk.END, summary)
-
-        # Tombol cari keyword
+        # Tombol cari keyword (pencarian berjalan di thread worker)
         def cari():
             keyword = simpledialog.askstring("Cari Cerita", "Masukkan keyword:")
-            if keyword:
-                result = search_by_keyword(data, keyword)
+            if not keyword:
+                return
+
+            def tampilkan_hasil(result):
                 hasil = f"Hasil pencarian '{keyword}':\n"
                 for r in result:
                     hasil += f"{r['date']} - {r['mood']} - {r['story']}\n"
                 text_area.delete("1.0", tk.END)
                 text_area.insert(tk.END, hasil)
 
+            self.worker.submit(search_stories, keyword, on_done=tampilkan_hasil, owner=top)
+
         tk.Button(top, text="Cari Cerita", command=cari).pack(pady=5)
 
 # Jalankan aplikasi
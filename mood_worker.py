@@ -0,0 +1,88 @@
+import queue
+import threading
+import tkinter as tk
+from tkinter import messagebox
+
+
+# Satu pekerjaan yang dijalankan di thread worker
+class Job:
+    def __init__(self, func, args, on_done, on_error):
+        self.func = func
+        self.args = args
+        self.on_done = on_done
+        self.on_error = on_error
+        self.cancelled = False
+
+    # Membatalkan pekerjaan: jika belum jalan, tidak akan dijalankan;
+    # jika sudah selesai, hasilnya tidak dikirim ke callback
+    def cancel(self):
+        self.cancelled = True
+
+
+# Menjalankan pekerjaan berat (baca data, sort, statistik, simpan) di luar
+# main loop Tk. Hasil dikirim balik ke thread Tk lewat polling root.after,
+# karena widget Tk hanya boleh disentuh dari thread utama.
+class TkWorker:
+    POLL_MS = 30
+
+    def __init__(self, root, workers=1):
+        self.root = root
+        self._jobs = queue.Queue()
+        self._results = queue.Queue()
+        self._pending = 0
+        self._polling = False
+        for _ in range(workers):
+            threading.Thread(target=self._run, daemon=True).start()
+
+    # Menjadwalkan func(*args) di thread worker. on_done(hasil) atau
+    # on_error(exception) dipanggil di thread Tk. Jika `owner` (misalnya
+    # jendela Toplevel) ditutup, pekerjaan otomatis dibatalkan.
+    def submit(self, func, *args, on_done=None, on_error=None, owner=None):
+        job = Job(func, args, on_done, on_error)
+        if owner is not None:
+            owner.bind('<Destroy>', lambda e: job.cancel() if e.widget is owner else None, add='+')
+        self._pending += 1
+        self._jobs.put(job)
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.POLL_MS, self._poll)
+        return job
+
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            result = error = None
+            if not job.cancelled:
+                try:
+                    result = job.func(*job.args)
+                except Exception as e:
+                    error = e
+            self._results.put((job, result, error))
+
+    def _poll(self):
+        while True:
+            try:
+                job, result, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._pending -= 1
+            if job.cancelled:
+                continue
+            if error is None:
+                if job.on_done:
+                    job.on_done(result)
+            elif job.on_error:
+                job.on_error(error)
+            else:
+                messagebox.showerror("Error", f"Terjadi kesalahan: {error}")
+        if self._pending:
+            self.root.after(self.POLL_MS, self._poll)
+        else:
+            self._polling = False
+
+
+# Label "Memuat..." sederhana; panggil .destroy() setelah data siap
+def loading_label(parent, text="Memuat data...", **options):
+    label = tk.Label(parent, text=text, font=('Arial', 10, 'italic'), **options)
+    label.pack(pady=10)
+    return label
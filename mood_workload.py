@@ -0,0 +1,182 @@
+import argparse
+import json
+import os
+import random
+from datetime import date, timedelta
+from itertools import accumulate
+
+import mood_storage
+
+# Dua set emoji yang dipakai front-end beserta bobot bawaannya
+EMOJI_SETS = {
+    "moodtracker": ["😄", "😩", "😐", "😢", "😡"],    # moodtracker1/2/3.py
+    "mood_tracker": ["😌", "🙂", "😍", "😞", "😡"],   # mood_tracker.py, ujicobamoodtracker3.py
+}
+DEFAULT_WEIGHTS = [35, 20, 25, 12, 8]
+
+# Tanggal terakhir bawaan. Sengaja tetap (bukan hari ini) supaya seed yang
+# sama menghasilkan file yang sama kapan pun dijalankan.
+DEFAULT_END = date(2025, 6, 30)
+
+# Parameter pembuatan dicatat di out/workload.json
+WORKLOAD_FILE = "workload.json"
+
+# Kosakata dasar cerita; bisa diperbesar dengan kata sintetis (--vocab-size)
+BASE_VOCAB = (
+    "hari ini aku kamu kami teman keluarga kerja kuliah tugas ujian rapat kantor "
+    "rumah makan pagi siang sore malam tidur bangun lelah senang sedih marah "
+    "bosan santai olahraga jalan hujan cerah macet belajar main musik film "
+    "kopi teh nasi pulang pergi libur minggu senin jumat dosen atasan proyek "
+    "selesai gagal berhasil capek semangat bahagia kecewa tenang rindu sakit "
+    "sehat lari buku baca tulis cerita lagi sangat sedikit banyak akhirnya"
+).split()
+SYLLABLES = [c + v for c in "bdklmnrst" for v in "aeiou"]
+
+
+# Kosakata sebanyak `size` kata: kata dasar ditambah kata sintetis dari suku kata
+def build_vocab(size, rng):
+    vocab = list(BASE_VOCAB[:size])
+    seen = set(vocab)
+    while len(vocab) < size:
+        word = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+        if word not in seen:
+            seen.add(word)
+            vocab.append(word)
+    return vocab
+
+# Membaca bobot mood dari teks "😄=5,😩=2,..." (None = bobot bawaan per set)
+def parse_weights(text):
+    if not text:
+        return None
+    weights = {}
+    for item in text.split(","):
+        mood, _, weight = item.partition("=")
+        weights[mood.strip()] = float(weight)
+    return weights
+
+
+# Menghasilkan entri satu pengguna selama `days` hari sampai `end` (urut tanggal).
+# - fill: peluang pengguna menulis di suatu hari
+# - per_day: jumlah entri maksimum per hari
+# - stickiness: peluang mood sama dengan entri sebelumnya (mood cenderung bertahan)
+# - panjang cerita min_words..max_words kata, kata dipilih dengan distribusi
+#   Zipf (kata awal kosakata lebih sering muncul)
+def generate_entries(rng, days, end, moods, weights, vocab, min_words=3, max_words=30,
+                     fill=0.8, per_day=1, stickiness=0.3):
+    word_weights = [1 / (rank + 1) for rank in range(len(vocab))]
+    cum_words = list(accumulate(word_weights))
+    cum_moods = list(accumulate(weights))
+    first = end - timedelta(days=days - 1)
+    last_mood = None
+    for offset in range(days):
+        if rng.random() >= fill:
+            continue
+        day = (first + timedelta(days=offset)).isoformat()
+        for _ in range(rng.randint(1, per_day)):
+            if last_mood is not None and rng.random() < stickiness:
+                mood = last_mood
+            else:
+                mood = rng.choices(moods, cum_weights=cum_moods)[0]
+            length = rng.randint(min_words, max_words)
+            story = " ".join(rng.choices(vocab, cum_weights=cum_words, k=length))
+            last_mood = mood
+            yield {"date": day, "story": story.capitalize(), "mood": mood}
+
+
+# File data untuk format penyimpanan tertentu di folder `directory`
+def storage_path(directory, fmt):
+    name = {"journal": mood_storage.JOURNAL_FILE, "json": mood_storage.DATA_FILE,
+            "sqlite": mood_storage.SQLITE_FILE, "sharded": mood_storage.MANIFEST_FILE}[fmt]
+    return os.path.join(directory, name)
+
+# Menulis entri langsung dalam format penyimpanan (journal ditulis streaming)
+def write_entries(entries, directory, fmt):
+    os.makedirs(directory, exist_ok=True)
+    path = storage_path(directory, fmt)
+    if fmt == "journal":
+        mood_storage.write_journal(entries, path)
+    elif fmt == "json":
+        mood_storage.save_json(list(entries), path)
+    elif fmt == "sharded":
+        # Folder pengguna langsung menjadi folder shard (YYYY-MM.jsonl + manifest)
+        mood_storage.write_shards(entries, directory)
+    else:
+        if os.path.exists(path):
+            os.remove(path)
+        mood_storage.save_sqlite(mood_storage.connect_sqlite(path), entries)
+        mood_storage.close_sqlite(path)
+    return path
+
+
+# Membuat beban kerja N pengguna x M hari di `out/<pengguna>/`. Tiap pengguna
+# memakai salah satu set emoji (bergantian jika emoji_set="both"), kecuali
+# mood_weights ({mood: bobot}) diberikan, dan RNG sendiri dari (seed, nomor
+# pengguna), jadi hasilnya sama untuk seed dan end yang sama. Semua
+# parameter dicatat di out/WORKLOAD_FILE.
+# Mengembalikan daftar (path, jumlah entri).
+def generate_workload(out, users, days, fmts=("journal",), seed=0, emoji_set="both",
+                      mood_weights=None, vocab_size=len(BASE_VOCAB), end=DEFAULT_END,
+                      shuffle=False, **options):
+    vocab = build_vocab(vocab_size, random.Random(seed))
+    set_names = sorted(EMOJI_SETS) if emoji_set == "both" else [emoji_set]
+    written = []
+    for user in range(users):
+        if mood_weights:
+            moods, weights = list(mood_weights), list(mood_weights.values())
+        else:
+            moods, weights = EMOJI_SETS[set_names[user % len(set_names)]], DEFAULT_WEIGHTS
+        rng = random.Random(f"{seed}:{user}")
+        entries = list(generate_entries(rng, days, end, moods, weights, vocab, **options))
+        if shuffle:
+            # Urutan input acak, seperti data hasil impor/backfill
+            rng.shuffle(entries)
+        directory = os.path.join(out, f"user{user + 1:04d}")
+        for fmt in fmts:
+            written.append((write_entries(entries, directory, fmt), len(entries)))
+    params = {"users": users, "days": days, "end": end.isoformat(), "formats": list(fmts),
+              "seed": seed, "emoji_set": emoji_set, "mood_weights": mood_weights,
+              "vocab_size": vocab_size, "shuffle": shuffle, **options}
+    with open(os.path.join(out, WORKLOAD_FILE), "w", encoding="utf-8") as f:
+        json.dump(params, f, ensure_ascii=False, indent=2)
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generator riwayat mood sintetis")
+    parser.add_argument("--out", default="workload", help="folder tujuan (default: workload)")
+    parser.add_argument("--users", type=int, default=1)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--end", type=date.fromisoformat, default=DEFAULT_END,
+                        help=f"tanggal terakhir (default: {DEFAULT_END}, tetap supaya hasil bisa diulang)")
+    parser.add_argument("--format", default="journal",
+                        help="journal, json, sqlite, sharded (boleh beberapa, dipisah koma)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--emoji-set", default="both", choices=["both"] + sorted(EMOJI_SETS))
+    parser.add_argument("--moods", help="bobot mood, misalnya \"😄=5,😩=2,😐=3\" (mengganti --emoji-set)")
+    parser.add_argument("--fill", type=float, default=0.8, help="peluang menulis per hari")
+    parser.add_argument("--per-day", type=int, default=1, help="entri maksimum per hari")
+    parser.add_argument("--stickiness", type=float, default=0.3,
+                        help="peluang mood sama dengan entri sebelumnya")
+    parser.add_argument("--min-words", type=int, default=3)
+    parser.add_argument("--max-words", type=int, default=30)
+    parser.add_argument("--vocab-size", type=int, default=len(BASE_VOCAB))
+    parser.add_argument("--shuffle", action="store_true", help="tulis entri dalam urutan acak")
+    args = parser.parse_args()
+
+    fmts = [f.strip() for f in args.format.split(",")]
+    for fmt in fmts:
+        if fmt not in ("journal", "json", "sqlite", "sharded"):
+            parser.error(f"format tidak dikenal: {fmt}")
+    written = generate_workload(
+        args.out, args.users, args.days, fmts, args.seed, args.emoji_set,
+        parse_weights(args.moods), args.vocab_size, args.end, args.shuffle,
+        min_words=args.min_words, max_words=args.max_words, fill=args.fill,
+        per_day=args.per_day, stickiness=args.stickiness,
+    )
+    total = sum(n for _, n in written) // len(fmts)
+    print(f"{len(written)} file ditulis di {args.out} ({total} entri per format, "
+          f"sampai {args.end}, parameter di {WORKLOAD_FILE})")
+
+
+if __name__ == "__main__":
+    main()
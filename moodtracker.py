@@ -0,0 +1,160 @@
+import argparse
+import json
+import sys
+from datetime import date
+
+from mood_export import export_csv
+from mood_import import KNOWN_MOODS, import_entries, validate_entry
+from mood_index import EntryRange, mood_counts, search_stories, search_words, window_start
+from mood_storage import append_entry
+
+# Versi baris perintah (tanpa GUI) untuk cron job dan pipeline.
+# Sengaja tidak mengimpor tkinter/tkcalendar/PIL supaya cepat dan bisa
+# jalan tanpa display. Contoh:
+#   python moodtracker.py add "Hari ini lancar" 😄 --date 2025-06-01
+#   python moodtracker.py list --days 7
+#   python moodtracker.py stats --from 2025-01-01 --to 2025-06-30
+#   python moodtracker.py search kerja --json
+#   python moodtracker.py search "kerj kera" --words
+#   python moodtracker.py export juni.csv --from 2025-06-01 --to 2025-06-30
+
+
+# Tipe argumen tanggal YYYY-MM-DD
+def iso_date(value):
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"tanggal '{value}' bukan format YYYY-MM-DD")
+
+# Tipe argumen jumlah hari (bilangan bulat >= 0)
+def day_count(value):
+    try:
+        days = int(value)
+    except ValueError:
+        days = -1
+    if days < 0:
+        raise argparse.ArgumentTypeError(f"'{value}' bukan jumlah hari (bilangan bulat >= 0)")
+    return days
+
+# Rentang tanggal dari --from/--to atau --days
+def date_range(args):
+    start = window_start(args.days) if args.days is not None else args.start
+    return start, args.end
+
+# Menulis satu entri ke stdout (teks atau satu baris JSON)
+def print_entry(entry, as_json):
+    if as_json:
+        print(json.dumps({"date": entry['date'], "story": entry['story'], "mood": entry['mood']}, ensure_ascii=False))
+    else:
+        print(f"{entry['date']}  {entry['mood']}  {entry['story']}")
+
+
+def cmd_add(args):
+    entry = {"date": (args.date or date.today()).isoformat(), "story": args.story, "mood": args.mood}
+    error = validate_entry(entry, None if args.any_mood else KNOWN_MOODS)
+    if error:
+        sys.exit(f"Gagal menyimpan: {error}")
+    append_entry(entry['date'], entry['story'], entry['mood'])
+    print(f"Tersimpan: {entry['date']} {entry['mood']}")
+
+def cmd_list(args):
+    # Dibaca per potong lewat index tanggal, jadi rentang besar tetap hemat memori
+    for entry in EntryRange(*date_range(args)):
+        print_entry(entry, args.json)
+
+def cmd_stats(args):
+    start, end = date_range(args)
+    counts = mood_counts(start, end)
+    total = sum(counts.values())
+    sorted_mood = sorted(counts.items(), key=lambda x: x[1], reverse=True)
+    if args.json:
+        print(json.dumps({
+            "from": start.isoformat() if start else None,
+            "to": end.isoformat() if end else None,
+            "total": total,
+            "counts": dict(sorted_mood),
+            "most_common": sorted_mood[0][0] if sorted_mood else "",
+        }, ensure_ascii=False))
+        return
+    print(f"Total entri: {total}")
+    for mood, count in sorted_mood:
+        print(f"{mood} : {count} kali ({count / total * 100:.1f}%)")
+
+def cmd_search(args):
+    result = search_words(args.keyword) if args.words else search_stories(args.keyword)
+    for entry in result:
+        print_entry(entry, args.json)
+    if not result and not args.json:
+        print("Tidak ditemukan.", file=sys.stderr)
+
+def cmd_export(args):
+    start, end = date_range(args)
+    if args.path == '-':
+        count = export_csv(sys.stdout, start, end)
+    else:
+        count = export_csv(args.path, start, end)
+    print(f"{count} entri diekspor", file=sys.stderr)
+
+def cmd_import(args):
+    try:
+        count, errors = import_entries(args.path, args.format, None if args.any_mood else KNOWN_MOODS,
+                                       args.skip_invalid)
+    except (OSError, ValueError) as e:
+        sys.exit(f"Gagal mengimpor: {e}")
+    for error in errors:
+        print(f"Dilewati: {error}", file=sys.stderr)
+    print(f"{count} entri diimpor")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="moodtracker", description="Mood Tracker tanpa GUI")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    # Opsi rentang tanggal yang dipakai list/stats/export
+    range_opts = argparse.ArgumentParser(add_help=False)
+    range_opts.add_argument("--from", dest="start", type=iso_date, help="tanggal awal (YYYY-MM-DD)")
+    range_opts.add_argument("--to", dest="end", type=iso_date, help="tanggal akhir (YYYY-MM-DD)")
+    range_opts.add_argument("--days", type=day_count, help="hanya N hari terakhir")
+
+    p = sub.add_parser("add", help="tambah entri")
+    p.add_argument("story")
+    p.add_argument("mood")
+    p.add_argument("--date", type=iso_date, help="default: hari ini")
+    p.add_argument("--any-mood", action="store_true", help="terima mood di luar daftar emoji")
+    p.set_defaults(func=cmd_add)
+
+    p = sub.add_parser("list", parents=[range_opts], help="tampilkan entri urut tanggal")
+    p.add_argument("--json", action="store_true", help="satu objek JSON per baris")
+    p.set_defaults(func=cmd_list)
+
+    p = sub.add_parser("stats", parents=[range_opts], help="jumlah per mood")
+    p.add_argument("--json", action="store_true")
+    p.set_defaults(func=cmd_stats)
+
+    p = sub.add_parser("search", help="cari cerita (substring, tidak peka huruf besar/kecil)")
+    p.add_argument("keyword")
+    p.add_argument("--words", action="store_true",
+                   help="cari per kata lewat index kata: semua kata harus ada, boleh awalan")
+    p.add_argument("--json", action="store_true", help="satu objek JSON per baris")
+    p.set_defaults(func=cmd_search)
+
+    p = sub.add_parser("export", parents=[range_opts], help="ekspor ke CSV (Tanggal,Mood,Cerita)")
+    p.add_argument("path", help="file tujuan, atau - untuk stdout")
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser("import", help="impor massal dari CSV atau JSON")
+    p.add_argument("path")
+    p.add_argument("--format", choices=["csv", "json"])
+    p.add_argument("--skip-invalid", action="store_true")
+    p.add_argument("--any-mood", action="store_true")
+    p.set_defaults(func=cmd_import)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,93 +1,25 @@
+# Diimpor paling awal: menjadi titik nol pengukuran cold start
+from mood_startup import LazyDateEntry, place_logo_later, track_startup
 import tkinter as tk
 from tkinter import messagebox, simpledialog
-from tkcalendar import DateEntry  # Perlu instalasi: pip install tkcalendar
-from PIL import Image, ImageTk    # Perlu instalasi: pip install pillow
-import json
-from datetime import datetime
-
-DATA_FILE = 'data.json'
-LOGO_PATH = 'logo_unesa.png'  # Simpan logo di satu folder dengan file ini
-
-# Node untuk LinkedList
-class Node:
-    def __init__(self, data):
-        self.data = data
-        self.next = None
-
-# Struktur data dinamis: LinkedList
-class MoodLinkedList:
-    def __init__(self):
-        self.head = None
-        self.size = 0
-
-    # Menambahkan node baru ke akhir list
-    def append(self, data):
-        new_node = Node(data)
-        if not self.head:
-            self.head = new_node
-        else:
-            curr = self.head
-            while curr.next:
-                curr = curr.next
-            curr.next = new_node
-        self.size += 1
-
-    # Mengubah linked list ke list biasa
-    def to_list(self):
-        result = []
-        curr = self.head
-        while curr:
-            result.append(curr.data)
-            curr = curr.next
-        return result
-
-    # Bubble sort manual berdasarkan tanggal
-    def sort_by_date(self):
-        data_list = self.to_list()
-        n = len(data_list)
-        for i in range(n):
-            for j in range(0, n-i-1):
-                d1 = datetime.strptime(data_list[j]['date'], "%Y-%m-%d")
-                d2 = datetime.strptime(data_list[j+1]['date'], "%Y-%m-%d")
-                if d1 > d2:
-                    data_list[j], data_list[j+1] = data_list[j+1], data_list[j]
-        self.head = None
-        self.size = 0
-        for item in data_list:
-            self.append(item)
-
-    # Linear search berdasarkan keyword di cerita
-    def search_by_keyword(self, keyword):
-        results = MoodLinkedList()
-        curr = self.head
-        while curr:
-            if keyword.lower() in curr.data['story'].lower():
-                results.append(curr.data)
-            curr = curr.next
-        return results
-
-# Membaca data dari file JSON ke linked list
+from mood_index import search_stories, window_start, latest_entry, mood_summary
+from mood_linkedlist import MoodLinkedList
+from mood_storage import load_history, append_entry
+from mood_metrics import timed
+from mood_worker import TkWorker, loading_label
+
+
+# Membaca data dari penyimpanan ke linked list. Tidak dipanggil GUI lagi;
+# hanya dipakai mood_bench sebagai pembanding.
 def load_data():
     try:
-        with open(DATA_FILE, 'r') as f:
-            data = json.load(f)
-            mood_list = MoodLinkedList()
-            for item in data:
-                mood_list.append(item)
-            return mood_list
+        return MoodLinkedList.from_iterable(load_history())
     except:
         return MoodLinkedList()
 
-# Menyimpan linked list ke file JSON
-def save_data(mood_list):
-    with open(DATA_FILE, 'w') as f:
-        json.dump(mood_list.to_list(), f, indent=2)
-
 # Menambahkan entri mood ke list dan simpan
 def add_entry(date, story, mood):
-    mood_list = load_data()
-    mood_list.append({"date": date, "story": story, "mood": mood})
-    save_data(mood_list)
+    append_entry(date, story, mood)
 
 # GUI utama
 class MoodTrackerApp:
@@ -103,18 +35,13 @@ class MoodTrackerApp:
         self.button_color = "#f0c38e"
 
         self.root.configure(bg=self.bg_color)
+        self.worker = TkWorker(root)
 
         self.frame = tk.Frame(root, bg=self.bg_color, padx=30, pady=30)
         self.frame.pack(fill=tk.BOTH, expand=True)
 
         # Tambahkan logo UNESA
-        try:
-            logo = Image.open(LOGO_PATH)
-            logo = logo.resize((50, 50))
-            self.logo_img = ImageTk.PhotoImage(logo)
-            tk.Label(self.root, image=self.logo_img, bg=self.bg_color).place(relx=1.0, x=-60, y=10, anchor='ne')
-        except:
-            pass  # jika logo gagal dimuat, tidak masalah
+        place_logo_later(self.root, 50, self.bg_color, relx=1.0, x=-60, y=10, anchor='ne')
 
         # Judul dan tujuan
         tk.Label(self.frame, text="Mood Tracker", font=('Arial', 20, 'bold'), bg=self.bg_color, fg=self.text_color).pack()
@@ -124,7 +51,7 @@ class MoodTrackerApp:
 
         # Input tanggal pakai calendar
         tk.Label(self.frame, text="Tanggal hari ini:", bg=self.bg_color, fg=self.text_color).pack()
-        self.date_entry = DateEntry(self.frame, width=12, background='darkblue', foreground='white', date_pattern='yyyy-mm-dd')
+        self.date_entry = LazyDateEntry(self.frame, width=12, background='darkblue', foreground='white', date_pattern='yyyy-mm-dd')
         self.date_entry.pack(pady=2)
 
         # Input cerita
@@ -166,10 +93,17 @@ class MoodTrackerApp:
             messagebox.showerror("Error", "Semua kolom harus diisi.")
             return
 
-        add_entry(date, story, mood)
-        messagebox.showinfo("Tersimpan", "Mood kamu sudah disimpan!")
-        self.story_entry.delete(0, tk.END)
-        self.mood_var.set("")
+        def selesai(_):
+            messagebox.showinfo("Tersimpan", "Mood kamu sudah disimpan!")
+            self.story_entry.delete(0, tk.END)
+            self.mood_var.set("")
+
+        # Simpan di thread worker supaya GUI tidak membeku
+        def gagal(error):
+            messagebox.showerror("Error", "Tanggal harus berformat YYYY-MM-DD."
+                                 if isinstance(error, ValueError) else f"Gagal menyimpan: {error}")
+
+        self.worker.submit(add_entry, date, story, mood, on_done=selesai, on_error=gagal)
 
     # Menampilkan riwayat data dan analisis mood
     def show_history(self):
@@ -178,56 +112,53 @@ class MoodTrackerApp:
         top.geometry("600x500")
         top.configure(bg=self.bg_color)
 
-        try:
-            logo = Image.open(LOGO_PATH)
-            logo = logo.resize((40, 40))
-            self.logo_img2 = ImageTk.PhotoImage(logo)
-            tk.Label(top, image=self.logo_img2, bg=self.bg_color).place(relx=1.0, x=-50, y=10, anchor='ne')
-        except:
-            pass
+        place_logo_later(top, 40, self.bg_color, relx=1.0, x=-50, y=10, anchor='ne')
 
+        loading = loading_label(top, bg=self.bg_color, fg=self.text_color)
         text_area = tk.Text(top, wrap=tk.WORD, width=70, height=25, bg="#fff9e6", fg=self.text_color)
         text_area.pack(pady=10, padx=10)
 
-        mood_list = load_data()
-        mood_list.sort_by_date()
-        data = mood_list.to_list()
+        # Statistik 30 hari terakhir langsung dari rekap mood, dihitung di
+        # thread worker supaya jendela tetap responsif
+        start = window_start(30)
 
-        mood_count = {m: 0 for m in self.mood_options}
-        stories = []
+        def muat():
+            return mood_summary(self.mood_options, start), latest_entry(start)
 
-        filtered = data[-30:] if len(data) >= 30 else data
-        for entry in filtered:
-            mood_count[entry['mood']] += 1
-            stories.append(entry['story'])
+        @timed("populate_history")
+        def tampilkan(result):
+            loading.destroy()
+            stats, last = result
+            total = stats["total"]
+            sorted_mood = stats["sorted"]
+            most_common = stats["most_common"]
 
-        total = sum(mood_count.values())
-        sorted_mood = sorted(mood_count.items(), key=lambda x: x[1], reverse=True)
-        most_common = sorted_mood[0][0] if sorted_mood else ""
+            summary = "=== Statistik Mood Bulanan ===\n\n"
+            for mood, count in sorted_mood:
+                percent = (count / total * 100) if total > 0 else 0
+                summary += f"{mood} ({self.mood_descriptions[mood]}): {count} kali ({percent:.1f}%)\n"
 
-        summary = "=== Statistik Mood Bulanan ===\n\n"
-        for mood, count in sorted_mood:
-            percent = (count / total * 100) if total > 0 else 0
-            summary += f"{mood} ({self.mood_descriptions[mood]}): {count} kali ({percent:.1f}%)\n"
+            summary += f"\nRata-rata mood kamu: {most_common} ({self.mood_descriptions.get(most_common, '-')})\n"
+            summary += f"\nMotivasi untukmu:\n{self.get_motivation(most_common)}\n"
 
-        summary += f"\nRata-rata mood kamu: {most_common} ({self.mood_descriptions.get(most_common, '-')})\n"
-        summary += f"\nMotivasi untukmu:\n{self.get_motivation(most_common)}\n"
+            if last:
+                summary += f"\n=== Cerita Terakhir ===\n{last['date']} - {last['mood']}\n{last['story']}\n"
 
-        if filtered:
-            last = filtered[-1]
-            summary += f"\n=== Cerita Terakhir ===\n{last['date']} - {last['mood']}\n{last['story']}\n"
+            text_area.insert(tk.END, summary)
+            text_area.config(state=tk.DISABLED)
 
-        text_area.insert(tk.END, summary)
-        text_area.config(state=tk.DISABLED)
+        self.worker.submit(muat, on_done=tampilkan, owner=top)
 
-        tk.Button(top, text="Cari Cerita", command=lambda: self.search_story(mood_list), bg=self.button_color).pack(pady=5)
+        tk.Button(top, text="Cari Cerita", command=self.search_story, bg=self.button_color).pack(pady=5)
 
-    # Memunculkan algoritma search (linear search)
-    def search_story(self, mood_list):
+    # Cari cerita lewat trigram index di thread worker (index dibangun di sana
+    # saat pertama dipakai, jadi GUI tidak membeku)
+    def search_story(self):
         keyword = simpledialog.askstring("Cari Cerita", "Masukkan kata kunci:")
-        if keyword:
-            result_list = mood_list.search_by_keyword(keyword)
-            result = result_list.to_list()
+        if not keyword:
+            return
+
+        def tampilkan(result):
             hasil = f"Hasil pencarian '{keyword}':\n\n"
             for r in result:
                 hasil += f"{r['date']} - {r['mood']}\n{r['story']}\n\n"
@@ -235,6 +166,8 @@ class MoodTrackerApp:
                 hasil += "Tidak ditemukan."
             messagebox.showinfo("Hasil Pencarian", hasil)
 
+        self.worker.submit(search_stories, keyword, on_done=tampilkan)
+
     # Memberi motivasi sesuai mood terbanyak
     def get_motivation(self, mood):
         motivasi = {
@@ -250,4 +183,5 @@ class MoodTrackerApp:
 if __name__ == "__main__":
     root = tk.Tk()
     app = MoodTrackerApp(root)
+    track_startup(root, "moodtracker1")
     root.mainloop()
@@ -1,84 +1,18 @@
+# Diimpor paling awal: menjadi titik nol pengukuran cold start
+from mood_startup import LazyDateEntry, place_logo_later, track_startup
 import tkinter as tk
-from tkinter import messagebox, simpledialog, ttk
-from tkcalendar import DateEntry
-from PIL import Image, ImageTk
-import json
+from tkinter import messagebox, simpledialog
 from datetime import datetime, timedelta
+from mood_export import export_csv
+from mood_index import search_stories, EntryRange, mood_summary
+from mood_storage import append_entry
+from mood_table import VirtualTreeview
+from mood_metrics import timed
+from mood_worker import TkWorker, loading_label
 
-DATA_FILE = 'data.json'
-LOGO_PATH = 'logo_unesa.png'
-
-class Node:
-    def __init__(self, data):
-        self.data = data
-        self.next = None
-
-class MoodLinkedList:
-    def __init__(self):
-        self.head = None
-        self.size = 0
-
-    def append(self, data):
-        new_node = Node(data)
-        if not self.head:
-            self.head = new_node
-        else:
-            curr = self.head
-            while curr.next:
-                curr = curr.next
-            curr.next = new_node
-        self.size += 1
-
-    def to_list(self):
-        result = []
-        curr = self.head
-        while curr:
-            result.append(curr.data)
-            curr = curr.next
-        return result
-
-    def sort_by_date(self):
-        data_list = self.to_list()
-        n = len(data_list)
-        for i in range(n):
-            for j in range(0, n-i-1):
-                d1 = datetime.strptime(data_list[j]['date'], "%Y-%m-%d")
-                d2 = datetime.strptime(data_list[j+1]['date'], "%Y-%m-%d")
-                if d1 > d2:
-                    data_list[j], data_list[j+1] = data_list[j+1], data_list[j]
-        self.head = None
-        self.size = 0
-        for item in data_list:
-            self.append(item)
-
-    def search_by_keyword(self, keyword):
-        results = MoodLinkedList()
-        curr = self.head
-        while curr:
-            if keyword.lower() in curr.data['story'].lower():
-                results.append(curr.data)
-            curr = curr.next
-        return results
-
-def load_data():
-    try:
-        with open(DATA_FILE, 'r') as f:
-            data = json.load(f)
-            mood_list = MoodLinkedList()
-            for item in data:
-                mood_list.append(item)
-            return mood_list
-    except:
-        return MoodLinkedList()
-
-def save_data(mood_list):
-    with open(DATA_FILE, 'w') as f:
-        json.dump(mood_list.to_list(), f, indent=2)
 
 def add_entry(date, story, mood):
-    mood_list = load_data()
-    mood_list.append({"date": date, "story": story, "mood": mood})
-    save_data(mood_list)
+    append_entry(date, story, mood)
 
 class MoodTrackerApp:
     def __init__(self, root):
@@ -92,17 +26,12 @@ class MoodTrackerApp:
         self.button_color = "#f0c38e"
 
         self.root.configure(bg=self.bg_color)
+        self.worker = TkWorker(root)
 
         self.frame = tk.Frame(root, bg=self.bg_color, padx=30, pady=30)
         self.frame.pack(fill=tk.BOTH, expand=True)
 
-        try:
-            logo = Image.open(LOGO_PATH)
-            logo = logo.resize((70, 70))
-            self.logo_img = ImageTk.PhotoImage(logo)
-            tk.Label(self.root, image=self.logo_img, bg=self.bg_color).place(relx=1.0, x=-10, y=10, anchor='ne')
-        except:
-            pass
+        place_logo_later(self.root, 70, self.bg_color, relx=1.0, x=-10, y=10, anchor='ne')
 
         tk.Label(self.frame, text="Mood Tracker", font=('Arial', 20, 'bold'), bg=self.bg_color, fg=self.text_color).pack()
         tk.Label(self.frame, text="Aplikasi ini membantu pengguna memantau kondisi emosional Anda dari waktu ke waktu\n"
@@ -110,7 +39,7 @@ class MoodTrackerApp:
                  font=('Arial', 10), bg=self.bg_color, fg=self.text_color, justify="center").pack(pady=5)
 
         tk.Label(self.frame, text="Tanggal hari ini:", bg=self.bg_color, fg=self.text_color).pack()
-        self.date_entry = DateEntry(self.frame, width=12, background='darkblue', foreground='white', date_pattern='yyyy-mm-dd')
+        self.date_entry = LazyDateEntry(self.frame, width=12, background='darkblue', foreground='white', date_pattern='yyyy-mm-dd')
         self.date_entry.pack(pady=2)
 
         tk.Label(self.frame, text="Ada cerita apa hari ini?", bg=self.bg_color, fg=self.text_color).pack()
@@ -148,10 +77,17 @@ class MoodTrackerApp:
             messagebox.showerror("Error", "Semua kolom harus diisi.")
             return
 
-        add_entry(date, story, mood)
-        messagebox.showinfo("Tersimpan", "Mood kamu sudah disimpan!")
-        self.story_entry.delete(0, tk.END)
-        self.mood_var.set("")
+        def selesai(_):
+            messagebox.showinfo("Tersimpan", "Mood kamu sudah disimpan!")
+            self.story_entry.delete(0, tk.END)
+            self.mood_var.set("")
+
+        # Simpan di thread worker supaya GUI tidak membeku
+        def gagal(error):
+            messagebox.showerror("Error", "Tanggal harus berformat YYYY-MM-DD."
+                                 if isinstance(error, ValueError) else f"Gagal menyimpan: {error}")
+
+        self.worker.submit(add_entry, date, story, mood, on_done=selesai, on_error=gagal)
 
     def show_history_options(self):
         top = tk.Toplevel(self.root)
@@ -168,22 +104,18 @@ class MoodTrackerApp:
                  bg=self.button_color, width=15).pack(side=tk.LEFT, padx=10, pady=10)
         tk.Button(button_frame, text="Bulanan", command=lambda: [top.destroy(), self.show_history("monthly")], 
                  bg=self.button_color, width=15).pack(side=tk.LEFT, padx=10, pady=10)
+        tk.Button(button_frame, text="Semua", command=lambda: [top.destroy(), self.show_history("all")], 
+                 bg=self.button_color, width=15).pack(side=tk.LEFT, padx=10, pady=10)
 
     def show_history(self, period_type):
         top = tk.Toplevel(self.root)
         # Corrected window title
-        top_title = "Riwayat Mingguan" if period_type == "weekly" else "Riwayat Bulanan"
+        top_title = {"weekly": "Riwayat Mingguan", "monthly": "Riwayat Bulanan"}.get(period_type, "Semua Riwayat")
         top.title(top_title)
         top.geometry("800x600")
         top.configure(bg=self.bg_color)
 
-        try:
-            logo = Image.open(LOGO_PATH)
-            logo = logo.resize((40, 40))
-            self.logo_img2 = ImageTk.PhotoImage(logo)
-            tk.Label(top, image=self.logo_img2, bg=self.bg_color).place(relx=1.0, x=-50, y=10, anchor='ne')
-        except:
-            pass
+        place_logo_later(top, 40, self.bg_color, relx=1.0, x=-50, y=10, anchor='ne')
 
         main_frame = tk.Frame(top, bg=self.bg_color)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
@@ -191,89 +123,95 @@ class MoodTrackerApp:
         stats_frame = tk.Frame(main_frame, bg=self.bg_color)
         stats_frame.pack(fill=tk.X, pady=10)
 
-        mood_list = load_data()
-        mood_list.sort_by_date()
-        data = mood_list.to_list()
-
         today = datetime.now().date()
         
         if period_type == "weekly":
             period_start = today - timedelta(days=7)
             period_title = "Mingguan"
-        else:  # monthly
+        elif period_type == "monthly":
             period_start = today - timedelta(days=30)
             period_title = "Bulanan"
-
-        period_data = [entry for entry in data 
-                      if datetime.strptime(entry['date'], "%Y-%m-%d").date() >= period_start]
-
-        mood_count = {m: 0 for m in self.mood_options}
-        for entry in period_data:
-            mood_count[entry['mood']] += 1
-
-        total = sum(mood_count.values())
-        sorted_mood = sorted(mood_count.items(), key=lambda x: x[1], reverse=True)
-        most_common = sorted_mood[0][0] if sorted_mood else ""
-
-        stats_text = tk.Text(stats_frame, wrap=tk.WORD, width=70, height=8, 
-                            bg="#fff9e6", fg=self.text_color, font=('Arial', 10))
-        stats_text.pack(fill=tk.X)
-
-        stats_summary = f"=== Statistik Mood {period_title} ===\n\n"
-        for mood, count in sorted_mood:
-            percent = (count / total * 100) if total > 0 else 0
-            stats_summary += f"{mood} ({self.mood_descriptions[mood]}): {count} kali ({percent:.1f}%)\n"
-
-        stats_summary += f"\nRata-rata mood kamu: {most_common} ({self.mood_descriptions.get(most_common, '-')})\n"
-        stats_summary += f"\nMotivasi untukmu:\n{self.get_motivation(most_common)}\n"
-
-        stats_text.insert(tk.END, stats_summary)
-        stats_text.config(state=tk.DISABLED)
-
-        history_frame = tk.Frame(main_frame, bg=self.bg_color)
-        history_frame.pack(fill=tk.BOTH, expand=True)
-
-        tree = ttk.Treeview(history_frame, columns=('Date', 'Mood', 'Story'), show='headings', height=10)
-        tree.heading('Date', text='Tanggal')
-        tree.heading('Mood', text='Mood')
-        tree.heading('Story', text='Cerita')
-        tree.column('Date', width=100)
-        tree.column('Mood', width=80)
-        tree.column('Story', width=300)
-
-        scrollbar = ttk.Scrollbar(history_frame, orient=tk.VERTICAL, command=tree.yview)
-        tree.configure(yscroll=scrollbar.set)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        tree.pack(fill=tk.BOTH, expand=True)
-
-        for entry in period_data:
-            tree.insert('', tk.END, values=(entry['date'], entry['mood'], entry['story']))
-
-        tk.Button(main_frame, text="Ekspor ke CSV", command=lambda: self.export_period_data(period_data, period_title), 
-                 bg=self.button_color).pack(pady=10)
-
-        tk.Button(main_frame, text="Cari Cerita", command=lambda: self.search_story(mood_list), 
-                 bg=self.button_color).pack(pady=5)
-
-    def export_period_data(self, period_data, period_title):
-        try:
-            filename = f"mood_{period_title.lower()}_{datetime.now().strftime('%Y%m%d')}.csv"
-            with open(filename, 'w') as f:
-                f.write("Tanggal,Mood,Cerita\n")
-                for entry in period_data:
-                    story = entry['story'].replace('"', '""')
-                    if ',' in story or '"' in story:
-                        story = f'"{story}"'
-                    f.write(f"{entry['date']},{entry['mood']},{story}\n")
-            messagebox.showinfo("Sukses", f"Data {period_title.lower()} berhasil diekspor ke {filename}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Gagal mengekspor data: {str(e)}")
-
-    def search_story(self, mood_list):
+        else:  # all
+            period_start = None
+            period_title = "Semua"
+
+        # Data periode dan statistik disiapkan di thread worker supaya
+        # jendela tetap responsif; hasilnya ditampilkan lewat tampilkan()
+        loading = loading_label(stats_frame, bg=self.bg_color, fg=self.text_color)
+
+        def muat():
+            # Filter periode lewat index tanggal (bisect); isi entri baru dibaca
+            # saat barisnya tampil di tabel
+            period_data = EntryRange(period_start)
+            # Statistik periode dari rekap mood (tidak menghitung ulang per entri)
+            stats = mood_summary(self.mood_options, period_start)
+            return period_data, stats
+
+        @timed("populate_history")
+        def tampilkan(result):
+            loading.destroy()
+            period_data, stats = result
+            total = stats["total"]
+            sorted_mood = stats["sorted"]
+            most_common = stats["most_common"]
+
+            stats_text = tk.Text(stats_frame, wrap=tk.WORD, width=70, height=8, 
+                                bg="#fff9e6", fg=self.text_color, font=('Arial', 10))
+            stats_text.pack(fill=tk.X)
+
+            stats_summary = f"=== Statistik Mood {period_title} ===\n\n"
+            for mood, count in sorted_mood:
+                percent = (count / total * 100) if total > 0 else 0
+                stats_summary += f"{mood} ({self.mood_descriptions[mood]}): {count} kali ({percent:.1f}%)\n"
+
+            stats_summary += f"\nRata-rata mood kamu: {most_common} ({self.mood_descriptions.get(most_common, '-')})\n"
+            stats_summary += f"\nMotivasi untukmu:\n{self.get_motivation(most_common)}\n"
+
+            stats_text.insert(tk.END, stats_summary)
+            stats_text.config(state=tk.DISABLED)
+
+            history_frame = tk.Frame(main_frame, bg=self.bg_color)
+            history_frame.pack(fill=tk.BOTH, expand=True)
+
+            # Tabel virtual: hanya baris yang terlihat yang dibuat di widget
+            table = VirtualTreeview(history_frame, period_data, ('Date', 'Mood', 'Story'),
+                                    lambda entry: (entry['date'], entry['mood'], entry['story']), height=10,
+                                    worker=self.worker)
+            tree = table.tree
+            tree.heading('Date', text='Tanggal')
+            tree.heading('Mood', text='Mood')
+            tree.heading('Story', text='Cerita')
+            tree.column('Date', width=100)
+            tree.column('Mood', width=80)
+            tree.column('Story', width=300)
+
+            table.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            tree.pack(fill=tk.BOTH, expand=True)
+
+            tk.Button(main_frame, text="Ekspor ke CSV", command=lambda: self.export_period_data(period_start, period_title), 
+                     bg=self.button_color).pack(pady=10)
+
+            tk.Button(main_frame, text="Cari Cerita", command=self.search_story, 
+                     bg=self.button_color).pack(pady=5)
+
+        self.worker.submit(muat, on_done=tampilkan, owner=top)
+
+    # Ekspor entri periode ke CSV secara streaming (lihat mood_export) di
+    # thread worker, jadi riwayat besar tidak perlu dimuat sekaligus
+    def export_period_data(self, period_start, period_title):
+        filename = f"mood_{period_title.lower()}_{datetime.now().strftime('%Y%m%d')}.csv"
+        self.worker.submit(
+            export_csv, filename, period_start,
+            on_done=lambda count: messagebox.showinfo("Sukses", f"Data {period_title.lower()} berhasil diekspor ke {filename}"),
+            on_error=lambda e: messagebox.showerror("Error", f"Gagal mengekspor data: {str(e)}"))
+
+    # Cari cerita lewat trigram index di thread worker
+    def search_story(self):
         keyword = simpledialog.askstring("Cari Cerita", "Masukkan kata kunci:")
-        if keyword:
-            result_list = mood_list.search_by_keyword(keyword)
-            result = result_list.to_list()
+        if not keyword:
+            return
+
+        def tampilkan(result):
             hasil = f"Hasil pencarian '{keyword}':\n\n"
             for r in result:
                 hasil += f"{r['date']} - {r['mood']}\n{r['story']}\n\n"
@@ -281,6 +219,8 @@ class MoodTrackerApp:
                 hasil += "Tidak ditemukan."
             messagebox.showinfo("Hasil Pencarian", hasil)
 
+        self.worker.submit(search_stories, keyword, on_done=tampilkan)
+
     def get_motivation(self, mood):
         motivasi = {
              "😄": "Wah keren sekali, tetap bahagia ya! Senyummu itu menular, semoga harimu selalu cerah!",
@@ -294,4 +234,5 @@ class MoodTrackerApp:
 if __name__ == "__main__":
     root = tk.Tk()
     app = MoodTrackerApp(root)
+    track_startup(root, "moodtracker2")
     root.mainloop()
\ No newline at end of file
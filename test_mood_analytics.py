@@ -0,0 +1,72 @@
+import random
+from datetime import date
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+import mood_analytics
+import mood_storage
+from mood_analytics import MoodArrays, counts, daily_counts, rolling_counts, summary, trend_report
+from mood_compact import MOOD_TABLE, mood_code
+from mood_index import mood_summary
+
+MOODS = ['😄', '😩', '😐', '😢']
+
+
+def _history(n, seed=12):
+    rng = random.Random(seed)
+    start = date(2024, 1, 1).toordinal()
+    entries = [{"date": date.fromordinal(start + rng.randint(0, 90)).isoformat(),
+                "story": str(i), "mood": rng.choice(MOODS)} for i in range(n)]
+    return sorted(entries, key=lambda e: e['date'])
+
+
+# Hasil vektor sama dengan rekap mood_index untuk rentang yang sama
+def test_summary_matches_mood_index(storage):
+    mood_storage.append_entries(_history(500))
+    arrays = MoodArrays.load()
+    assert len(arrays) == 500
+    for start, end in [(None, None), ('2024-01-10', '2024-02-15'), (date(2024, 3, 1), None),
+                       ('2025-01-01', None)]:
+        assert summary(arrays, MOODS, start, end) == mood_summary(MOODS, start, end)
+
+def test_counts_range_is_inclusive():
+    day = date(2024, 5, 1).toordinal()
+    arrays = MoodArrays([day, day, day + 1, day + 2], [mood_code('😄'), mood_code('😩'),
+                                                        mood_code('😄'), mood_code('😐')])
+    tally = counts(arrays, day + 1, day + 2)
+    assert tally.sum() == 2 and tally[MOOD_TABLE.index('😄')] == 1
+    assert mood_analytics.most_common(counts(arrays)) == '😄'
+    assert mood_analytics.most_common(counts(arrays, day + 5)) == ''
+
+
+# Jumlah bergulir sama dengan menjumlahkan jendela satu per satu
+def test_rolling_counts_match_naive_window():
+    entries = _history(300)
+    arrays = MoodArrays([mood_storage.date_key(e['date']) for e in entries],
+                        [mood_code(e['mood']) for e in entries])
+    first, daily = daily_counts(arrays)
+    assert first == mood_storage.date_key(entries[0]['date'])
+    assert daily.sum() == 300 and daily.shape[0] == mood_storage.date_key(entries[-1]['date']) - first + 1
+    for window in (1, 7, 30):
+        rolled = rolling_counts(daily, window)
+        for day in range(len(daily)):
+            expected = daily[max(0, day - window + 1):day + 1].sum(axis=0)
+            assert (rolled[day] == expected).all()
+
+def test_trend_report_percentages_and_dominant():
+    day = date(2024, 5, 1).toordinal()
+    arrays = MoodArrays([day, day, day + 3], [mood_code('😄'), mood_code('😄'), mood_code('😢')])
+    report = trend_report(arrays, windows=(2,))
+    window = report["windows"][2]
+    assert report["first_ordinal"] == day and len(report["daily"]) == 4
+    assert list(window["dominant"]) == [MOOD_TABLE.index('😄'), MOOD_TABLE.index('😄'), -1,
+                                        MOOD_TABLE.index('😢')]
+    assert window["percent"][0][MOOD_TABLE.index('😄')] == 100
+    assert window["percent"][2].sum() == 0
+
+def test_empty_history():
+    report = trend_report(MoodArrays([], []))
+    assert report["daily"].shape == (0, len(MOOD_TABLE))
+    assert len(report["windows"][7]["dominant"]) == 0
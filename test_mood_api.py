@@ -0,0 +1,108 @@
+import asyncio
+import json
+
+import pytest
+
+import mood_api
+from mood_api import HttpError, MoodApi, read_request
+
+
+def _read(data):
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        return await read_request(reader)
+    return asyncio.run(run())
+
+
+def test_read_request_parses_headers_and_body():
+    method, target, version, headers, body = _read(
+        b'POST /entries?x=1 HTTP/1.1\r\nHost: a\r\nContent-Type:  application/json \r\n'
+        b'Content-Length: 4\r\n\r\n{}{}extra')
+    assert (method, target, version) == ('POST', '/entries?x=1', 'HTTP/1.1')
+    assert headers == {'host': 'a', 'content-type': 'application/json', 'content-length': '4'}
+    assert body == b'{}{}'
+    assert _read(b'GET / HTTP/1.0\n\n')[3] == {}
+    assert _read(b'') is None
+
+@pytest.mark.parametrize('data, status', [
+    (b'GET /\r\n\r\n', 400),
+    (b'GET / HTTP/1.1\r\nContent-Length: abc\r\n\r\n', 400),
+    (b'GET / HTTP/1.1\r\nContent-Length: -1\r\n\r\n', 400),
+    (b'POST / HTTP/1.1\r\nContent-Length: %d\r\n\r\n' % (mood_api.MAX_BODY + 1), 413),
+])
+def test_read_request_rejects_bad_input(data, status):
+    with pytest.raises(HttpError) as exc:
+        _read(data)
+    assert exc.value.status == status
+
+def test_truncated_body_raises_incomplete_read():
+    with pytest.raises(asyncio.IncompleteReadError):
+        _read(b'POST / HTTP/1.1\r\nContent-Length: 10\r\n\r\nabc')
+
+def test_route():
+    api = MoodApi(workers=1)
+    assert api.route('GET', '/entries/?days=7') == (mood_api.list_entries, {'days': ['7']})
+    for method, target, status in [('GET', '/nope', 404), ('DELETE', '/entries', 405)]:
+        with pytest.raises(HttpError) as exc:
+            api.route(method, target)
+        assert exc.value.status == status
+    api.executor.shutdown()
+
+
+# Beberapa request di satu koneksi keep-alive lewat server sungguhan
+def test_keep_alive_session(storage):
+    requests = [
+        ('POST', '/entries', {"date": '2025-06-01', "story": 'kerja, lembur', "mood": '😩'}),
+        ('POST', '/entries', {"date": '2025-06-02', "story": 'libur', "mood": '😄'}),
+        ('POST', '/entries', {"story": 'x', "mood": 'bukan'}),
+        ('GET', '/entries?from=2025-06-02', None),
+        ('GET', '/stats?from=2025-06-01&to=2025-06-30', None),
+        ('GET', '/search?q=KERJA', None),
+        ('GET', '/entries?limit=x', None),
+    ]
+
+    async def run():
+        api = MoodApi(workers=2)
+        server = await asyncio.start_server(api.handle, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        responses = []
+        for method, target, payload in requests:
+            body = json.dumps(payload).encode() if payload is not None else b''
+            writer.write(f'{method} {target} HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n'.encode() + body)
+            await writer.drain()
+            status = int((await reader.readline()).split()[1])
+            headers = {}
+            while (line := await reader.readline()) != b'\r\n':
+                name, _, value = line.decode().partition(':')
+                headers[name.lower()] = value.strip()
+            assert headers['connection'] == 'keep-alive'
+            responses.append((status, json.loads(await reader.readexactly(int(headers['content-length'])))))
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        api.executor.shutdown()
+        return responses
+
+    responses = asyncio.run(run())
+    assert [s for s, _ in responses] == [201, 201, 400, 200, 200, 200, 400]
+    assert responses[0][1]["entry"]["story"] == 'kerja, lembur'
+    assert responses[3][1]["total"] == 1 and responses[3][1]["entries"][0]["story"] == 'libur'
+    assert responses[4][1]["counts"] == {'😩': 1, '😄': 1}
+    assert [e['story'] for e in responses[5][1]["entries"]] == ['kerja, lembur']
+    assert 'angka' in responses[6][1]["error"]
+
+
+# days yang melewati awal kalender berarti semua entri, bukan 500
+def test_huge_days_is_whole_history(storage):
+    from mood_storage import append_entry
+    append_entry('2025-06-01', 'satu', '😄')
+    query = {'days': ['99999999999999999999']}
+    assert mood_api.list_entries(query, b'', None)[1]["total"] == 1
+    assert mood_api.stats(query, b'', None)[1]["total"] == 1
+    assert mood_api.stats({'days': ['7']}, b'', None)[1]["from"] is not None
+    with pytest.raises(HttpError) as exc:
+        mood_api.list_entries({'days': ['-1']}, b'', None)
+    assert exc.value.status == 400
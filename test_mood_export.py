@@ -0,0 +1,40 @@
+import csv
+import io
+
+import pytest
+
+import mood_storage
+from mood_export import CSV_HEADER, export_csv, iter_csv_chunks
+from mood_import import load_import_file
+
+STORIES = ['biasa', 'koma, di tengah', 'kutip "ganda"', 'dua\nbaris', '=1+1']
+
+
+# Koma, tanda kutip dan baris baru di cerita dikutip sesuai CSV dan terbaca
+# kembali utuh oleh csv.reader (dan oleh impor)
+@pytest.mark.parametrize('mode', ['journal', 'sqlite', 'sharded'])
+def test_export_quotes_and_round_trips(storage, tmp_path, mode):
+    storage(mode)
+    for n, story in enumerate(STORIES):
+        mood_storage.append_entry(f'2025-06-0{n + 1}', story, '😄')
+    out = io.StringIO(newline='')
+    assert export_csv(out, '2025-06-02', '2025-06-04') == 3
+    text = out.getvalue()
+    assert text.startswith('Tanggal,Mood,Cerita\r\n')
+    assert '"koma, di tengah"' in text and '"kutip ""ganda"""' in text and '"dua\nbaris"' in text
+    rows = list(csv.reader(io.StringIO(text, newline='')))
+    assert rows[0] == CSV_HEADER
+    assert [r[2] for r in rows[1:]] == STORIES[1:4]
+
+    path = str(tmp_path / 'semua.csv')
+    assert export_csv(path) == len(STORIES)
+    entries, errors = load_import_file(path)
+    assert errors == [] and [e['story'] for e in entries] == STORIES
+
+
+def test_chunks_are_bounded(storage):
+    mood_storage.append_entries([{"date": f'2025-06-{d:02d}', "story": str(d), "mood": '😄'}
+                                 for d in range(1, 11)])
+    chunks = list(iter_csv_chunks(chunk_size=4))
+    assert [len(c) for c in chunks] == [4, 4, 2]
+    assert chunks[0][0] == ('2025-06-01', '😄', '1')
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+import mood_storage
+from mood_import import import_entries, load_import_file, validate_entry
+
+
+def _write(path, text):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(text)
+    return str(path)
+
+
+def test_validate_entry():
+    assert validate_entry({"date": '2025-06-01', "story": 'ok', "mood": '😄'}) is None
+    assert 'kosong' in validate_entry({"date": '2025-06-01', "story": '  ', "mood": '😄'})
+    assert 'kosong' in validate_entry({"date": '2025-06-01', "story": 3, "mood": '😄'})
+    assert 'YYYY-MM-DD' in validate_entry({"date": '2025-6-1', "story": 'a', "mood": '😄'})
+    assert 'YYYY-MM-DD' in validate_entry({"date": '2025-02-30', "story": 'a', "mood": '😄'})
+    assert 'tidak dikenal' in validate_entry({"date": '2025-06-01', "story": 'a', "mood": 'x'})
+    assert validate_entry({"date": '2025-06-01', "story": 'a', "mood": 'x'}, None) is None
+    assert validate_entry(['2025-06-01', 'a', '😄']) == "format entri tidak dikenal"
+
+
+# CSV hasil ekspor (BOM, koma dan baris baru di dalam cerita) terbaca utuh;
+# nomor baris di pesan kesalahan adalah baris file, bukan baris data
+def test_csv_rows_and_line_numbers(tmp_path):
+    path = _write(tmp_path / 'a.csv', '﻿Tanggal,Mood,Cerita\r\n'
+                  '2025-06-01,😄,"satu, dua\r\ntiga"\r\n'
+                  '\r\n'
+                  '2025-06-02,😄\r\n'
+                  '2025-13-01,😄,salah\r\n')
+    entries, errors = load_import_file(path)
+    assert entries == [{"date": '2025-06-01', "story": 'satu, dua\r\ntiga', "mood": '😄'}]
+    assert errors[0].startswith('baris 5: format') and errors[1].startswith('baris 6: tanggal')
+
+def test_csv_wrong_header_is_rejected(tmp_path):
+    path = _write(tmp_path / 'a.csv', 'date,mood,story\n2025-06-01,😄,a\n')
+    with pytest.raises(ValueError, match='Header'):
+        load_import_file(path)
+
+
+# Satu entri tidak valid: tidak ada yang ditulis, kecuali skip_invalid
+def test_import_is_all_or_nothing(storage, tmp_path):
+    path = _write(tmp_path / 'a.json', json.dumps([
+        {"date": '2025-06-02', "story": 'dua', "mood": '😄'},
+        {"date": '2025-06-01', "story": 'satu', "mood": '😄', "extra": 1},
+        {"date": '2025-06-03', "story": '', "mood": '😄'},
+    ]))
+    with pytest.raises(ValueError, match='1 entri tidak valid'):
+        import_entries(path)
+    assert mood_storage.load_entries() == []
+    count, errors = import_entries(path, skip_invalid=True)
+    assert count == 2 and errors == ["entri 3: kolom 'story' kosong atau bukan teks"]
+    mood_storage.clear_cache()
+    assert mood_storage.load_history() == [{"date": '2025-06-01', "story": 'satu', "mood": '😄'},
+                                           {"date": '2025-06-02', "story": 'dua', "mood": '😄'}]
+
+def test_json_must_be_an_array(tmp_path):
+    path = _write(tmp_path / 'a.json', '{"date": "2025-06-01"}')
+    with pytest.raises(ValueError, match='array'):
+        load_import_file(path)
@@ -0,0 +1,180 @@
+import json
+import os
+
+import pytest
+
+import mood_mmap
+import mood_storage
+from mood_index import EntryRange, entries_between, latest_entry, search_stories, search_words
+from mood_storage import append_entry, save_entries, scan_between, scan_search
+
+
+def _stories(entries):
+    return [e['story'] for e in entries]
+
+
+@pytest.mark.parametrize('mode', ['journal', 'json', 'sqlite', 'sharded'])
+def test_index_matches_scan(storage, mode):
+    storage(mode)
+    for n, day in enumerate([5, 1, 3, 1, 9, 2]):
+        append_entry(f'2025-06-0{day}', f'hari {n} kerja' if n % 2 else f'hari {n} libur', '😄')
+    assert search_stories('KERJA') == scan_search('kerja')
+    assert entries_between('2025-06-02', '2025-06-05') == scan_between('2025-06-02', '2025-06-05')
+    assert entries_between() == scan_between()
+    assert latest_entry()['date'] == '2025-06-09'
+    mood_storage.append_entries([{"date": '2025-06-04', "story": 'kerja impor', "mood": '😄'}])
+    assert search_stories('kerja') == scan_search('kerja')
+
+
+# Index GUI sudah dibangun, lalu proses lain menambah entri bertanggal mundur
+# (di mode sharded urutan file berubah) dan menulis ulang data
+@pytest.mark.parametrize('mode', ['journal', 'json', 'sharded'])
+def test_index_follows_other_process(storage, other_process, mode):
+    storage(mode)
+    append_entry('2025-06-10', 'kerja lembur', '😄')
+    append_entry('2025-06-11', 'rapat pagi', '😄')
+    assert _stories(search_stories('kerja')) == ['kerja lembur']
+
+    other_process("mood_storage.append_entry('2025-05-01', 'liburan pantai', '😄')")
+    assert _stories(search_stories('kerja')) == ['kerja lembur']
+    assert _stories(search_stories('liburan')) == ['liburan pantai']
+    assert _stories(search_words('pant')) == ['liburan pantai']
+
+    append_entry('2025-06-12', 'kerja lagi', '😄')
+    assert _stories(search_stories('kerja')) == ['kerja lembur', 'kerja lagi']
+
+    other_process("mood_storage.save_entries([e for e in mood_storage.load_entries()"
+                  " if 'rapat' not in e['story']])")
+    assert search_stories('rapat') == []
+    assert _stories(entries_between()) == ['liburan pantai', 'kerja lembur', 'kerja lagi']
+
+
+def test_rewrite_in_process_resets_indexes(storage):
+    append_entry('2025-06-01', 'kerja', '😄')
+    append_entry('2025-06-02', 'libur', '😄')
+    assert len(search_stories('kerja')) == 1
+    save_entries([{"date": '2025-06-03', "story": 'kerja baru', "mood": '😄'}])
+    assert _stories(search_stories('kerja')) == ['kerja baru']
+    assert latest_entry()['story'] == 'kerja baru'
+
+
+# Index samping data.jsonl.off yang tertinggal dari journal lama (inode sama,
+# file baru lebih besar) tidak boleh dipakai
+def test_stale_offset_index_is_rebuilt(storage):
+    for n in range(20):
+        append_entry(f'2025-06-{n + 1:02d}', f'cerita {n}', '😄')
+    assert latest_entry()['story'] == 'cerita 19'
+    mood_mmap.save_readers()
+    with open(mood_mmap.OFFSET_INDEX_FILE, 'rb') as f:
+        stale = f.read()
+    for reader in mood_mmap._readers.values():
+        reader.close()
+    mood_mmap._readers.clear()
+
+    with open('data.jsonl', 'w', encoding='utf-8') as f:
+        for n in range(3):
+            f.write(json.dumps({"date": f'2025-07-0{n + 1}', "story": 'x' * 400, "mood": '😄'}) + '\n')
+    with open(mood_mmap.OFFSET_INDEX_FILE, 'wb') as f:
+        f.write(stale)
+    mood_storage.clear_cache()
+    assert latest_entry()['date'] == '2025-07-03'
+    assert len(entries_between('2025-07-01', '2025-07-31')) == 3
+
+
+# Ditulis ulang di tempat dengan ukuran sama, hanya bagian tengah yang beda
+# (awal dan akhir file tetap): offset lama tidak boleh dipakai
+def test_same_size_rewrite_of_the_middle_rebuilds_reader(storage):
+    stories = ['awal', 'aaaa', 'bbbb', 'cccc', 'akhir']
+    for n, story in enumerate(stories):
+        append_entry(f'2025-06-0{n + 1}', story + ' ' + 'x' * 300, '😄')
+    assert len(entries_between('2025-06-01', '2025-06-30')) == 5
+    with open('data.jsonl', 'rb') as f:
+        lines = f.readlines()
+    # Dua entri tengah ditukar dan panjang ceritanya digeser satu karakter
+    # dari yang satu ke yang lain: ukuran file sama, offset baris berubah
+    a = json.loads(lines[1]); b = json.loads(lines[3])
+    a['story'] += 'y'
+    b['story'] = b['story'][:-1]
+    lines[1], lines[3] = (json.dumps(b) + '\n').encode(), (json.dumps(a) + '\n').encode()
+    size = sum(map(len, lines))
+    with open('data.jsonl', 'r+b') as f:
+        f.write(b''.join(lines))
+    assert os.path.getsize('data.jsonl') == size
+    result = entries_between('2025-06-01', '2025-06-30')
+    assert sorted(e['story'][:4] for e in result) == sorted(s[:4] for s in stories)
+
+
+# Mode sharded: EntryRange hanya menyimpan jumlah per shard dan membaca satu
+# shard sekaligus, tapi hasilnya sama dengan pemindaian penuh
+def test_sharded_entry_range_pages_across_shards(storage):
+    storage('sharded')
+    mood_storage.append_entries([{"date": f'2025-{m:02d}-{d:02d}', "story": f'{m}/{d}', "mood": '😄'}
+                                 for m in (3, 1, 2, 4) for d in (28, 1, 15, 15)])
+    expected = scan_between('2025-01-10', '2025-04-10')
+    entries = EntryRange('2025-01-10', '2025-04-10')
+    assert len(entries) == len(expected) == 12
+    assert [m for m, _ in entries._shards] == ['2025-01', '2025-02', '2025-03', '2025-04']
+    assert entries.rows(0, 100) == expected
+    assert entries.rows(2, 7) == expected[2:7]
+    assert list(entries) == expected
+    assert entries._loaded[0] == '2025-04'
+    assert len(EntryRange('2025-05-01')) == 0
+
+
+
+# Index kata mode journal disimpan ke INDEX_FILE dan dipakai lagi oleh proses
+# berikutnya; hanya entri baru yang di-index. Snapshot untuk isi journal yang
+# sudah ditulis ulang (file baru, atau di tempat dengan ukuran sama) dibuang.
+def test_word_index_snapshot_is_reused_until_rewrite(storage, other_process, monkeypatch):
+    import mood_index
+    for n, word in enumerate(['kerja', 'libur', 'kerjasama', 'rapat']):
+        append_entry(f'2025-06-0{n + 1}', f'{word} ' + 'x' * 200, '😄')
+    assert _stories(search_words('kerj'))[0].startswith('kerja ')
+    mood_index.save_word_index()
+    assert os.path.exists(mood_index.INDEX_FILE)
+    other_process("mood_storage.append_entry('2025-06-09', 'kerja malam', '😄')")
+
+    indexed = []
+    original = mood_index.WordIndex.index_entry
+    monkeypatch.setattr(mood_index.WordIndex, 'index_entry',
+                        lambda self, i, e: (indexed.append(e['story']), original(self, i, e)))
+    mood_index._indexes.clear()
+    assert len(search_words('kerj')) == 3
+    assert indexed == ['kerja malam']
+    mood_index.save_word_index()
+
+    # Ditulis ulang di tempat: ukuran, awal dan akhir file sama, kata di tengah beda
+    with open('data.jsonl', 'rb') as f:
+        data = f.read()
+    st = os.stat('data.jsonl')
+    with open('data.jsonl', 'r+b') as f:
+        f.write(data.replace(b'libur', b'kerjx'))
+    os.utime('data.jsonl', ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+    mood_index._indexes.clear()
+    indexed.clear()
+    assert len(search_words('kerj')) == 4
+    assert len(indexed) == 5
+
+    other_process("mood_storage.save_entries([e for e in mood_storage.load_entries()"
+                  " if 'rapat' not in e['story']])")
+    mood_index._indexes.clear()
+    assert search_words('rapat') == []
+    assert len(search_words('kerj')) == 4
+
+
+# Data ditulis ulang (proses lain) setelah EntryRange dibuat: rows() tidak
+# boleh mengembalikan entri dari id/posisi lama, dan reopen() membaca ulang
+@pytest.mark.parametrize('mode', ['journal', 'json', 'sqlite', 'sharded'])
+def test_entry_range_detects_rewritten_source(storage, other_process, mode):
+    from mood_index import StaleRangeError
+    storage(mode)
+    mood_storage.append_entries([{"date": f'2025-06-{d:02d}', "story": f'hari {d}', "mood": '😄'}
+                                 for d in range(1, 11)])
+    entries = EntryRange('2025-06-01', '2025-06-30')
+    assert len(entries) == 10
+    other_process("mood_storage.save_entries([e for e in mood_storage.load_entries()"
+                  " if e['date'] < '2025-06-04'])")
+    with pytest.raises(StaleRangeError):
+        entries.rows(0, 10)
+    entries = entries.reopen()
+    assert _stories(entries.rows(0, 10)) == ['hari 1', 'hari 2', 'hari 3']
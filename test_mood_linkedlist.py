@@ -0,0 +1,79 @@
+import random
+
+from mood_linkedlist import MoodLinkedList
+
+
+def _entry(day, story):
+    return {"date": f'2025-06-{day:02d}', "story": story, "mood": '😄'}
+
+
+# Timsort atas node: urut tanggal, entri bertanggal sama tetap urutan masuk
+def test_sort_by_date_is_stable():
+    rng = random.Random(4)
+    entries = [_entry(rng.randint(1, 5), f'cerita {n}') for n in range(200)]
+    mood_list = MoodLinkedList.from_iterable(entries)
+    assert not mood_list.is_sorted
+    mood_list.sort_by_date()
+    assert mood_list.to_list() == sorted(entries, key=lambda e: e['date'])
+    assert mood_list.is_sorted and len(mood_list) == 200
+
+# Setelah disambung ulang, tail menunjuk ke node terakhir: append berikutnya
+# tidak memutus list
+def test_sort_relinks_tail():
+    mood_list = MoodLinkedList.from_iterable([_entry(3, 'c'), _entry(1, 'a'), _entry(2, 'b')])
+    mood_list.sort_by_date()
+    assert mood_list.tail.data['story'] == 'c' and mood_list.tail.next is None
+    mood_list.append(_entry(4, 'd'))
+    assert [e['story'] for e in mood_list] == ['a', 'b', 'c', 'd']
+
+def test_sort_of_sorted_or_empty_list_is_a_no_op():
+    MoodLinkedList().sort_by_date()
+    entries = [_entry(1, 'a'), _entry(1, 'b'), _entry(2, 'c')]
+    mood_list = MoodLinkedList.from_iterable(entries)
+    head = mood_list.head
+    mood_list.sort_by_date()
+    assert mood_list.head is head and mood_list.to_list() == entries
+
+def test_search_by_keyword():
+    mood_list = MoodLinkedList.from_iterable([_entry(1, 'Kerja keras'), _entry(2, 'libur'), _entry(3, 'kerja')])
+    result = mood_list.search_by_keyword('KERJA')
+    assert [e['story'] for e in result] == ['Kerja keras', 'kerja'] and result.is_sorted
+
+
+# is_sorted mengikuti isi list: hanya entri bertanggal mundur yang membuatnya False
+def test_is_sorted_tracks_appends():
+    mood_list = MoodLinkedList()
+    mood_list.append(_entry(1, 'a'))
+    mood_list.extend([_entry(1, 'b'), _entry(3, 'c')])
+    assert mood_list.is_sorted
+    mood_list.extend([_entry(2, 'd')])
+    assert not mood_list.is_sorted
+    mood_list.clear()
+    assert mood_list.is_sorted and mood_list.to_list() == []
+    mood_list.append(_entry(5, 'e'))
+    mood_list.append(_entry(4, 'f'))
+    assert not mood_list.is_sorted
+
+# Sisip sesuai tanggal: di kepala, di tengah (setelah entri bertanggal sama),
+# di ekor; list yang belum urut diurutkan dulu
+def test_insert_sorted():
+    mood_list = MoodLinkedList.from_iterable([_entry(3, 'c'), _entry(1, 'a')])
+    mood_list.insert_sorted(_entry(2, 'b'))
+    assert [e['story'] for e in mood_list] == ['a', 'b', 'c']
+    mood_list.insert_sorted(_entry(2, 'b2'))
+    mood_list.insert_sorted(_entry(1, 'a2'))
+    mood_list.insert_sorted(_entry(9, 'z'))
+    assert [e['story'] for e in mood_list] == ['a', 'a2', 'b', 'b2', 'c', 'z']
+    assert mood_list.is_sorted and len(mood_list) == 6 and mood_list.tail.data['story'] == 'z'
+
+    empty = MoodLinkedList()
+    empty.insert_sorted(_entry(2, 'x'))
+    empty.insert_sorted(_entry(1, 'y'))
+    assert [e['story'] for e in empty] == ['y', 'x'] and empty.head.next is empty.tail
+
+# Entri ringkas (mood_compact.MoodEntry) memakai ordinal yang sudah ada
+def test_compact_entries():
+    from mood_compact import MoodEntry
+    mood_list = MoodLinkedList.from_iterable([MoodEntry.from_dict(_entry(2, 'b'))])
+    mood_list.insert_sorted(MoodEntry.from_dict(_entry(1, 'a')))
+    assert [e['date'] for e in mood_list] == ['2025-06-01', '2025-06-02']
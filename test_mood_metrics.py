@@ -0,0 +1,61 @@
+import json
+import os
+import subprocess
+import sys
+
+import mood_metrics
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_histogram_buckets_and_prometheus(tmp_path):
+    mood_metrics.reset()
+    for seconds in (0.0005, 0.003, 0.003, 20.0):
+        mood_metrics.observe('uji', seconds)
+    h = mood_metrics.snapshot()['uji']
+    assert h["count"] == 4 and h["min"] == 0.0005 and h["max"] == 20.0
+    assert h["buckets"]["0.001"] == 1 and h["buckets"]["0.005"] == 2 and h["buckets"]["+Inf"] == 1
+    text = mood_metrics.to_prometheus()
+    assert 'moodtracker_operation_seconds_bucket{operation="uji",le="+Inf"} 4' in text
+    path = mood_metrics.dump(str(tmp_path / 'm.json'))
+    with open(path, encoding='utf-8') as f:
+        assert json.load(f)['uji']['count'] == 4
+    mood_metrics.reset()
+
+
+# SIGUSR1 yang datang saat thread utama berada di dalam observe() (memegang
+# _lock) tidak boleh membuat proses macet; dump ditulis setelah lock dilepas
+def test_sigusr1_while_lock_is_held_does_not_deadlock(tmp_path):
+    out = tmp_path / 'metrics.json'
+    code = (
+        "import os, signal, time, mood_metrics\n"
+        "mood_metrics.observe('uji', 0.01)\n"
+        "with mood_metrics._lock:\n"
+        "    os.kill(os.getpid(), signal.SIGUSR1)\n"
+        "    time.sleep(0.2)\n"
+        "for _ in range(100):\n"
+        "    if os.path.exists(os.environ['MOODTRACKER_METRICS']):\n"
+        "        break\n"
+        "    time.sleep(0.05)\n"
+        "print(open(os.environ['MOODTRACKER_METRICS']).read())\n"
+        "os._exit(0)\n"
+    )
+    env = dict(os.environ, MOODTRACKER_METRICS=str(out),
+               PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get('PYTHONPATH')])))
+    result = subprocess.run([sys.executable, '-c', code], cwd=tmp_path, env=env,
+                            capture_output=True, text=True, timeout=20)
+    assert result.returncode == 0, result.stderr
+    assert json.loads(result.stdout)['uji']['count'] == 1
+
+
+# Waktu yang dicatat adalah pembacaan/penulisan penyimpanan yang sebenarnya
+def test_storage_paths_are_timed(storage):
+    import mood_index
+    import mood_storage
+    mood_metrics.reset()
+    mood_storage.append_entry('2025-06-01', 'kerja', '😄')
+    mood_storage.load_entries()
+    mood_index.search_stories('kerja')
+    mood_index.EntryRange('2025-06-01', '2025-06-30')
+    assert {'append_entry', 'load_storage', 'load_index', 'load_reader'} <= set(mood_metrics.snapshot())
+    mood_metrics.reset()
@@ -0,0 +1,175 @@
+import json
+import os
+import sqlite3
+
+import pytest
+
+import mood_storage
+from mood_storage import append_entry, load_entries, load_history, save_entries
+
+
+def _line(date, story, mood='😄'):
+    return (json.dumps({"date": date, "story": story, "mood": mood}) + '\n').encode('utf-8')
+
+
+# ---------- Validasi ----------
+
+def test_invalid_date_is_rejected_before_writing(storage):
+    append_entry('2025-06-01', 'satu', '😄')
+    with pytest.raises(ValueError):
+        append_entry('10/06/2025', 'dua', '😄')
+    with pytest.raises(ValueError):
+        mood_storage.append_entries([{"date": '2025-06-02', "story": 'a', "mood": '😄'},
+                                     {"date": 'kemarin', "story": 'b', "mood": '😄'}])
+    mood_storage.clear_cache()
+    assert [e['story'] for e in load_history()] == ['satu']
+
+# Baris terpotong (program mati saat menulis) tidak boleh menelan entri berikutnya
+@pytest.mark.parametrize('mode', ['journal', 'sharded'])
+def test_append_after_torn_line_is_kept(storage, mode):
+    storage(mode)
+    append_entry('2025-06-01', 'satu', '😄')
+    path = 'data.jsonl' if mode == 'journal' else mood_storage.shard_path('2025-06')
+    with open(path, 'ab') as f:
+        f.write(_line('2025-06-02', 'dua')[:20])
+    append_entry('2025-06-03', 'tiga', '😄')
+    mood_storage.append_entries([{"date": '2025-06-04', "story": 'empat', "mood": '😄'}])
+    mood_storage.clear_cache()
+    assert [e['story'] for e in load_entries()] == ['satu', 'tiga', 'empat']
+
+
+# Tanggal tanpa nol di depan disimpan sebagai ISO: rentang dan entri terbaru
+# sama di semua mode (SQLite membandingkan tanggal sebagai teks)
+@pytest.mark.parametrize('mode', ['journal', 'json', 'sqlite', 'sharded'])
+def test_unpadded_dates_are_stored_as_iso(storage, mode):
+    from mood_index import entries_between, latest_entry
+    storage(mode)
+    append_entry('2025-6-5', 'lima', '😄')
+    append_entry('2025-06-10', 'sepuluh', '😄')
+    mood_storage.append_entries([{"date": '2025-6-7', "story": 'tujuh', "mood": '😄'}])
+    mood_storage.clear_cache()
+    assert [e['date'] for e in load_history()] == ['2025-06-05', '2025-06-07', '2025-06-10']
+    assert len(entries_between('2025-06-01', '2025-06-30')) == 3
+    assert latest_entry()['story'] == 'sepuluh'
+
+def test_sqlite_upgrade_normalises_old_dates(storage):
+    conn = sqlite3.connect('data.db')
+    conn.execute("CREATE TABLE entries (id INTEGER PRIMARY KEY, date TEXT NOT NULL,"
+                 " story TEXT NOT NULL, mood TEXT NOT NULL)")
+    conn.executemany("INSERT INTO entries(date, story, mood) VALUES (?, ?, ?)",
+                     [('2025-6-5', 'lima', '😄'), ('2025-06-10', 'sepuluh', '😄')])
+    conn.execute("PRAGMA user_version = 1")
+    conn.commit()
+    conn.close()
+    storage('sqlite')
+    assert [e['date'] for e in load_history()] == ['2025-06-05', '2025-06-10']
+    assert len(mood_storage.sqlite_between(mood_storage.connect_sqlite(), '2025-06-01', '2025-06-30')) == 2
+
+
+# ---------- Migrasi ----------
+
+def test_sqlite_migrates_journal_once(storage):
+    with open('data.jsonl', 'wb') as f:
+        f.write(_line('2025-06-01', 'satu') + _line('2025-06-02', 'dua'))
+    storage('sqlite')
+    assert len(load_entries()) == 2
+    save_entries([])
+    mood_storage.close_sqlite()
+    mood_storage.clear_cache()
+    # Tabel kosong setelah semua entri dihapus tidak diisi ulang dari data.jsonl
+    assert load_entries() == []
+
+def test_sqlite_other_database_is_not_migrated(storage):
+    with open('data.jsonl', 'wb') as f:
+        f.write(_line('2025-06-01', 'satu'))
+    conn = mood_storage.connect_sqlite('lain.db')
+    assert conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0] == 0
+
+def test_sqlite_failed_rewrite_keeps_old_rows(storage):
+    storage('sqlite')
+    append_entry('2025-06-01', 'satu', '😄')
+    with pytest.raises(Exception):
+        save_entries([{"date": '2025-06-02', "story": None, "mood": '😄'}])
+    mood_storage.clear_cache()
+    assert [e['story'] for e in load_entries()] == ['satu']
+
+def test_sharded_migration_does_not_return_after_delete(storage):
+    with open('data.jsonl', 'wb') as f:
+        f.write(_line('2025-05-31', 'mei') + _line('2025-06-01', 'juni'))
+    storage('sharded')
+    assert len(load_entries()) == 2
+    assert mood_storage.list_shards() == ['2025-05', '2025-06']
+    save_entries([])
+    mood_storage.clear_cache()
+    assert load_entries() == []
+
+
+# ---------- Cache journal ----------
+
+def test_partial_last_line_is_read_once_complete(storage):
+    append_entry('2025-06-01', 'satu', '😄')
+    assert len(load_entries()) == 1
+    line = _line('2025-06-02', 'dua')
+    with open('data.jsonl', 'ab') as f:
+        f.write(line[:-1])   # proses lain belum selesai menulis
+    assert len(load_entries()) == 1
+    with open('data.jsonl', 'ab') as f:
+        f.write(b'\n')
+    assert [e['story'] for e in load_entries()] == ['satu', 'dua']
+    append_entry('2025-06-03', 'tiga', '😄')
+    assert [e['story'] for e in load_entries()] == ['satu', 'dua', 'tiga']
+    assert mood_storage._cache["end"] == os.path.getsize('data.jsonl')
+
+def test_append_from_other_process_is_tail_read(storage, other_process):
+    append_entry('2025-06-02', 'satu', '😄')
+    load_entries()
+    other_process("mood_storage.append_entry('2025-06-01', 'dua', '😄')")
+    assert [e['story'] for e in load_entries()] == ['satu', 'dua']
+    assert [e['story'] for e in load_history()] == ['dua', 'satu']
+    append_entry('2025-06-03', 'tiga', '😄')
+    mood_storage.clear_cache()
+    assert [e['story'] for e in load_entries()] == ['satu', 'dua', 'tiga']
+
+def test_rewrite_in_place_is_not_read_as_append(storage):
+    for n in range(5):
+        append_entry(f'2025-06-0{n + 1}', f'lama {n}', '😄')
+    load_entries()
+    # Ditulis ulang di inode yang sama dan lebih panjang dari sebelumnya
+    with open('data.jsonl', 'wb') as f:
+        f.write(_line('2025-07-01', 'baru ' + 'x' * 500) + _line('2025-07-02', 'baru lagi'))
+    assert [e['date'] for e in load_entries()] == ['2025-07-01', '2025-07-02']
+
+
+# Proses lain (misalnya mood_api) menulis tepat setelah tulisan kita, sebelum
+# cache diperbarui: entrinya harus tetap terbaca di refresh berikutnya
+@pytest.mark.parametrize('mode', ['journal', 'sharded', 'sqlite'])
+def test_write_right_after_ours_is_seen(storage, monkeypatch, mode):
+    storage(mode)
+    append_entry('2025-06-01', 'satu', '😄')
+    load_entries()
+
+    name = {'journal': 'append_journal', 'sharded': '_write_manifest', 'sqlite': '_sqlite_insert_many'}[mode]
+    original = getattr(mood_storage, name)
+
+    def other_writer():
+        if mode == 'sqlite':
+            conn = sqlite3.connect('data.db')
+            with conn:
+                conn.execute("INSERT INTO entries(date, story, mood) VALUES ('2025-06-02', 'dua', '😄')")
+            conn.close()
+        elif mode == 'sharded':
+            monkeypatch.setattr(mood_storage, name, original)
+            mood_storage.append_shards([{"date": '2025-06-02', "story": 'dua', "mood": '😄'}])
+        else:
+            with open('data.jsonl', 'ab') as f:
+                f.write(_line('2025-06-02', 'dua'))
+
+    def write_then_other(*args, **kwargs):
+        result = original(*args, **kwargs)
+        other_writer()
+        return result
+
+    monkeypatch.setattr(mood_storage, name, write_then_other)
+    append_entry('2025-06-03', 'tiga', '😄')
+    monkeypatch.setattr(mood_storage, name, original)
+    assert sorted(e['story'] for e in load_entries()) == ['dua', 'satu', 'tiga']
@@ -0,0 +1,36 @@
+import json
+import os
+import subprocess
+import sys
+
+from mood_workload import DEFAULT_END, WORKLOAD_FILE, generate_workload
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def _read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+# Seed yang sama menghasilkan file yang sama; tanggal akhir bawaan tetap
+# (bukan hari ini) dan dicatat bersama parameter lain
+def test_same_seed_same_files(tmp_path):
+    a = generate_workload(str(tmp_path / 'a'), 2, 30, ("journal",), seed=7)
+    b = generate_workload(str(tmp_path / 'b'), 2, 30, ("journal",), seed=7)
+    assert [_read(p) for p, _ in a] == [_read(p) for p, _ in b]
+    with open(a[0][0], encoding='utf-8') as f:
+        dates = [json.loads(line)['date'] for line in f]
+    assert dates and max(dates) <= DEFAULT_END.isoformat() and dates == sorted(dates)
+    with open(tmp_path / 'a' / WORKLOAD_FILE, encoding='utf-8') as f:
+        params = json.load(f)
+    assert params["end"] == DEFAULT_END.isoformat() and params["seed"] == 7 and params["days"] == 30
+
+def test_cli_records_end(tmp_path):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get('PYTHONPATH')])))
+    result = subprocess.run([sys.executable, os.path.join(ROOT, 'mood_workload.py'), '--out', 'w',
+                             '--days', '10', '--end', '2024-02-29'],
+                            cwd=tmp_path, env=env, capture_output=True, text=True, check=True)
+    assert '2024-02-29' in result.stdout
+    with open(tmp_path / 'w' / WORKLOAD_FILE, encoding='utf-8') as f:
+        assert json.load(f)["end"] == '2024-02-29'
@@ -0,0 +1,77 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import moodtracker
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def _json_lines(text):
+    return [json.loads(line) for line in text.splitlines()]
+
+
+def test_add_list_stats_search(storage, capsys):
+    moodtracker.main(['add', 'kerja lembur', '😩', '--date', '2025-06-02'])
+    moodtracker.main(['add', 'libur, pantai', '😄', '--date', '2025-06-01'])
+    moodtracker.main(['add', 'kerja santai', '😄', '--date', '2025-06-03'])
+    capsys.readouterr()
+
+    moodtracker.main(['list', '--from', '2025-06-02', '--json'])
+    assert [e['story'] for e in _json_lines(capsys.readouterr().out)] == ['kerja lembur', 'kerja santai']
+
+    moodtracker.main(['stats', '--json'])
+    stats = json.loads(capsys.readouterr().out)
+    assert stats["total"] == 3 and stats["counts"] == {'😄': 2, '😩': 1} and stats["most_common"] == '😄'
+
+    moodtracker.main(['search', 'KERJA', '--json'])
+    assert len(_json_lines(capsys.readouterr().out)) == 2
+    moodtracker.main(['search', 'ker sant', '--words', '--json'])
+    assert [e['story'] for e in _json_lines(capsys.readouterr().out)] == ['kerja santai']
+    moodtracker.main(['search', 'gunung'])
+    assert capsys.readouterr().err == "Tidak ditemukan.\n"
+
+
+def test_invalid_input_exits_without_writing(storage, capsys):
+    with pytest.raises(SystemExit) as exc:
+        moodtracker.main(['add', 'cerita', 'bukan-emoji'])
+    assert 'tidak dikenal' in str(exc.value.code)
+    with pytest.raises(SystemExit) as exc:
+        moodtracker.main(['list', '--from', '01-06-2025'])
+    assert exc.value.code == 2
+    assert 'YYYY-MM-DD' in capsys.readouterr().err
+    assert not os.path.exists('data.jsonl') or os.path.getsize('data.jsonl') == 0
+
+
+def test_export_to_stdout(storage, capsys):
+    moodtracker.main(['add', 'satu, dua', '😄', '--date', '2025-06-01'])
+    capsys.readouterr()
+    moodtracker.main(['export', '-'])
+    out = capsys.readouterr()
+    assert out.out.splitlines() == ['Tanggal,Mood,Cerita', '2025-06-01,😄,"satu, dua"']
+    assert out.err == "1 entri diekspor\n"
+
+
+# Baris perintah tidak boleh memuat tkinter/PIL (cron job tanpa display)
+def test_cli_does_not_import_gui_modules(tmp_path):
+    code = ("import sys, moodtracker\n"
+            "moodtracker.main(['stats'])\n"
+            "print(sorted(m for m in ('tkinter', 'tkcalendar', 'PIL') if m in sys.modules))")
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get('PYTHONPATH')])))
+    result = subprocess.run([sys.executable, '-c', code], cwd=tmp_path, env=env,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.splitlines()[-1] == '[]'
+
+
+def test_days_is_capped_and_validated(storage, capsys):
+    moodtracker.main(['add', 'lama', '😄', '--date', '1999-01-01'])
+    moodtracker.main(['add', 'baru', '😄', '--date', '2025-06-01'])
+    capsys.readouterr()
+    moodtracker.main(['list', '--days', '99999999', '--json'])
+    assert [e['story'] for e in _json_lines(capsys.readouterr().out)] == ['lama', 'baru']
+    with pytest.raises(SystemExit) as exc:
+        moodtracker.main(['stats', '--days', '-3'])
+    assert exc.value.code == 2 and 'jumlah hari' in capsys.readouterr().err
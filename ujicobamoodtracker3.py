@@ -1,94 +1,15 @@
 import tkinter as tk
 from tkinter import messagebox, simpledialog
-import json
 from datetime import datetime
+from mood_index import search_stories, window_start, latest_entry, mood_summary
+from mood_storage import append_entry
+from mood_metrics import timed
+from mood_worker import TkWorker, loading_label
 
-DATA_FILE = 'data.json'
-
-# Node untuk LinkedList
-class Node:
-    def __init__(self, data):
-        self.data = data
-        self.next = None
-
-# LinkedList untuk menyimpan data mood
-class MoodLinkedList:
-    def __init__(self):
-        self.head = None
-        self.size = 0
-    
-    def append(self, data):
-        new_node = Node(data)
-        if not self.head:
-            self.head = new_node
-        else:
-            current = self.head
-            while current.next:
-                current = current.next
-            current.next = new_node
-        self.size += 1
-    
-    def to_list(self):
-        result = []
-        current = self.head
-        while current:
-            result.append(current.data)
-            current = current.next
-        return result
-    
-    def sort_by_date(self):
-        # Convert to list for sorting
-        data_list = self.to_list()
-        # Bubble sort based on date
-        n = len(data_list)
-        for i in range(n):
-            for j in range(0, n-i-1):
-                date1 = datetime.strptime(data_list[j]['date'], "%Y-%m-%d")
-                date2 = datetime.strptime(data_list[j+1]['date'], "%Y-%m-%d")
-                if date1 > date2:
-                    data_list[j], data_list[j+1] = data_list[j+1], data_list[j]
-        
-        # Rebuild the linked list
-        self.head = None
-        self.size = 0
-        for item in data_list:
-            self.append(item)
-    
-    def search_by_keyword(self, keyword):
-        results = MoodLinkedList()
-        current = self.head
-        while current:
-            if keyword.lower() in current.data['story'].lower():
-                results.append(current.data)
-            current = current.next
-        return results
-
-# Fungsi untuk membaca data dari file
-def load_data():
-    try:
-        with open(DATA_FILE, 'r') as f:
-            data = json.load(f)
-            mood_list = MoodLinkedList()
-            for item in data:
-                mood_list.append(item)
-            return mood_list
-    except:
-        return MoodLinkedList()
-
-# Fungsi untuk menyimpan data ke file
-def save_data(mood_list):
-    with open(DATA_FILE, 'w') as f:
-        json.dump(mood_list.to_list(), f, indent=2)
 
 # Tambah entri baru
 def add_entry(date, story, mood):
-    mood_list = load_data()
-    mood_list.append({
-        "date": date,
-        "story": story,
-        "mood": mood
-    })
-    save_data(mood_list)
+    append_entry(date, story, mood)
 
 # Kelas utama aplikasi GUI
 class MoodTrackerApp:
@@ -102,6 +23,7 @@ class MoodTrackerApp:
         self.text_color = "#5a3e36"
         
         self.root.configure(bg=self.bg_color)
+        self.worker = TkWorker(root)
         
         self.frame = tk.Frame(root, bg=self.bg_color, padx=30, pady=30)
         self.frame.pack()
@@ -178,15 +100,22 @@ class MoodTrackerApp:
             messagebox.showerror("Format salah", "Isi tanggal dengan benar (angka)")
             return
 
-        add_entry(date, story, mood)
-        messagebox.showinfo("Tersimpan", "Mood kamu sudah disimpan!")
+        def selesai(_):
+            messagebox.showinfo("Tersimpan", "Mood kamu sudah disimpan!")
+
+            # Kosongkan input
+            self.day_entry.delete(0, tk.END)
+            self.month_entry.delete(0, tk.END)
+            self.year_entry.delete(0, tk.END)
+            self.story_entry.delete(0, tk.END)
+            self.mood_var.set("")
+
+        # Simpan di thread worker supaya GUI tidak membeku
+        def gagal(error):
+            messagebox.showerror("Error", "Tanggal harus berformat YYYY-MM-DD."
+                                 if isinstance(error, ValueError) else f"Gagal menyimpan: {error}")
 
-        # Kosongkan input
-        self.day_entry.delete(0, tk.END)
-        self.month_entry.delete(0, tk.END)
-        self.year_entry.delete(0, tk.END)
-        self.story_entry.delete(0, tk.END)
-        self.mood_var.set("")
+        self.worker.submit(add_entry, date, story, mood, on_done=selesai, on_error=gagal)
 
     # Pilih tampilan riwayat: mingguan atau bulanan
     def show_history(self):
@@ -212,80 +141,77 @@ class MoodTrackerApp:
         top.title("Riwayat")
         top.configure(bg=self.bg_color)
 
+        loading = loading_label(top, bg=self.bg_color, fg=self.text_color)
         text_area = tk.Text(top, wrap=tk.WORD, width=60, height=25, 
                            bg="#fff9e6", fg=self.text_color)
         text_area.pack(pady=10, padx=10)
 
-        mood_list = load_data()
-        mood_list.sort_by_date()  # Sorting data sebelum ditampilkan
+        # Rekap 7 hari atau 30 hari terakhir (dari rekap mood, tanpa membaca
+        # entri), dihitung di thread worker supaya jendela tetap responsif
+        start = window_start(7 if mode == "week" else 30)
 
-        data = mood_list.to_list()
-        
-        mood_count = {mood: 0 for mood in self.mood_options}
-        stories = []
-
-        # Ambil data terakhir 7 hari atau 30 hari
-        if mode == "week":
-            filtered = data[-7:] if len(data) >= 7 else data
-        else:
-            filtered = data[-30:] if len(data) >= 30 else data
+        def muat():
+            return mood_summary(self.mood_options, start), latest_entry(start)
 
-        for entry in filtered:
-            mood_count[entry['mood']] += 1
-            stories.append(entry['story'])
+        @timed("populate_history")
+        def tampilkan(result):
+            loading.destroy()
+            stats, last = result
 
-        # Hitung total mood untuk perhitungan sorting
-        total_moods = sum(mood_count.values())
+            # Hitung total mood untuk perhitungan sorting
+            total_moods = stats["total"]
         
-        summary = "=== REKAPAN MOOD ===\n\n"
+            summary = "=== REKAPAN MOOD ===\n\n"
         
-        # Tampilkan deskripsi masing-masing emoji
-        summary += "Deskripsi Mood:\n"
-        for mood in self.mood_options:
-            summary += f"{mood}: {self.mood_descriptions[mood]}\n"
+            # Tampilkan deskripsi masing-masing emoji
+            summary += "Deskripsi Mood:\n"
+            for mood in self.mood_options:
+                summary += f"{mood}: {self.mood_descriptions[mood]}\n"
         
-        summary += "\n=== STATISTIK ===\n\n"
+            summary += "\n=== STATISTIK ===\n\n"
         
-        if filtered:
-            # Urutkan berdasarkan jumlah mood terbanyak
-            sorted_moods = sorted(mood_count.items(), key=lambda x: x[1], reverse=True)
+            if last:
+                # Urutkan berdasarkan jumlah mood terbanyak
+                sorted_moods = stats["sorted"]
             
-            # Tampilkan statistik mood
-            for mood, count in sorted_moods:
-                if total_moods > 0:
-                    percentage = (count / total_moods) * 100
-                    summary += f"{mood} : {count} kali ({percentage:.1f}%)\n"
-                else:
-                    summary += f"{mood} : 0 kali (0%)\n"
+                # Tampilkan statistik mood
+                for mood, count in sorted_moods:
+                    if total_moods > 0:
+                        percentage = (count / total_moods) * 100
+                        summary += f"{mood} : {count} kali ({percentage:.1f}%)\n"
+                    else:
+                        summary += f"{mood} : 0 kali (0%)\n"
             
-            # Tampilkan mood yang paling sering muncul
-            most_common_mood = sorted_moods[0][0]
-            summary += f"\nMood yang paling sering: {most_common_mood}\n"
+                # Tampilkan mood yang paling sering muncul
+                most_common_mood = sorted_moods[0][0]
+                summary += f"\nMood yang paling sering: {most_common_mood}\n"
             
-            # Berikan motivasi berdasarkan mood yang paling sering
-            motivation = self.get_motivation(most_common_mood)
-            summary += f"\n=== MOTIVASI ===\n\n{motivation}\n"
+                # Berikan motivasi berdasarkan mood yang paling sering
+                motivation = self.get_motivation(most_common_mood)
+                summary += f"\n=== MOTIVASI ===\n\n{motivation}\n"
             
-            summary += "\n=== CERITA TERAKHIR ===\n\n"
-            summary += f"{filtered[-1]['date']} - {filtered[-1]['mood']}:\n"
-            summary += f"{filtered[-1]['story']}\n"
-        else:
-            summary += "Belum ada data mood yang tersimpan.\n"
+                summary += "\n=== CERITA TERAKHIR ===\n\n"
+                summary += f"{last['date']} - {last['mood']}:\n"
+                summary += f"{last['story']}\n"
+            else:
+                summary += "Belum ada data mood yang tersimpan.\n"
+
+            text_area.insert(tk.END, summary)
+            text_area.config(state=tk.DISABLED)
 
-        text_area.insert(tk.END, summary)
-        text_area.config(state=tk.DISABLED)
+        self.worker.submit(muat, on_done=tampilkan, owner=top)
 
         # Frame untuk tombol
         button_frame = tk.Frame(top, bg=self.bg_color)
         button_frame.pack(pady=10)
 
-        # Tombol cari keyword
+        # Tombol cari keyword (pencarian berjalan di thread worker)
         def cari():
             keyword = simpledialog.askstring("Cari Cerita", "Masukkan keyword:")
-            if keyword:
-                result_list = mood_list.search_by_keyword(keyword)
-                result = result_list.to_list()
-                
+            if not keyword:
+                return
+
+            def tampilkan_hasil(result):
                 # Buat window baru untuk hasil pencarian
                 result_window = tk.Toplevel(top)
                 result_window.title("Hasil Pencarian")
@@ -308,6 +234,8 @@ class MoodTrackerApp:
                 tk.Button(result_window, text="Tutup", command=result_window.destroy, 
                          bg=self.button_color, fg=self.text_color).pack(pady=5)
 
+            self.worker.submit(search_stories, keyword, on_done=tampilkan_hasil, owner=top)
+
         tk.Button(button_frame, text="Cari Cerita", command=cari, 
                  bg=self.button_color, fg=self.text_color).pack(side=tk.LEFT, padx=5)
         tk.Button(button_frame, text="Tutup", command=top.destroy, 